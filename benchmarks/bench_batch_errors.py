@@ -0,0 +1,72 @@
+"""
+Compares draining the errors of a batch with get_batch_errors one error per page, as its
+defaults do, with iter_batch_errors, with and without prefetch, against a fake API that takes
+10 ms plus 0.4 ms per error to answer and a caller that spends 0.5 ms on every error.
+
+Run with `python benchmarks/bench_batch_errors.py` from the repository root.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tests.conftest import build_response  # noqa: E402
+from unofficial_shipengine.unofficial_shipengine import (  # noqa: E402
+    UnofficialShipEngine,
+)
+from unofficial_shipengine.unofficial_shipengine_config import (  # noqa: E402
+    UnofficialShipEngineConfig,
+)
+
+ERRORS = [
+    {"error": "Invalid postal code", "shipment_id": f"se-{i}"} for i in range(500)
+]
+LATENCY = 0.01
+LATENCY_PER_ERROR = 0.0004
+HANDLE = 0.0005
+
+
+def get(url, params):
+    page, pagesize = params["page"], params["pagesize"]
+    end = page * pagesize
+    start = end - pagesize
+    errors = ERRORS[start:end]
+    time.sleep(LATENCY + LATENCY_PER_ERROR * len(errors))
+    body = {"errors": errors, "pages": -(-len(ERRORS) // pagesize)}
+    return build_response(200, json.dumps(body).encode())
+
+
+def handle(error):
+    time.sleep(HANDLE)
+
+
+def main():
+    client = UnofficialShipEngine("api-key")
+    client.batches.session.get = get
+    thread_safe = UnofficialShipEngine(
+        UnofficialShipEngineConfig("api-key", thread_safe=True)
+    )
+    thread_safe.batches.session.get = get
+
+    start = time.perf_counter()
+    for page in range(1, len(ERRORS) + 1):
+        for error in client.batches.get_batch_errors("se-1", page=page)["errors"]:
+            handle(error)
+    print(f"get_batch_errors, 1 per page:    {time.perf_counter() - start:6.2f} s")
+
+    for name, service in [
+        ("iter_batch_errors:           ", client.batches),
+        ("iter_batch_errors, prefetch: ", thread_safe.batches),
+    ]:
+        start = time.perf_counter()
+        for error in service.iter_batch_errors("se-1"):
+            handle(error)
+        print(f"{name}    {time.perf_counter() - start:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
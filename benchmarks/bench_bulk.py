@@ -0,0 +1,59 @@
+"""
+Compares creating 20,000 shipments in one request with creating them in chunks of 100 sent from
+4 threads, against a fake API that takes 2 ms plus 0.1 ms per shipment to answer.
+
+Run with `python benchmarks/bench_bulk.py` from the repository root.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tests.conftest import build_response  # noqa: E402
+from tests.utils.test_serialize import make_shipment_request  # noqa: E402
+from unofficial_shipengine.unofficial_shipengine import (  # noqa: E402
+    UnofficialShipEngine,
+)
+from unofficial_shipengine.unofficial_shipengine_config import (  # noqa: E402
+    UnofficialShipEngineConfig,
+)
+
+SHIPMENTS = 20000
+LATENCY = 0.002
+PER_SHIPMENT = 0.0001
+
+
+def post(url, data):
+    count = data.count(b'"ship_to"')
+    time.sleep(LATENCY + count * PER_SHIPMENT)
+    body = {"shipments": [{"shipment_id": f"se-{i}"} for i in range(count)]}
+    return build_response(200, json.dumps(body).encode())
+
+
+def main():
+    client = UnofficialShipEngine(
+        UnofficialShipEngineConfig("api-key", thread_safe=True, sparse_payloads=True)
+    )
+    client.shipments.session.post = post
+    shipment_requests = [make_shipment_request() for _ in range(SHIPMENTS)]
+
+    start = time.perf_counter()
+    client.shipments.create_shipment(shipment_requests)
+    print(f"{'one request':28} {time.perf_counter() - start:8.3f} s")
+
+    for workers in (1, 4):
+        start = time.perf_counter()
+        results = client.shipments.create_shipments(
+            shipment_requests, chunk_size=100, max_workers=workers
+        )
+        assert all(result.ok for result in results)
+        name = f"chunks of 100, {workers} workers"
+        print(f"{name:28} {time.perf_counter() - start:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
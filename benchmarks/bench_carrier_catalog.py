@@ -0,0 +1,69 @@
+"""
+Compares finding the carrier_id of a service_code by calling get_carriers and scanning the
+services of every carrier, as callers had to, with the cached carrier catalog, against a fake
+API that takes 10 ms to answer.
+
+Run with `python benchmarks/bench_carrier_catalog.py` from the repository root.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tests.conftest import build_response, load_response  # noqa: E402
+from unofficial_shipengine.unofficial_shipengine import (  # noqa: E402
+    UnofficialShipEngine,
+)
+
+LOOKUPS = 200
+LATENCY = 0.01
+SERVICE_CODES = ["usps_priority_mail", "ups_ground", "ups_worldwide_express"]
+CARRIERS = load_response("carriers/vcr_cassettes/test_get_carriers.yaml", 0)
+
+
+def get(url):
+    time.sleep(LATENCY)
+    return build_response(200, json.dumps(CARRIERS).encode())
+
+
+def scan(carriers, service_code):
+    for carrier in carriers:
+        for service in carrier.services:
+            if service.service_code == service_code:
+                return carrier.carrier_id
+    return None
+
+
+def main():
+    client = UnofficialShipEngine("api-key")
+    client.carriers.session.get = get
+    codes = [SERVICE_CODES[i % len(SERVICE_CODES)] for i in range(LOOKUPS)]
+
+    start = time.perf_counter()
+    for code in codes:
+        scan(client.carriers.get_carriers(), code)
+    print(f"get_carriers + scan: {time.perf_counter() - start:8.4f} s")
+
+    start = time.perf_counter()
+    for code in codes:
+        client.carriers.get_catalog().get_carrier_id(code)
+    print(f"get_catalog:         {time.perf_counter() - start:8.4f} s")
+
+    carriers = client.carriers.get_carriers()
+    catalog = client.carriers.get_catalog()
+    for name, lookup in [
+        ("scan only, 100k:    ", lambda code: scan(carriers, code)),
+        ("index only, 100k:   ", catalog.get_carrier_id),
+    ]:
+        start = time.perf_counter()
+        for i in range(100000):
+            lookup(SERVICE_CODES[i % len(SERVICE_CODES)])
+        print(f"{name} {time.perf_counter() - start:8.4f} s")
+
+
+if __name__ == "__main__":
+    main()
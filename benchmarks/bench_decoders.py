@@ -0,0 +1,152 @@
+"""
+Compares the generated model decoders with the hand-written from_dict methods they replaced,
+decoding 1,000 recorded label and shipment responses, and lazy views that only read the few
+fields a label loop usually needs.
+
+Run with `python benchmarks/bench_decoders.py` from the repository root.
+"""
+
+import copy
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tests.utils.test_deserialize import load_response  # noqa: E402
+from unofficial_shipengine.core.common.models import (  # noqa: E402
+    Address,
+    Dimension,
+    Package,
+    Value,
+    Weight,
+)
+from unofficial_shipengine.core.labels.models import (  # noqa: E402
+    Label,
+    LabelDownload,
+    PackageLabel,
+)
+from unofficial_shipengine.core.shipments.models import (  # noqa: E402
+    AdvancedOptions,
+    Shipment,
+)
+from unofficial_shipengine.utils.deserialize import decode as decode_model  # noqa: E402
+
+RESPONSES = 1000
+ROUNDS = 10
+
+
+def legacy_package(cls, data):
+    weight = Weight(**data.pop("weight"))
+    dimensions = Dimension(**data.pop("dimensions"))
+    insured_value = Value(**data.pop("insured_value"))
+    label_messages = Package.LabelMessages(**data.pop("label_messages"))
+
+    return cls(
+        weight=weight,
+        dimensions=dimensions,
+        insured_value=insured_value,
+        label_messages=label_messages,
+        **data,
+    )
+
+
+def legacy_label(data):
+    form_download = data.pop("form_download", None)
+    paperless_download = data.pop("paperless_download", None)
+    label_download = LabelDownload(**data.pop("label_download"))
+    shipment_cost = Value(**data.pop("shipment_cost"))
+    insurance_cost = Value(**data.pop("insurance_cost"))
+    requested_comparison_amount = Value(**data.pop("requested_comparison_amount"))
+    packages = [legacy_package(PackageLabel, p) for p in data.pop("packages")]
+
+    return Label(
+        label_download=label_download,
+        form_download=form_download,
+        shipment_cost=shipment_cost,
+        insurance_cost=insurance_cost,
+        requested_comparison_amount=requested_comparison_amount,
+        paperless_download=paperless_download,
+        packages=packages,
+        **data,
+    )
+
+
+def legacy_shipment(data):
+    ship_to = Address(**data.pop("ship_to"))
+    ship_from = Address(**data.pop("ship_from"))
+    return_to = Address(**data.pop("return_to"))
+    packages = [legacy_package(Package, p) for p in data.pop("packages")]
+    total_weight = Weight(**data.pop("total_weight"))
+    advanced_options = AdvancedOptions(**data.pop("advanced_options"))
+
+    return Shipment(
+        ship_to=ship_to,
+        ship_from=ship_from,
+        advanced_options=advanced_options,
+        return_to=return_to,
+        packages=packages,
+        total_weight=total_weight,
+        **data,
+    )
+
+
+def read_label(label):
+    return label.tracking_number, label.label_download.pdf, label.status
+
+
+def read_shipment(shipment):
+    return shipment.shipment_id, shipment.shipment_status
+
+
+def measure(decode, response):
+    best = float("inf")
+
+    for _ in range(ROUNDS):
+        # The legacy decoders consume their input, so every round gets fresh copies.
+        responses = [copy.deepcopy(response) for _ in range(RESPONSES)]
+        start = time.perf_counter()
+        for data in responses:
+            decode(data)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    label = load_response("labels/vcr_cassettes/test_purchase_label_success.yaml", 1)
+    shipment = load_response("shipments/vcr_cassettes/test_get_by_id_success.yaml", 2)
+
+    for name, decode, response in [
+        ("labels, hand-written from_dict", legacy_label, label),
+        ("labels, generated decoder", Label.from_dict, label),
+        (
+            "labels, decoder + 3 reads",
+            lambda data: read_label(decode_model(Label, data)),
+            label,
+        ),
+        (
+            "labels, lazy view + 3 reads",
+            lambda data: read_label(decode_model(Label, data, lazy=True)),
+            label,
+        ),
+        ("shipments, hand-written from_dict", legacy_shipment, shipment),
+        ("shipments, generated decoder", Shipment.from_dict, shipment),
+        (
+            "shipments, decoder + 2 reads",
+            lambda data: read_shipment(decode_model(Shipment, data)),
+            shipment,
+        ),
+        (
+            "shipments, lazy view + 2 reads",
+            lambda data: read_shipment(decode_model(Shipment, data, lazy=True)),
+            shipment,
+        ),
+    ]:
+        seconds = measure(decode, response)
+        print(f"{name:36} {seconds * 1000:8.2f} ms per {RESPONSES} responses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Compares the generated model encoders with attrs.asdict on a 1,000 shipment payload, and
+the size and encoding time of sparse payloads.
+
+Run with `python benchmarks/bench_encoders.py` from the repository root.
+"""
+
+import json
+import sys
+import timeit
+from pathlib import Path
+
+from attrs import asdict
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tests.utils.test_serialize import make_shipment_request  # noqa: E402
+from unofficial_shipengine.utils.serialize import serializer, to_dict  # noqa: E402
+
+SHIPMENTS = 1000
+ROUNDS = 20
+
+
+def build_with_asdict(shipment_requests):
+    return [asdict(sr, value_serializer=serializer) for sr in shipment_requests]
+
+
+def build_with_encoders(shipment_requests):
+    return [to_dict(sr) for sr in shipment_requests]
+
+
+def encode_with_asdict(shipment_requests):
+    return json.dumps({"shipments": build_with_asdict(shipment_requests)})
+
+
+def encode_with_encoders(shipment_requests):
+    return json.dumps({"shipments": build_with_encoders(shipment_requests)})
+
+
+def encode_sparse(shipment_requests):
+    return json.dumps(
+        {"shipments": [to_dict(sr, sparse=True) for sr in shipment_requests]}
+    )
+
+
+def main():
+    shipment_requests = [make_shipment_request() for _ in range(SHIPMENTS)]
+    assert encode_with_asdict(shipment_requests) == encode_with_encoders(
+        shipment_requests
+    )
+
+    for name, encode in [
+        ("dicts, attrs.asdict", build_with_asdict),
+        ("dicts, generated encoders", build_with_encoders),
+        ("JSON, attrs.asdict", encode_with_asdict),
+        ("JSON, generated encoders", encode_with_encoders),
+        ("JSON, sparse encoders", encode_sparse),
+    ]:
+        seconds = min(
+            timeit.repeat(lambda: encode(shipment_requests), number=1, repeat=ROUNDS)
+        )
+        print(f"{name:28} {seconds * 1000:8.2f} ms per {SHIPMENTS} shipments")
+
+    for name, encode in [
+        ("body size, full", encode_with_encoders),
+        ("body size, sparse", encode_sparse),
+    ]:
+        size = len(encode(shipment_requests[:1]))
+        print(f"{name:28} {size:8} bytes per shipment")
+
+
+if __name__ == "__main__":
+    main()
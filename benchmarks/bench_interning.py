@@ -0,0 +1,67 @@
+"""
+Measures the memory held by 10,000 decoded shipments, with and without interning, when every
+shipment has its own ship_to address but ships from one of a dozen warehouses.
+
+Run with `python benchmarks/bench_interning.py` from the repository root.
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tests.utils.test_deserialize import load_response  # noqa: E402
+from unofficial_shipengine.core.shipments.models import Shipment  # noqa: E402
+from unofficial_shipengine.utils.deserialize import decode  # noqa: E402
+
+SHIPMENTS = 10000
+WAREHOUSES = 12
+
+
+def make_bodies():
+    shipment = load_response("shipments/vcr_cassettes/test_get_by_id_success.yaml", 2)
+    bodies = []
+
+    for i in range(SHIPMENTS):
+        warehouse = {**shipment["ship_from"], "name": f"Warehouse {i % WAREHOUSES}"}
+        ship_to = {**shipment["ship_to"], "name": f"Customer {i}"}
+        body = {
+            **shipment,
+            "shipment_id": f"se-{i}",
+            "ship_to": ship_to,
+            "ship_from": warehouse,
+            "return_to": warehouse,
+        }
+        bodies.append(json.dumps(body).encode())
+
+    return bodies
+
+
+def measure(bodies, intern):
+    gc.collect()
+    tracemalloc.start()
+
+    shipments = [decode(Shipment, json.loads(body), intern=intern) for body in bodies]
+
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del shipments
+    return size
+
+
+def main():
+    bodies = make_bodies()
+
+    for name, intern in [("eager decoder", False), ("interned", True)]:
+        size = measure(bodies, intern)
+        print(f"{name:16} {size / 2**20:8.2f} MiB held by {SHIPMENTS} shipments")
+
+
+if __name__ == "__main__":
+    main()
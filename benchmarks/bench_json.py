@@ -0,0 +1,85 @@
+"""
+Compares the JSON backends with the stdlib calls they replaced: encoding a bulk request of
+100 shipments, and parsing a recorded carrier catalog response.
+
+Run with `python benchmarks/bench_json.py` from the repository root.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tests.utils.test_deserialize import load_response  # noqa: E402
+from tests.utils.test_serialize import make_shipment_request  # noqa: E402
+from unofficial_shipengine.utils.json_backend import (  # noqa: E402
+    OrjsonBackend,
+    StdlibJSONBackend,
+)
+from unofficial_shipengine.utils.serialize import encode_value, to_dict  # noqa: E402
+
+SHIPMENTS = 100
+ROUNDS = 200
+
+
+def measure(fn):
+    best = float("inf")
+
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def make_response(body):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = body
+    return response
+
+
+def main():
+    shipment_requests = [make_shipment_request() for _ in range(SHIPMENTS)]
+    carriers = load_response("carriers/vcr_cassettes/test_get_carriers.yaml", 0)
+    body = json.dumps(carriers).encode()
+
+    def legacy_encode():
+        # requests encodes str bodies to bytes before sending them.
+        data = [to_dict(sr) for sr in shipment_requests]
+        json.dumps({"shipments": data}).encode()
+
+    def legacy_decode():
+        # response.text guesses the charset, as the API does not send one.
+        json.loads(make_response(body).text)
+
+    cases = [
+        ("encode shipments, json.dumps + encode", legacy_encode),
+        ("parse carriers, json.loads(response.text)", legacy_decode),
+    ]
+
+    for backend in (StdlibJSONBackend(), OrjsonBackend()):
+        name = type(backend).__name__
+
+        def encode(backend=backend):
+            backend.dumps(encode_value({"shipments": shipment_requests}))
+
+        def decode(backend=backend):
+            backend.loads(make_response(body).content)
+
+        cases.append((f"encode shipments, {name}", encode))
+        cases.append((f"parse carriers, {name}", decode))
+
+    for name, fn in sorted(cases, key=lambda case: case[0]):
+        print(f"{name:44} {measure(fn) * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compares fetching 500 known shipments one at a time with get_by_id against streaming them with
+list_shipments, against a fake API that takes 10 ms plus 0.2 ms per shipment to answer, and
+reports the peak memory of streaming 5000 shipments against loading them into a list.
+
+Run with `python benchmarks/bench_list.py` from the repository root.
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tests.conftest import build_response, load_response  # noqa: E402
+from unofficial_shipengine.unofficial_shipengine import (  # noqa: E402
+    UnofficialShipEngine,
+)
+from unofficial_shipengine.unofficial_shipengine_config import (  # noqa: E402
+    UnofficialShipEngineConfig,
+)
+
+SHIPMENT = load_response("shipments/vcr_cassettes/test_get_by_id_success.yaml", 2)
+LATENCY = 0.01
+LATENCY_PER_SHIPMENT = 0.0002
+
+
+def make_get(count, latency, latency_per_shipment):
+    def get(url, params=None):
+        if params is None:
+            time.sleep(latency)
+            return build_response(200, json.dumps(SHIPMENT).encode())
+
+        end = params["page"] * params["page_size"]
+        start = end - params["page_size"]
+        shipments = [
+            {**SHIPMENT, "shipment_id": f"se-{i}"}
+            for i in range(start, min(end, count))
+        ]
+        time.sleep(latency + latency_per_shipment * len(shipments))
+        body = {"shipments": shipments, "pages": -(-count // params["page_size"])}
+        return build_response(200, json.dumps(body).encode())
+
+    return get
+
+
+def main():
+    client = UnofficialShipEngine(
+        UnofficialShipEngineConfig("api-key", thread_safe=True)
+    )
+    client.shipments.session.get = make_get(500, LATENCY, LATENCY_PER_SHIPMENT)
+
+    start = time.perf_counter()
+    for i in range(500):
+        client.shipments.get_by_id(f"se-{i}")
+    print(f"get_by_id, one at a time: {time.perf_counter() - start:6.2f} s")
+
+    start = time.perf_counter()
+    for _ in client.shipments.list_shipments():
+        pass
+    print(f"list_shipments:           {time.perf_counter() - start:6.2f} s")
+
+    client.shipments.session.get = make_get(5000, 0.0, 0.0)
+    for name, consume in [
+        ("streamed", lambda it: sum(1 for _ in it)),
+        ("list()", list),
+    ]:
+        tracemalloc.start()
+        consume(client.shipments.list_shipments())
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"5000 shipments, {name:9} peak {peak / 2**20:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Compares 2,000 single-shipment create_shipment calls made from 32 threads with and without
+micro-batching, against a fake API that takes 20 ms plus 0.1 ms per shipment to answer and
+serves at most 8 requests of a client at once, like an API enforcing a rate limit.
+
+Run with `python benchmarks/bench_micro_batch.py` from the repository root.
+"""
+
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tests.conftest import build_response  # noqa: E402
+from tests.utils.test_serialize import make_shipment_request  # noqa: E402
+from unofficial_shipengine.unofficial_shipengine import (  # noqa: E402
+    UnofficialShipEngine,
+)
+from unofficial_shipengine.unofficial_shipengine_config import (  # noqa: E402
+    UnofficialShipEngineConfig,
+)
+
+CALLS = 2000
+THREADS = 32
+LATENCY = 0.02
+PER_SHIPMENT = 0.0001
+SERVER_CONCURRENCY = 8
+
+
+def measure(**options):
+    client = UnofficialShipEngine(
+        UnofficialShipEngineConfig("api-key", thread_safe=True, **options)
+    )
+    lock = threading.Lock()
+    server = threading.BoundedSemaphore(SERVER_CONCURRENCY)
+    posts = 0
+
+    def post(url, data):
+        nonlocal posts
+        count = data.count(b'"ship_to"')
+        with lock:
+            posts += 1
+        with server:
+            time.sleep(LATENCY + count * PER_SHIPMENT)
+        body = {"shipments": [{"shipment_id": f"se-{i}"} for i in range(count)]}
+        return build_response(200, json.dumps(body).encode())
+
+    client.shipments.session.post = post
+    shipment_requests = [make_shipment_request() for _ in range(CALLS)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(THREADS) as executor:
+        list(executor.map(client.shipments.create_shipment, shipment_requests))
+
+    return time.perf_counter() - start, posts
+
+
+def main():
+    cases = [
+        ("one request per call", {}),
+        ("micro_batch_size=32, 5 ms", {"micro_batch_size": 32}),
+    ]
+
+    for name, options in cases:
+        elapsed, posts = measure(**options)
+        print(f"{name:28} {elapsed:8.3f} s {posts:6} requests")
+
+
+if __name__ == "__main__":
+    main()
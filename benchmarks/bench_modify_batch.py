@@ -0,0 +1,55 @@
+"""
+Compares adding 30000 shipments to a batch in one request with add_to_batch's concurrent
+chunks, against a fake API that takes 5 ms plus 0.05 ms per shipment to answer.
+
+Run with `python benchmarks/bench_modify_batch.py` from the repository root.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tests.conftest import build_response  # noqa: E402
+from unofficial_shipengine.unofficial_shipengine import (  # noqa: E402
+    UnofficialShipEngine,
+)
+from unofficial_shipengine.unofficial_shipengine_config import (  # noqa: E402
+    UnofficialShipEngineConfig,
+)
+
+SHIPMENTS = [f"se-{i}" for i in range(30000)]
+LATENCY = 0.005
+LATENCY_PER_SHIPMENT = 0.00005
+
+
+def post(url, data):
+    time.sleep(LATENCY + LATENCY_PER_SHIPMENT * len(json.loads(data)["shipment_ids"]))
+    return build_response(204, b"")
+
+
+def main():
+    client = UnofficialShipEngine(
+        UnofficialShipEngineConfig("api-key", thread_safe=True, pool_maxsize=16)
+    )
+    client.batches.session.post = post
+
+    for name, chunk_size, max_workers in [
+        ("one request:        ", len(SHIPMENTS), 1),
+        ("chunks of 100, 1:   ", 100, 1),
+        ("chunks of 100, 4:   ", 100, 4),
+        ("chunks of 500, 8:   ", 500, 8),
+    ]:
+        start = time.perf_counter()
+        result = client.batches.add_to_batch(
+            "se-batch", SHIPMENTS, chunk_size=chunk_size, max_workers=max_workers
+        )
+        assert len(result.succeeded) == len(SHIPMENTS)
+        print(f"{name} {time.perf_counter() - start:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Compares fixed-interval polling with AdaptivePoller on simulated batches that process their
+shipments at a steady rate after sitting in the queue for a few seconds, counting the polls made and how late the completion is noticed.
+
+Run with `python benchmarks/bench_polling.py` from the repository root.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from unofficial_shipengine.utils.polling import AdaptivePoller  # noqa: E402
+
+# (shipments, shipments processed per second)
+BATCHES = [(100, 20.0), (1000, 20.0), (10000, 50.0)]
+QUEUED = 3.3
+
+
+def simulate(total, rate, next_delay):
+    duration = QUEUED + total / rate
+    now = 0.0
+    polls = 0
+
+    while True:
+        polls += 1
+        done = min(int(max(now - QUEUED, 0.0) * rate), total)
+        if now >= duration:
+            return polls, now - duration
+        now += next_delay(done, total)
+
+
+def main():
+    for total, rate in BATCHES:
+        cases = [
+            ("every 1 s", lambda done, total: 1.0),
+            ("every 5 s", lambda done, total: 5.0),
+        ]
+        clock = [0.0]
+        poller = AdaptivePoller(1.0, 30.0, lambda: clock[0])
+
+        def adaptive(done, total):
+            delay = poller.next_delay(done, total)
+            clock[0] += delay
+            return delay
+
+        cases.append(("adaptive, 1-30 s", adaptive))
+
+        for name, next_delay in cases:
+            polls, late = simulate(total, rate, next_delay)
+            print(
+                f"{total:6} shipments, {name:18} {polls:5} polls, "
+                f"noticed {late:5.2f} s late"
+            )
+
+
+if __name__ == "__main__":
+    main()
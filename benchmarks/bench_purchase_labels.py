@@ -0,0 +1,62 @@
+"""
+Compares buying 500 labels in a loop with purchase_labels, against a fake API that takes
+20 ms to answer a purchase.
+
+Run with `python benchmarks/bench_purchase_labels.py` from the repository root.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tests.conftest import build_response  # noqa: E402
+from tests.labels.test_purchase_labels import make_label_requests  # noqa: E402
+from tests.utils.test_serialize import make_shipment_request  # noqa: E402
+from unofficial_shipengine.unofficial_shipengine import (  # noqa: E402
+    UnofficialShipEngine,
+)
+from unofficial_shipengine.unofficial_shipengine_config import (  # noqa: E402
+    UnofficialShipEngineConfig,
+)
+from unofficial_shipengine.utils.checkpoint import InMemoryCheckpoint  # noqa: E402
+
+LABELS = 500
+LATENCY = 0.02
+
+
+def post(url, data):
+    time.sleep(LATENCY)
+    key = json.loads(data)["shipment"]["external_shipment_id"]
+    return build_response(200, json.dumps({"label_id": f"se-{key}"}).encode())
+
+
+def main():
+    client = UnofficialShipEngine(
+        UnofficialShipEngineConfig("api-key", thread_safe=True, pool_maxsize=16)
+    )
+    client.labels.session.post = post
+    label_requests = make_label_requests(make_shipment_request(), LABELS)
+
+    start = time.perf_counter()
+    for label_request in label_requests:
+        client.labels.purchase_label(label_request)
+    print(f"{'purchase_label loop':40} {time.perf_counter() - start:8.3f} s")
+
+    for workers, checkpoint in [(8, None), (16, None), (16, InMemoryCheckpoint())]:
+        start = time.perf_counter()
+        results = client.labels.purchase_labels(
+            label_requests, max_workers=workers, checkpoint=checkpoint
+        )
+        assert all(result.ok for result in results)
+        name = f"purchase_labels, {workers} workers"
+        if checkpoint is not None:
+            name += ", checkpoint"
+        print(f"{name:40} {time.perf_counter() - start:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Compares encoding the body of a bulk request of 100 shipments that only differ in their
+ship_to address and package weight, from full requests and from a request template.
+
+Run with `python benchmarks/bench_templates.py` from the repository root.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from attrs import evolve, fields
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tests.utils.test_serialize import make_shipment_request  # noqa: E402
+from unofficial_shipengine.core.common.models import Package, Weight  # noqa: E402
+from unofficial_shipengine.core.shipments.services import (  # noqa: E402
+    _encode_variants,
+)
+from unofficial_shipengine.utils.json_backend import (  # noqa: E402
+    OrjsonBackend,
+    StdlibJSONBackend,
+)
+from unofficial_shipengine.utils.serialize import encode_value  # noqa: E402
+from unofficial_shipengine.utils.templates import RequestTemplate  # noqa: E402
+
+SHIPMENTS = 100
+ROUNDS = 200
+
+
+def measure(fn):
+    best = float("inf")
+
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    shared = make_shipment_request()
+    variants = [
+        {
+            "ship_to": evolve(shared.ship_to, name=f"Customer {i}"),
+            "packages": [Package(weight=Weight(i + 1, Weight.Unit.OUNCE))],
+        }
+        for i in range(SHIPMENTS)
+    ]
+    shipment_requests = [evolve(shared, **variant) for variant in variants]
+    shared_fields = {
+        attribute.name: getattr(shared, attribute.name)
+        for attribute in fields(type(shared))
+        if attribute.name not in variants[0]
+    }
+
+    cases = []
+    for backend in (StdlibJSONBackend(), OrjsonBackend()):
+        name = type(backend).__name__
+
+        for sparse in (False, True):
+            template = RequestTemplate(type(shared), backend, sparse, **shared_fields)
+
+            def full(backend=backend, sparse=sparse):
+                backend.dumps(encode_value({"shipments": shipment_requests}, sparse))
+
+            def templated(template=template):
+                _encode_variants(template, variants)
+
+            suffix = ", sparse" if sparse else ""
+            cases.append((f"full requests, {name}{suffix}", full))
+            cases.append((f"template, {name}{suffix}", templated))
+
+    for name, fn in cases:
+        print(f"{name:44} {measure(fn) * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Compares resolving the ship_from warehouse of 500 shipments with get_by_id, with and without
+warehouse_cache, against a fake API that takes 10 ms to answer.
+
+Run with `python benchmarks/bench_warehouse_cache.py` from the repository root.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tests.conftest import build_response, load_response  # noqa: E402
+from unofficial_shipengine.unofficial_shipengine import (  # noqa: E402
+    UnofficialShipEngine,
+)
+from unofficial_shipengine.unofficial_shipengine_config import (  # noqa: E402
+    UnofficialShipEngineConfig,
+)
+
+SHIPMENTS = 500
+WAREHOUSES = ["se-1", "se-2", "se-3"]
+LATENCY = 0.01
+WAREHOUSE = load_response("warehouses/vcr_cassettes/test_get_by_id_success.yaml", 1)
+
+
+def get(url):
+    time.sleep(LATENCY)
+    warehouse = {**WAREHOUSE, "warehouse_id": url.rsplit("/", 1)[1]}
+    return build_response(200, json.dumps(warehouse).encode())
+
+
+def main():
+    for name, config in [
+        ("no cache:    ", UnofficialShipEngineConfig("api-key")),
+        ("cache:       ", UnofficialShipEngineConfig("api-key", warehouse_cache=True)),
+        (
+            "cache, 1 s:  ",
+            UnofficialShipEngineConfig(
+                "api-key", warehouse_cache=True, warehouse_cache_ttl=1.0
+            ),
+        ),
+    ]:
+        client = UnofficialShipEngine(config)
+        client.warehouses.session.get = get
+
+        start = time.perf_counter()
+        for i in range(SHIPMENTS):
+            client.warehouses.get_by_id(WAREHOUSES[i % len(WAREHOUSES)])
+        print(f"{name} {time.perf_counter() - start:8.4f} s")
+
+
+if __name__ == "__main__":
+    main()
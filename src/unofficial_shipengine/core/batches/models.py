@@ -3,6 +3,8 @@ from typing import Union, Any, Self
 
 from attrs import define, field, validators
 
+from unofficial_shipengine.utils.deserialize import decode
+
 from .enums import LabelLayout, LabelFormat
 from ..common.models import URL, LabelDownload, Error
 from ..labels.enums import DisplayScheme
@@ -72,17 +74,27 @@ class Batch:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        batch_shipments_url: URL = URL(**data.pop("batch_shipments_url"))
-        batch_labels_url: URL = URL(**data.pop("batch_labels_url"))
-        batch_errors_url: URL = URL(**data.pop("batch_errors_url"))
-        label_download: LabelDownload = LabelDownload(**data.pop("label_download"))
-        form_download: URL = URL(**data.pop("form_download"))
-
-        return cls(
-            batch_shipments_url=batch_shipments_url,
-            batch_labels_url=batch_labels_url,
-            batch_errors_url=batch_errors_url,
-            label_download=label_download,
-            form_download=form_download,
-            **data,
-        )
+        return decode(cls, data)
+
+
+@define
+class BatchError:
+    error: str = field(default=None)
+    shipment_id: str = field(default=None)
+    external_shipment_id: str = field(default=None)
+
+
+@define
+class CompletedBatch:
+    batch: Batch
+    errors: list[BatchError] = field(factory=list)
+
+
+@define
+class BatchModification:
+    succeeded: list[str] = field(factory=list)
+    failed: dict[str, Exception] = field(factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
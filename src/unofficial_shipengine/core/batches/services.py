@@ -1,12 +1,49 @@
-import json
-from typing import Union, Optional, Any
-
-from attrs import asdict
-
-from unofficial_shipengine.utils.serialize import serializer
-from .models import Batch, BatchRequest, ProcessLabels
-from ..common.services import BaseService
+import asyncio
+import time
+from contextlib import nullcontext
+from typing import (
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Union,
+    Optional,
+    Any,
+)
+
+from .models import (
+    Batch,
+    BatchError,
+    BatchModification,
+    BatchRequest,
+    CompletedBatch,
+    ProcessLabels,
+)
+from ..common.services import (
+    BaseService,
+    AsyncBaseService,
+    BULK_CHUNK_SIZE,
+    BULK_MAX_WORKERS,
+    LIST_PAGE_SIZE,
+)
 from ..shipments.models import Shipment
+from ...utils.bulk import async_run_bounded, chunked, run_bounded
+from ...utils.pagination import query_params
+from ...utils.polling import AdaptivePoller
+from ...utils.timeouts import check_deadline, deadline
+
+# Statuses a batch does not leave on its own.
+FINAL_STATUSES: frozenset[Batch.Status] = frozenset(
+    [
+        Batch.Status.COMPLETED,
+        Batch.Status.COMPLETED_WITH_ERRORS,
+        Batch.Status.ARCHIVED,
+        Batch.Status.INVALID,
+    ]
+)
+BATCH_POLL_MIN_INTERVAL: float = 1.0
+BATCH_POLL_MAX_INTERVAL: float = 30.0
+BATCH_ERRORS_PAGE_SIZE: int = 100
 
 
 class BatchService(BaseService):
@@ -20,20 +57,32 @@ class BatchService(BaseService):
         get_by_id(batch_id: str) -> Batch:
             Retrieves a batch by its ID.
 
+        list_batches(status: Optional[Union[Batch.Status, str]] = None, batch_number: Optional[str] = None, page_size: int = LIST_PAGE_SIZE) -> Iterator[Batch]:
+            Yields the batches matching the given filters, page after page.
+
         process_labels(batch: Union[Batch, str], process_labels: ProcessLabels) -> None:
             Processes labels for the given batch.
 
         get_batch_errors(batch: Union[Batch, str], page: int = 1, pagesize: int = 1) -> dict[str, Any]:
             Retrieves errors for the given batch.
 
+        iter_batch_errors(batch: Union[Batch, str], pagesize: int = BATCH_ERRORS_PAGE_SIZE) -> Iterator[BatchError]:
+            Yields every error of the given batch, page after page.
+
         delete_batch(batch: Union[Batch, str]) -> None:
             Deletes the given batch.
 
-        add_to_batch(batch: Union[Batch, str], shipments: list[Union[Shipment, str]], rates: Optional[list[str]] = None) -> None:
-            Adds shipments to the given batch.
+        add_to_batch(batch: Union[Batch, str], shipments: Iterable[Union[Shipment, str]], rates: Optional[Iterable[str]] = None, ...) -> BatchModification:
+            Adds any number of shipments to the given batch, in chunks sent concurrently.
+
+        remove_from_batch(batch: Union[Batch, str], shipments: Iterable[Union[Shipment, str]], rates: Optional[Iterable[str]] = None, ...) -> BatchModification:
+            Removes any number of shipments from the given batch, in chunks sent concurrently.
 
-        remove_from_batch(batch: Union[Batch, str], shipments: list[Union[Shipment, str]], rates: Optional[list[str]] = None) -> None:
-            Removes shipments from the given batch.
+        run(batch_request: BatchRequest, process_labels: Optional[ProcessLabels] = None, timeout: Optional[float] = None) -> CompletedBatch:
+            Creates a batch, processes its labels and waits until it is complete.
+
+        wait_until_complete(batch: Union[Batch, str], timeout: Optional[float] = None) -> CompletedBatch:
+            Polls a batch until it is complete.
     """
 
     def create_batch(self, batch_request: BatchRequest) -> Batch:
@@ -49,13 +98,12 @@ class BatchService(BaseService):
         Raises:
             ShipEngineAPIError: If the response from the API is invalid.
         """
-        data: str = json.dumps(asdict(batch_request, value_serializer=serializer))
+        data: bytes = self._dumps(batch_request)
 
         response = self.session.post("https://api.shipengine.com/v1/batches", data=data)
-        response_dict = json.loads(response.text)
-        self._handle_response(response)
+        response_dict = self._handle_response(response)
 
-        return Batch.from_dict(response_dict)
+        return self._decode(Batch, response_dict)
 
     def get_by_id(self, batch_id: str) -> Batch:
         """
@@ -72,11 +120,43 @@ class BatchService(BaseService):
         """
         url: str = f"https://api.shipengine.com/v1/batches/{batch_id}"
 
-        response = self.session.get(url)
-        response_dict = json.loads(response.text)
-        self._handle_response(response)
+        def fetch() -> Batch:
+            response = self.session.get(url)
+            response_dict = self._handle_response(response)
+
+            return self._decode(Batch, response_dict)
+
+        return self._coalesce(url, fetch)
 
-        return Batch.from_dict(response_dict)
+    def list_batches(
+        self,
+        status: Optional[Union[Batch.Status, str]] = None,
+        batch_number: Optional[str] = None,
+        page_size: int = LIST_PAGE_SIZE,
+    ) -> Iterator[Batch]:
+        """
+        Yields the batches matching the given filters, page after page.
+
+        Pages are fetched as the batches are consumed, and a thread_safe client prefetches the
+        next one, so the result set is never loaded whole.
+
+        Args:
+            status (Optional[Union[Batch.Status, str]], optional): Only batches with this status.
+            batch_number (Optional[str], optional): Only the batch with this number.
+            page_size (int, optional): The number of batches per page. Defaults to LIST_PAGE_SIZE.
+
+        Returns:
+            Iterator[Batch]: The batches.
+
+        Raises:
+            ShipEngineAPIError: If the response from the API is invalid.
+        """
+        url: str = "https://api.shipengine.com/v1/batches"
+        params = query_params(
+            status=status, batch_number=batch_number, page_size=page_size
+        )
+
+        return self._paginate(url, Batch, "batches", params)
 
     def process_labels(
         self, batch: Union[Batch, str], process_labels: ProcessLabels
@@ -85,7 +165,7 @@ class BatchService(BaseService):
         if isinstance(batch, Batch):
             batch = batch.batch_id
 
-        data: str = json.dumps(asdict(process_labels, value_serializer=serializer))
+        data: bytes = self._dumps(process_labels)
         url: str = f"https://api.shipengine.com/v1/batches/{batch}/process/labels"
         response = self.session.post(url, data=data)
         self._handle_response(response)
@@ -111,14 +191,37 @@ class BatchService(BaseService):
             batch = batch.batch_id
 
         url: str = f"https://api.shipengine.com/v1/batches/{batch}/errors"
-        response = self.session.get(
-            url, params=json.dumps({"page": page, "pagesize": pagesize})
-        )
+        response = self.session.get(url, params={"page": page, "pagesize": pagesize})
 
-        response_json: dict[str, Any] = response.json()
+        response_json: dict[str, Any] = self._handle_response(response)
 
         return response_json
 
+    def iter_batch_errors(
+        self, batch: Union[Batch, str], pagesize: int = BATCH_ERRORS_PAGE_SIZE
+    ) -> Iterator[BatchError]:
+        """
+        Yields every error of the given batch, page after page.
+
+        Pages are fetched as the errors are consumed, so only one page is held at a time, plus the
+        next one, which a thread_safe client prefetches while the caller handles the current one.
+
+        Args:
+            batch (Union[Batch, str]): The batch object or batch ID.
+            pagesize (int, optional): The number of errors per page. Defaults to BATCH_ERRORS_PAGE_SIZE.
+
+        Returns:
+            Iterator[BatchError]: The errors of the batch.
+
+        Raises:
+            ShipEngineAPIError: If the response from the API is invalid.
+        """
+        if isinstance(batch, Batch):
+            batch = batch.batch_id
+
+        url: str = f"https://api.shipengine.com/v1/batches/{batch}/errors"
+        return self._paginate(url, BatchError, "errors", {"pagesize": pagesize})
+
     def delete_batch(self, batch: Union[Batch, str]) -> None:
         """
         Deletes the given batch.
@@ -139,54 +242,418 @@ class BatchService(BaseService):
     def add_to_batch(
         self,
         batch: Union[Batch, str],
-        shipments: list[Union[Shipment, str]],
-        rates: Optional[list[str]] = None,
-    ) -> None:
+        shipments: Iterable[Union[Shipment, str]],
+        rates: Optional[Iterable[str]] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        max_workers: Optional[int] = None,
+    ) -> BatchModification:
         """
-        Adds shipments to the given batch.
+        Adds any number of shipments to the given batch, in chunks sent concurrently.
+
+        The shipment and rate IDs are sent `chunk_size` at a time. A chunk that fails with a network
+        error or a 5xx response is retried on its own, up to the configured retries. A chunk that
+        still fails does not stop the others, and its IDs are reported as failed.
 
         Args:
             batch (Union[Batch, str]): The batch object or batch ID.
-            shipments (list[Union[Shipment, str]]): A list of shipment objects or shipment IDs.
-            rates (Optional[list[str]], optional): A list of rate IDs. Defaults to None.
+            shipments (Iterable[Union[Shipment, str]]): The shipment objects or shipment IDs, read as chunks are sent.
+            rates (Optional[Iterable[str]], optional): The rate IDs. Defaults to None.
+            chunk_size (int, optional): The number of IDs per request. Defaults to BULK_CHUNK_SIZE.
+            max_workers (Optional[int], optional): The number of requests in flight. Defaults to BULK_MAX_WORKERS
+                for a thread_safe client, 1 otherwise.
+
+        Returns:
+            BatchModification: The IDs that were added, and the error of each ID that was not.
 
         Raises:
-            ShipEngineAPIError: If the response from the API is invalid.
+            ShipEngineAPIError: If every chunk failed, with the error of the first one.
+            ValueError: If more than one thread is asked for on a client that is not thread_safe.
         """
-        self._modify_batch(batch, "add", shipments, rates)
+        return self._modify_batch(
+            batch, "add", shipments, rates, chunk_size, max_workers
+        )
 
     def remove_from_batch(
         self,
         batch: Union[Batch, str],
-        shipments: list[Union[Shipment, str]],
-        rates: Optional[list[str]] = None,
-    ) -> None:
+        shipments: Iterable[Union[Shipment, str]],
+        rates: Optional[Iterable[str]] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        max_workers: Optional[int] = None,
+    ) -> BatchModification:
         """
-        Removes shipments from the given batch.
+        Removes any number of shipments from the given batch, in chunks sent concurrently.
+
+        Chunks are sent and retried like those of add_to_batch.
 
         Args:
             batch (Union[Batch, str]): The batch object or batch ID.
-            shipments (list[Union[Shipment, str]]): A list of shipment objects or shipment IDs.
-            rates (Optional[list[str]], optional): A list of rate IDs. Defaults to None.
+            shipments (Iterable[Union[Shipment, str]]): The shipment objects or shipment IDs, read as chunks are sent.
+            rates (Optional[Iterable[str]], optional): The rate IDs. Defaults to None.
+            chunk_size (int, optional): The number of IDs per request. Defaults to BULK_CHUNK_SIZE.
+            max_workers (Optional[int], optional): The number of requests in flight. Defaults to BULK_MAX_WORKERS
+                for a thread_safe client, 1 otherwise.
+
+        Returns:
+            BatchModification: The IDs that were removed, and the error of each ID that was not.
+
+        Raises:
+            ShipEngineAPIError: If every chunk failed, with the error of the first one.
+            ValueError: If more than one thread is asked for on a client that is not thread_safe.
+        """
+        return self._modify_batch(
+            batch, "remove", shipments, rates, chunk_size, max_workers
+        )
+
+    def run(
+        self,
+        batch_request: BatchRequest,
+        process_labels: Optional[ProcessLabels] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[Batch], None]] = None,
+        min_interval: float = BATCH_POLL_MIN_INTERVAL,
+        max_interval: float = BATCH_POLL_MAX_INTERVAL,
+    ) -> CompletedBatch:
+        """
+        Creates a batch, processes its labels and waits until it is complete.
+
+        Args:
+            batch_request (BatchRequest): The request data for creating the batch.
+            process_labels (Optional[ProcessLabels]): How to process the labels. Defaults to ProcessLabels().
+            timeout (Optional[float]): Seconds the whole run may take, see wait_until_complete. Defaults to None.
+            on_progress (Optional[Callable[[Batch], None]]): Called with the batch after every poll. Defaults to None.
+            min_interval (float): The shortest delay between polls, in seconds. Defaults to 1.
+            max_interval (float): The longest delay between polls, in seconds. Defaults to 30.
+
+        Returns:
+            CompletedBatch: The batch in its final status, with the errors of its shipments.
 
         Raises:
             ShipEngineAPIError: If the response from the API is invalid.
+            DeadlineExceededError: If the batch is not complete before the timeout or current deadline.
+        """
+        with deadline(timeout) if timeout is not None else nullcontext():
+            batch = self.create_batch(batch_request)
+            self.process_labels(batch, process_labels or ProcessLabels())
+
+            return self.wait_until_complete(
+                batch,
+                on_progress=on_progress,
+                min_interval=min_interval,
+                max_interval=max_interval,
+            )
+
+    def wait_until_complete(
+        self,
+        batch: Union[Batch, str],
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[Batch], None]] = None,
+        min_interval: float = BATCH_POLL_MIN_INTERVAL,
+        max_interval: float = BATCH_POLL_MAX_INTERVAL,
+    ) -> CompletedBatch:
         """
-        self._modify_batch(batch, "remove", shipments, rates)
+        Polls a batch until it reaches a final status, e.g. COMPLETED or COMPLETED_WITH_ERRORS.
+
+        The delay between polls adapts to the progress of the batch: while its count of completed
+        shipments grows, the next poll is planned for halfway to when the batch should be done at
+        that rate, and while it does not, the delay doubles, always between `min_interval` and
+        `max_interval`.
+
+        Args:
+            batch (Union[Batch, str]): The batch object or batch ID.
+            timeout (Optional[float]): Seconds to wait, on top of any current deadline. Defaults to None, which
+                waits as long as the current deadline allows.
+            on_progress (Optional[Callable[[Batch], None]]): Called with the batch after every poll. Defaults to None.
+            min_interval (float): The shortest delay between polls, in seconds. Defaults to 1.
+            max_interval (float): The longest delay between polls, in seconds. Defaults to 30.
+
+        Returns:
+            CompletedBatch: The batch in its final status, with the errors of its shipments.
+
+        Raises:
+            ShipEngineAPIError: If the response from the API is invalid.
+            DeadlineExceededError: If the batch is not complete before the timeout or current deadline.
+        """
+        batch_id = batch.batch_id if isinstance(batch, Batch) else batch
+        poller = AdaptivePoller(min_interval, max_interval)
+
+        with deadline(timeout) if timeout is not None else nullcontext():
+            while True:
+                polled = self.get_by_id(batch_id)
+                if on_progress is not None:
+                    on_progress(polled)
+                if polled.status in FINAL_STATUSES:
+                    break
+
+                delay = poller.next_delay(*_progress(polled))
+                check_deadline(delay)
+                time.sleep(delay)
+
+            errors = list(self.iter_batch_errors(polled)) if polled.errors else []
+
+        return CompletedBatch(polled, errors)
 
     def _modify_batch(
         self,
         batch: Union[Batch, str],
         endpoint: str,
-        shipments: list[Union[str, Shipment]],
-        rates: Optional[list[str]] = None,
+        shipments: Iterable[Union[str, Shipment]],
+        rates: Optional[Iterable[str]],
+        chunk_size: int,
+        max_workers: Optional[int],
+    ) -> BatchModification:
+        if isinstance(batch, Batch):
+            batch = batch.batch_id
+
+        url: str = f"https://api.shipengine.com/v1/batches/{batch}/{endpoint}"
+        workers = self._bulk_workers(max_workers)
+
+        def send(chunk: list[tuple[str, str]]) -> None:
+            self._post_with_retries(url, self._dumps(_batch_body(chunk)))
+
+        modification = BatchModification()
+        chunks = chunked(_batch_items(shipments, rates), chunk_size)
+        for chunk, future in run_bounded(send, chunks, workers):
+            _record(modification, chunk, future.exception())
+
+        return _checked(modification)
+
+
+class AsyncBatchService(AsyncBaseService):
+    """
+    AsyncBatchService is the awaitable counterpart of BatchService.
+
+    Every method takes the same arguments and returns the same models as its
+    BatchService equivalent.
+    """
+
+    async def create_batch(self, batch_request: BatchRequest) -> Batch:
+        """Creates a new batch. See BatchService.create_batch."""
+        data: bytes = self._dumps(batch_request)
+
+        response = await self.session.post(
+            "https://api.shipengine.com/v1/batches", content=data
+        )
+        response_dict = self._handle_response(response)
+
+        return self._decode(Batch, response_dict)
+
+    async def get_by_id(self, batch_id: str) -> Batch:
+        """Retrieves a batch by its ID. See BatchService.get_by_id."""
+        url: str = f"https://api.shipengine.com/v1/batches/{batch_id}"
+
+        async def fetch() -> Batch:
+            response = await self.session.get(url)
+            response_dict = self._handle_response(response)
+
+            return self._decode(Batch, response_dict)
+
+        return await self._coalesce(url, fetch)
+
+    def list_batches(
+        self,
+        status: Optional[Union[Batch.Status, str]] = None,
+        batch_number: Optional[str] = None,
+        page_size: int = LIST_PAGE_SIZE,
+    ) -> AsyncIterator[Batch]:
+        """Yields the batches matching the given filters. See BatchService.list_batches."""
+        url: str = "https://api.shipengine.com/v1/batches"
+        params = query_params(
+            status=status, batch_number=batch_number, page_size=page_size
+        )
+
+        return self._paginate(url, Batch, "batches", params)
+
+    async def process_labels(
+        self, batch: Union[Batch, str], process_labels: ProcessLabels
     ) -> None:
+        """Processes labels for the given batch. See BatchService.process_labels."""
         if isinstance(batch, Batch):
             batch = batch.batch_id
 
-        shipments = [s if isinstance(s, str) else s.shipment_id for s in shipments]
+        data: bytes = self._dumps(process_labels)
+        url: str = f"https://api.shipengine.com/v1/batches/{batch}/process/labels"
+        response = await self.session.post(url, content=data)
+        self._handle_response(response)
 
-        url: str = f"https://api.shipengine.com/v1/batches/{batch}/{endpoint}"
-        data: str = json.dumps({"shipment_ids": shipments, "rate_ids": rates})
-        response = self.session.post(url, data=data)
+    async def get_batch_errors(
+        self, batch: Union[Batch, str], page: int = 1, pagesize: int = 1
+    ) -> dict[str, Any]:
+        """Retrieves errors for the given batch. See BatchService.get_batch_errors."""
+        if isinstance(batch, Batch):
+            batch = batch.batch_id
+
+        url: str = f"https://api.shipengine.com/v1/batches/{batch}/errors"
+        response = await self.session.get(
+            url, params={"page": page, "pagesize": pagesize}
+        )
+        response_json: dict[str, Any] = self._handle_response(response)
+
+        return response_json
+
+    def iter_batch_errors(
+        self, batch: Union[Batch, str], pagesize: int = BATCH_ERRORS_PAGE_SIZE
+    ) -> AsyncIterator[BatchError]:
+        """Yields every error of the given batch. See BatchService.iter_batch_errors."""
+        if isinstance(batch, Batch):
+            batch = batch.batch_id
+
+        url: str = f"https://api.shipengine.com/v1/batches/{batch}/errors"
+        return self._paginate(url, BatchError, "errors", {"pagesize": pagesize})
+
+    async def delete_batch(self, batch: Union[Batch, str]) -> None:
+        """Deletes the given batch. See BatchService.delete_batch."""
+        if isinstance(batch, Batch):
+            batch = batch.batch_id
+
+        url: str = f"https://api.shipengine.com/v1/batches/{batch}"
+        response = await self.session.delete(url)
         self._handle_response(response)
+
+    async def add_to_batch(
+        self,
+        batch: Union[Batch, str],
+        shipments: Iterable[Union[Shipment, str]],
+        rates: Optional[Iterable[str]] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        max_workers: int = BULK_MAX_WORKERS,
+    ) -> BatchModification:
+        """Adds any number of shipments to the given batch. See BatchService.add_to_batch."""
+        return await self._modify_batch(
+            batch, "add", shipments, rates, chunk_size, max_workers
+        )
+
+    async def remove_from_batch(
+        self,
+        batch: Union[Batch, str],
+        shipments: Iterable[Union[Shipment, str]],
+        rates: Optional[Iterable[str]] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        max_workers: int = BULK_MAX_WORKERS,
+    ) -> BatchModification:
+        """Removes any number of shipments from the given batch. See BatchService.remove_from_batch."""
+        return await self._modify_batch(
+            batch, "remove", shipments, rates, chunk_size, max_workers
+        )
+
+    async def run(
+        self,
+        batch_request: BatchRequest,
+        process_labels: Optional[ProcessLabels] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[Batch], None]] = None,
+        min_interval: float = BATCH_POLL_MIN_INTERVAL,
+        max_interval: float = BATCH_POLL_MAX_INTERVAL,
+    ) -> CompletedBatch:
+        """Creates a batch, processes its labels and waits until it is complete. See BatchService.run."""
+        with deadline(timeout) if timeout is not None else nullcontext():
+            batch = await self.create_batch(batch_request)
+            await self.process_labels(batch, process_labels or ProcessLabels())
+
+            return await self.wait_until_complete(
+                batch,
+                on_progress=on_progress,
+                min_interval=min_interval,
+                max_interval=max_interval,
+            )
+
+    async def wait_until_complete(
+        self,
+        batch: Union[Batch, str],
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[Batch], None]] = None,
+        min_interval: float = BATCH_POLL_MIN_INTERVAL,
+        max_interval: float = BATCH_POLL_MAX_INTERVAL,
+    ) -> CompletedBatch:
+        """Polls a batch until it reaches a final status. See BatchService.wait_until_complete."""
+        batch_id = batch.batch_id if isinstance(batch, Batch) else batch
+        poller = AdaptivePoller(min_interval, max_interval)
+
+        with deadline(timeout) if timeout is not None else nullcontext():
+            while True:
+                polled = await self.get_by_id(batch_id)
+                if on_progress is not None:
+                    on_progress(polled)
+                if polled.status in FINAL_STATUSES:
+                    break
+
+                delay = poller.next_delay(*_progress(polled))
+                check_deadline(delay)
+                await asyncio.sleep(delay)
+
+            errors = (
+                [error async for error in self.iter_batch_errors(polled)]
+                if polled.errors
+                else []
+            )
+
+        return CompletedBatch(polled, errors)
+
+    async def _modify_batch(
+        self,
+        batch: Union[Batch, str],
+        endpoint: str,
+        shipments: Iterable[Union[str, Shipment]],
+        rates: Optional[Iterable[str]],
+        chunk_size: int,
+        max_workers: int,
+    ) -> BatchModification:
+        if isinstance(batch, Batch):
+            batch = batch.batch_id
+
+        url: str = f"https://api.shipengine.com/v1/batches/{batch}/{endpoint}"
+
+        async def send(chunk: list[tuple[str, str]]) -> None:
+            await self._post_with_retries(url, self._dumps(_batch_body(chunk)))
+
+        modification = BatchModification()
+        chunks = chunked(_batch_items(shipments, rates), chunk_size)
+        async for chunk, task in async_run_bounded(send, chunks, max_workers):
+            _record(modification, chunk, task.exception())
+
+        return _checked(modification)
+
+
+def _progress(batch: Batch) -> tuple[int, int]:
+    total = batch.count or 0
+    return min((batch.completed or 0) + (batch.errors or 0), total), total
+
+
+def _batch_items(
+    shipments: Iterable[Union[str, Shipment]], rates: Optional[Iterable[str]]
+) -> Iterator[tuple[str, str]]:
+    """Yields the field of the request body and the ID of every shipment and rate, in order."""
+    for shipment in shipments:
+        yield "shipment_ids", (
+            shipment if isinstance(shipment, str) else shipment.shipment_id
+        )
+    for rate in rates or ():
+        yield "rate_ids", rate
+
+
+def _batch_body(chunk: list[tuple[str, str]]) -> dict[str, Optional[list[str]]]:
+    shipment_ids = [id_ for name, id_ in chunk if name == "shipment_ids"]
+    rate_ids = [id_ for name, id_ in chunk if name == "rate_ids"]
+    return {"shipment_ids": shipment_ids, "rate_ids": rate_ids or None}
+
+
+def _record(
+    modification: BatchModification,
+    chunk: list[tuple[str, str]],
+    error: Optional[BaseException],
+) -> None:
+    ids = [id_ for _, id_ in chunk]
+    if error is None:
+        modification.succeeded += ids
+    elif isinstance(error, Exception):
+        modification.failed.update(dict.fromkeys(ids, error))
+    else:
+        raise error
+
+
+def _checked(modification: BatchModification) -> BatchModification:
+    # Nothing landed: fail like a single request would, rather than hand back a summary
+    # that only holds errors.
+    if modification.failed and not modification.succeeded:
+        raise next(iter(modification.failed.values()))
+    return modification
@@ -1,7 +1,11 @@
-from typing import Self, Any
+from typing import Self, Any, Optional, TypeVar
 
 from attrs import define
 
+from unofficial_shipengine.utils.deserialize import decode
+
+T = TypeVar("T")
+
 
 @define
 class CarrierOption:
@@ -11,7 +15,7 @@ class CarrierOption:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(**data)
+        return decode(cls, data)
 
 
 @define
@@ -23,7 +27,7 @@ class CarrierPackage:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(**data)
+        return decode(cls, data)
 
 
 @define
@@ -38,7 +42,7 @@ class CarrierService:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(**data)
+        return decode(cls, data)
 
 
 @define
@@ -48,7 +52,7 @@ class CarrierBalance:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(**data)
+        return decode(cls, data)
 
 
 @define
@@ -71,16 +75,89 @@ class Carrier:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        packages: list[CarrierPackage] = [
-            CarrierPackage.from_dict(p) for p in data.pop("packages")
-        ]
-
-        services: list[CarrierService] = [
-            CarrierService.from_dict(s) for s in data.pop("services")
-        ]
-
-        options: list[CarrierOption] = [
-            CarrierOption.from_dict(o) for o in data.pop("options")
-        ]
-
-        return cls(packages=packages, services=services, options=options, **data)
+        return decode(cls, data)
+
+
+class CarrierCatalog:
+    """
+    CarrierCatalog indexes the carriers of an account, their services and their packages.
+
+    The indexes are built once, when the catalog is created, so every lookup is a dict access.
+    Lookups return tuples, as a catalog is shared between callers, holding the models of the
+    catalog itself, which must not be modified.
+
+    Args:
+        carriers (list[Carrier]): The carriers, as returned by CarrierService.get_carriers.
+    """
+
+    def __init__(self, carriers: list[Carrier]) -> None:
+        self.carriers = carriers
+        self._by_id: dict[str, Carrier] = {}
+        by_carrier_code: dict[str, list[Carrier]] = {}
+        by_service_code: dict[str, list[CarrierService]] = {}
+        by_package_code: dict[str, list[Carrier]] = {}
+        domestic: list[CarrierService] = []
+        international: list[CarrierService] = []
+
+        for carrier in carriers:
+            self._by_id[carrier.carrier_id] = carrier
+            by_carrier_code.setdefault(carrier.carrier_code, []).append(carrier)
+
+            for service in carrier.services:
+                by_service_code.setdefault(service.service_code, []).append(service)
+                if service.domestic:
+                    domestic.append(service)
+                if service.international:
+                    international.append(service)
+
+            for package in carrier.packages:
+                by_package_code.setdefault(package.package_code, []).append(carrier)
+
+        self._by_carrier_code: dict[str, tuple[Carrier, ...]] = _freeze(by_carrier_code)
+        self._by_service_code: dict[str, tuple[CarrierService, ...]] = _freeze(
+            by_service_code
+        )
+        self._by_package_code: dict[str, tuple[Carrier, ...]] = _freeze(by_package_code)
+        self._domestic: tuple[CarrierService, ...] = tuple(domestic)
+        self._international: tuple[CarrierService, ...] = tuple(international)
+
+    def get_by_id(self, carrier_id: str) -> Optional[Carrier]:
+        """Returns the carrier of a carrier ID, or None if the account has no such carrier."""
+        return self._by_id.get(carrier_id)
+
+    def get_by_carrier_code(self, carrier_code: str) -> tuple[Carrier, ...]:
+        """Returns the carriers of a carrier code, e.g. every connected "ups" account."""
+        return self._by_carrier_code.get(carrier_code, ())
+
+    def get_services(self, service_code: str) -> tuple[CarrierService, ...]:
+        """Returns the services of a service code, one per carrier that offers it."""
+        return self._by_service_code.get(service_code, ())
+
+    def get_carrier_id(self, service_code: str) -> Optional[str]:
+        """
+        Returns the ID of the first carrier that offers a service.
+
+        Args:
+            service_code (str): The service code, e.g. "usps_priority_mail".
+
+        Returns:
+            Optional[str]: The carrier ID, or None if no carrier of the account offers the service.
+        """
+        services = self._by_service_code.get(service_code)
+        return services[0].carrier_id if services else None
+
+    def get_domestic_services(self) -> tuple[CarrierService, ...]:
+        """Returns the services that ship within a country."""
+        return self._domestic
+
+    def get_international_services(self) -> tuple[CarrierService, ...]:
+        """Returns the services that ship between countries."""
+        return self._international
+
+    def get_carriers_with_package(self, package_code: str) -> tuple[Carrier, ...]:
+        """Returns the carriers that offer a package type, e.g. "flat_rate_envelope"."""
+        return self._by_package_code.get(package_code, ())
+
+
+def _freeze(index: dict[str, list[T]]) -> dict[str, tuple[T, ...]]:
+    return {key: tuple(values) for key, values in index.items()}
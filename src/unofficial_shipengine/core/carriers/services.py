@@ -1,8 +1,19 @@
-import json
-from typing import Union
+from typing import Optional, Union, TYPE_CHECKING
 
-from .models import Carrier, CarrierBalance
-from ..common.services import BaseService
+import requests
+
+from .models import Carrier, CarrierBalance, CarrierCatalog
+from ..common.services import BaseService, AsyncBaseService
+from ...unofficial_shipengine_config import UnofficialShipEngineConfig
+from ...utils.cache import TTLCache
+from ...utils.single_flight import AsyncSingleFlight, SingleFlight
+
+if TYPE_CHECKING:
+    import httpx
+
+# Seconds a carrier catalog is reused for when the client has no config.
+CARRIER_CATALOG_TTL: float = 300.0
+CARRIER_CATALOG_KEY: str = "carrier_catalog"
 
 
 class CarrierService(BaseService):
@@ -18,8 +29,27 @@ class CarrierService(BaseService):
 
         add_funds(carrier: Union[Carrier, str], amount: float, currency: str = "usd") -> CarrierBalance:
             Adds funds to a carrier account.
+
+        get_catalog() -> CarrierCatalog:
+            Returns the cached carrier catalog, fetching it if it is missing or has expired.
+
+        refresh_catalog() -> CarrierCatalog:
+            Fetches the carrier catalog and caches it.
     """
 
+    def __init__(
+        self,
+        session: requests.Session,
+        config: Optional[UnofficialShipEngineConfig] = None,
+    ):
+        super().__init__(session, config)
+        self._catalog: TTLCache[str, CarrierCatalog] = TTLCache(
+            config.carrier_catalog_ttl if config is not None else CARRIER_CATALOG_TTL
+        )
+        # Catalog fetches are always coalesced, whether or not single_flight is set, so a
+        # missing or expired catalog is fetched once however many threads ask for it.
+        self._catalog_flight = SingleFlight()
+
     def get_carriers(self) -> list[Carrier]:
         """
         Retrieves a list of carriers.
@@ -32,13 +62,11 @@ class CarrierService(BaseService):
         """
         url = "https://api.shipengine.com/v1/carriers"
         response = self.session.get(url)
-        response_dict = json.loads(response.text)
-
-        self._handle_response(response)
+        response_dict = self._handle_response(response)
 
         carriers = response_dict["carriers"]
 
-        return [Carrier.from_dict(c) for c in carriers]
+        return [self._decode(Carrier, c) for c in carriers]
 
     def get_by_id(self, carrier_id: str) -> Carrier:
         """
@@ -55,11 +83,9 @@ class CarrierService(BaseService):
         """
         url = f"https://api.shipengine.com/v1/carriers/{carrier_id}"
         response = self.session.get(url)
-        response_dict = json.loads(response.text)
+        response_dict = self._handle_response(response)
 
-        self._handle_response(response)
-
-        return Carrier.from_dict(response_dict)
+        return self._decode(Carrier, response_dict)
 
     def add_funds(
         self, carrier: Union[Carrier, str], amount: float, currency: str = "usd"
@@ -87,9 +113,118 @@ class CarrierService(BaseService):
         url = f"https://api.shipengine.com/v1/carriers/{carrier}/add_funds"
         data = {"amount": amount, "currency": currency}
 
-        response = self.session.post(url, data=json.dumps(data))
-        response_dict = json.loads(response.text)
+        response = self.session.post(url, data=self._dumps(data))
+        response_dict = self._handle_response(response)
+
+        return self._decode(CarrierBalance, response_dict)
+
+    def get_catalog(self) -> CarrierCatalog:
+        """
+        Returns the cached carrier catalog, fetching it if it is missing or has expired.
+
+        Lookups by carrier code, service code or package code go through the catalog's indexes,
+        so once it is cached they need no request at all. The catalog is reused for
+        carrier_catalog_ttl seconds.
+
+        Returns:
+            CarrierCatalog: The catalog of the account's carriers.
+
+        Raises:
+            ShipEngineAPIError: If the response from the API is invalid.
+        """
+        catalog = self._catalog.get(CARRIER_CATALOG_KEY)
+        if catalog is None:
+            catalog = self.refresh_catalog()
+
+        return catalog
+
+    def refresh_catalog(self) -> CarrierCatalog:
+        """
+        Fetches the carrier catalog and caches it, e.g. after connecting a carrier account.
+
+        Concurrent calls share one request.
+
+        Returns:
+            CarrierCatalog: The catalog of the account's carriers.
+
+        Raises:
+            ShipEngineAPIError: If the response from the API is invalid.
+        """
+
+        def fetch() -> CarrierCatalog:
+            catalog = CarrierCatalog(self.get_carriers())
+            self._catalog.put(CARRIER_CATALOG_KEY, catalog)
+            return catalog
+
+        return self._catalog_flight.do(CARRIER_CATALOG_KEY, fetch)
+
+
+class AsyncCarrierService(AsyncBaseService):
+    """
+    AsyncCarrierService is the awaitable counterpart of CarrierService.
+
+    Every method takes the same arguments and returns the same models as its
+    CarrierService equivalent.
+    """
+
+    def __init__(
+        self,
+        session: "httpx.AsyncClient",
+        config: Optional[UnofficialShipEngineConfig] = None,
+    ):
+        super().__init__(session, config)
+        self._catalog: TTLCache[str, CarrierCatalog] = TTLCache(
+            config.carrier_catalog_ttl if config is not None else CARRIER_CATALOG_TTL
+        )
+        self._catalog_flight = AsyncSingleFlight()
+
+    async def get_carriers(self) -> list[Carrier]:
+        """Retrieves a list of carriers. See CarrierService.get_carriers."""
+        url = "https://api.shipengine.com/v1/carriers"
+        response = await self.session.get(url)
+        response_dict = self._handle_response(response)
+
+        carriers = response_dict["carriers"]
+
+        return [self._decode(Carrier, c) for c in carriers]
+
+    async def get_by_id(self, carrier_id: str) -> Carrier:
+        """Retrieves a carrier by its ID. See CarrierService.get_by_id."""
+        url = f"https://api.shipengine.com/v1/carriers/{carrier_id}"
+        response = await self.session.get(url)
+        response_dict = self._handle_response(response)
+
+        return self._decode(Carrier, response_dict)
+
+    async def add_funds(
+        self, carrier: Union[Carrier, str], amount: float, currency: str = "usd"
+    ) -> CarrierBalance:
+        """Adds funds to a carrier account. See CarrierService.add_funds."""
+        if isinstance(carrier, Carrier):
+            carrier = carrier.carrier_id
+
+        url = f"https://api.shipengine.com/v1/carriers/{carrier}/add_funds"
+        data = {"amount": amount, "currency": currency}
+
+        response = await self.session.post(url, content=self._dumps(data))
+        response_dict = self._handle_response(response)
+
+        return self._decode(CarrierBalance, response_dict)
+
+    async def get_catalog(self) -> CarrierCatalog:
+        """Returns the cached carrier catalog. See CarrierService.get_catalog."""
+        catalog = self._catalog.get(CARRIER_CATALOG_KEY)
+        if catalog is None:
+            catalog = await self.refresh_catalog()
+
+        return catalog
+
+    async def refresh_catalog(self) -> CarrierCatalog:
+        """Fetches the carrier catalog and caches it. See CarrierService.refresh_catalog."""
 
-        self._handle_response(response)
+        async def fetch() -> CarrierCatalog:
+            catalog = CarrierCatalog(await self.get_carriers())
+            self._catalog.put(CARRIER_CATALOG_KEY, catalog)
+            return catalog
 
-        return CarrierBalance.from_dict(response_dict)
+        return await self._catalog_flight.do(CARRIER_CATALOG_KEY, fetch)
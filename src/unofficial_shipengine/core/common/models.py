@@ -3,7 +3,11 @@ from typing import Self, Optional, Any
 
 from attrs import define, field, validators
 
+from unofficial_shipengine.utils.deserialize import decode
+from unofficial_shipengine.utils.interning import flyweight
 
+
+@flyweight
 @define
 class Address:
     class AddressResidentialIndicator(Enum):
@@ -37,6 +41,7 @@ class Error:
     error_message: str
 
 
+@flyweight
 @define
 class URL:
     href: str
@@ -72,6 +77,7 @@ class AddressValidation:
     messages: list[Message] = field(default=None)
 
 
+@flyweight
 @define
 class Weight:
     class Unit(Enum):
@@ -96,6 +102,7 @@ class Dimension:
     unit: Unit = field(default=Unit.INCH, validator=validators.in_(Unit))
 
 
+@flyweight
 @define
 class Value:
     # ISO 4217: https://www.iso.org/iso-4217-currency-codes.html
@@ -194,15 +201,4 @@ class Package:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        weight = Weight(**data.pop("weight"))
-        dimensions = Dimension(**data.pop("dimensions"))
-        insured_value = Value(**data.pop("insured_value"))
-        label_messages = Package.LabelMessages(**data.pop("label_messages"))
-
-        return cls(
-            weight=weight,
-            dimensions=dimensions,
-            insured_value=insured_value,
-            label_messages=label_messages,
-            **data
-        )
+        return decode(cls, data)
@@ -1,21 +1,540 @@
-from typing import Any
+import asyncio
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+    TYPE_CHECKING,
+)
 
 import requests
 
 from unofficial_shipengine.exceptions import ShipEngineAPIError
+from unofficial_shipengine.unofficial_shipengine_config import (
+    UnofficialShipEngineConfig,
+)
+from unofficial_shipengine.utils.deserialize import decode
+from unofficial_shipengine.utils.json_backend import JSONBackend, get_json_backend
+from unofficial_shipengine.utils.pagination import (
+    Page,
+    async_paginate,
+    has_next_page,
+    paginate,
+)
+from unofficial_shipengine.utils.serialize import encode_value
+from unofficial_shipengine.utils.single_flight import AsyncSingleFlight, SingleFlight
+from unofficial_shipengine.utils.templates import RequestTemplate
+from unofficial_shipengine.utils.timeouts import check_deadline
+
+if TYPE_CHECKING:
+    import httpx
+
+R = TypeVar("R")
+T = TypeVar("T")
+
+TRANSIENT_STATUS_CODES: frozenset[int] = frozenset([500, 502, 503, 504])
+TRANSIENT_ERRORS: tuple[type[Exception], ...] = (
+    requests.ConnectionError,
+    requests.Timeout,
+)
+# Raised while looking up the outcome of a failed POST when the lookup itself hits a 5xx.
+LOOKUP_ERRORS: tuple[type[Exception], ...] = TRANSIENT_ERRORS + (requests.HTTPError,)
+SUCCESS_STATUS_CODES: frozenset[int] = frozenset([200, 204, 207])
+# Items sent per request, and requests in flight, of the bulk methods.
+BULK_CHUNK_SIZE: int = 100
+BULK_MAX_WORKERS: int = 4
+# Items per page of the list methods.
+LIST_PAGE_SIZE: int = 100
+
+
+def parse_response(
+    json_backend: JSONBackend, response: Union[requests.Response, "httpx.Response"]
+) -> Any:
+    """
+    Parses the body of a response and classifies it as a success or an error.
+
+    The body is parsed once, straight from its bytes, and the parsed object is both
+    checked for the error the API reports and returned for the model decoders.
+
+    Args:
+        json_backend (JSONBackend): Parses the body.
+        response (Union[requests.Response, httpx.Response]): The response.
+
+    Returns:
+        Any: The parsed body, or None if the response has no body.
+
+    Raises:
+        ShipEngineAPIError: If the API answered with an error.
+        requests.HTTPError: If an error response has no JSON body, e.g. a gateway error page.
+        httpx.HTTPStatusError: The same, for responses of the async client.
+    """
+    content = response.content
+
+    if response.status_code in SUCCESS_STATUS_CODES:
+        return json_backend.loads(content) if content else None
+
+    try:
+        response_dict: dict[str, Any] = json_backend.loads(content)
+    except ValueError:
+        response.raise_for_status()
+        raise
+
+    raise ShipEngineAPIError(
+        request_id=response_dict["request_id"],
+        errors=response_dict["errors"],
+        status_code=response.status_code,
+    )
 
 
 class BaseService:
-    def __init__(self, session: requests.Session):
+    def __init__(
+        self,
+        session: requests.Session,
+        config: Optional[UnofficialShipEngineConfig] = None,
+    ):
         self.session = session
+        self.config = config
+        self._single_flight: Optional[SingleFlight] = (
+            SingleFlight() if config is not None and config.single_flight else None
+        )
+        self._json: JSONBackend = get_json_backend(
+            config.json_backend if config is not None else None
+        )
+        self._sparse: bool = config is not None and config.sparse_payloads
+        self._lazy: bool = config is not None and config.lazy_models
+        self._intern: bool = config is not None and config.intern_models
+
+    def _handle_response(
+        self, response: Union[requests.Response, "httpx.Response"]
+    ) -> Any:
+        """
+        Parses the body of a response once and raises the error it reports, if any.
+
+        Args:
+            response (Union[requests.Response, httpx.Response]): The response.
+
+        Returns:
+            Any: The parsed body, or None if the response has no body.
+
+        Raises:
+            ShipEngineAPIError: If the API answered with an error.
+        """
+        return parse_response(self._json, response)
+
+    def _dumps(self, value: Any) -> bytes:
+        """
+        Encodes a request body with the configured JSON backend.
+
+        Args:
+            value (Any): An attrs model, or a list or dict of them.
+
+        Returns:
+            bytes: The body, ready to be sent as it is.
+        """
+        return self._json.dumps(encode_value(value, self._sparse))
+
+    def _decode(self, cls: type[T], data: dict[str, Any]) -> T:
+        """
+        Builds a model from a parsed response, as configured by lazy_models and intern_models.
+
+        Args:
+            cls (type[T]): The model class.
+            data (dict[str, Any]): The parsed response.
+
+        Returns:
+            T: The model.
+        """
+        return decode(cls, data, self._lazy, self._intern)
+
+    def _template(self, cls: type[T], **shared: Any) -> RequestTemplate[T]:
+        """
+        Creates a request template encoding with the configured JSON backend and sparse setting.
+
+        Args:
+            cls (type[T]): The request model.
+            **shared (Any): The values of the shared fields, by field name.
+
+        Returns:
+            RequestTemplate[T]: The template.
+        """
+        return RequestTemplate(cls, self._json, self._sparse, **shared)
+
+    def _paginate(
+        self, url: str, cls: type[T], key: str, params: dict[str, Any]
+    ) -> Iterator[T]:
+        """
+        Yields the models of every page of a paged endpoint.
+
+        The next page is prefetched from a background thread while the current one is consumed,
+        if the client is thread_safe.
+
+        Args:
+            url (str): The URL of the endpoint.
+            cls (type[T]): The model class of the items.
+            key (str): The key of the items in the response.
+            params (dict[str, Any]): The query parameters, including the page size; the page number
+                is added to them.
+
+        Returns:
+            Iterator[T]: The models.
+
+        Raises:
+            ShipEngineAPIError: If the response from the API is invalid.
+        """
+
+        def fetch_page(page: int) -> Page[T]:
+            response = self.session.get(url, params={**params, "page": page})
+            response_dict: dict[str, Any] = self._handle_response(response)
+            items = [self._decode(cls, item) for item in response_dict[key]]
+            return items, has_next_page(response_dict, page)
+
+        thread_safe = self.config is not None and self.config.thread_safe
+        return paginate(fetch_page, prefetch=thread_safe)
+
+    def _bulk_workers(self, max_workers: Optional[int]) -> int:
+        """
+        Returns the number of threads a bulk method may send requests from.
+
+        Args:
+            max_workers (Optional[int]): The number asked for, None for the default: BULK_MAX_WORKERS
+                for a thread_safe client, 1 otherwise.
+
+        Returns:
+            int: The number of threads.
+
+        Raises:
+            ValueError: If more than one thread is asked for on a client that is not thread_safe.
+        """
+        thread_safe = self.config is not None and self.config.thread_safe
+
+        if max_workers is None:
+            return BULK_MAX_WORKERS if thread_safe else 1
+        if max_workers > 1 and not thread_safe:
+            raise ValueError(
+                "Sending from several threads needs a client with thread_safe=True"
+            )
+
+        return max_workers
+
+    def _post_with_recovery(
+        self,
+        url: str,
+        pending: dict[str, R],
+        encode: Callable[[list[R]], bytes],
+        decode: Callable[[dict[str, Any]], list[T]],
+        recover: Callable[[str], Optional[T]],
+    ) -> list[T]:
+        """
+        Sends a non-idempotent POST, retrying transient failures without creating duplicates.
+
+        Every request is keyed by an external ID the API stores with what it creates. When an
+        attempt fails with a network error or a 5xx response, the outcome is unknown, so each
+        pending key is looked up with `recover` first and only the requests the API has no
+        record of are posted again.
+
+        Args:
+            url (str): The endpoint to post to.
+            pending (dict[str, R]): The requests to send, keyed by their external ID.
+            encode (Callable[[list[R]], bytes]): Builds the request body for a list of requests.
+            decode (Callable[[dict[str, Any]], list[T]]): Decodes a response into one result per request sent.
+            recover (Callable[[str], Optional[T]]): Looks up the result for an external ID, None if the API has
+                no record of it. It should raise requests.HTTPError for a 5xx so the lookup is retried.
+
+        Returns:
+            list[T]: The results, in the order of `pending`.
+
+        Raises:
+            ShipEngineAPIError: If the response from the API is invalid.
+            requests.RequestException: If the request still fails after the configured retries.
+            DeadlineExceededError: If the current deadline passes before the requests are resolved.
+        """
+        pending = dict(pending)
+        keys: list[str] = list(pending)
+        results: dict[str, T] = {}
+        retries: int = self.config.retries if self.config is not None else 0
+        attempt: int = 0
+
+        while pending:
+            try:
+                response = self.session.post(url, data=encode(list(pending.values())))
+            except TRANSIENT_ERRORS:
+                if attempt >= retries:
+                    raise
+            else:
+                if (
+                    response.status_code not in TRANSIENT_STATUS_CODES
+                    or attempt >= retries
+                ):
+                    response_dict = self._handle_response(response)
+                    results.update(zip(pending, decode(response_dict)))
+                    break
+
+            # The outcome is unknown, so nothing is posted again until every
+            # pending request has been looked up.
+            while True:
+                attempt += 1
+                backoff = self._get_backoff_time(attempt)
+                check_deadline(backoff)
+                time.sleep(backoff)
+
+                try:
+                    for key in list(pending):
+                        if (result := recover(key)) is not None:
+                            results[key] = result
+                            del pending[key]
+                    break
+                except LOOKUP_ERRORS:
+                    if attempt >= retries:
+                        raise
 
-    @staticmethod
-    def _handle_response(response: requests.Response):
-        if response.status_code in [200, 204, 207]:
-            return
+        return [results[key] for key in keys]
 
-        response_dict: dict[str, Any] = response.json()
+    def _post_with_retries(self, url: str, data: bytes) -> Any:
+        """
+        Sends a POST that is safe to repeat, retrying network failures and 5xx responses.
 
-        raise ShipEngineAPIError(
-            request_id=response_dict["request_id"], errors=response_dict["errors"]
+        Only use it for requests that leave the same state when they are applied twice, e.g. adding
+        shipments to a batch. Creating anything goes through _post_with_recovery instead.
+
+        Args:
+            url (str): The endpoint to post to.
+            data (bytes): The request body.
+
+        Returns:
+            Any: The parsed response.
+
+        Raises:
+            ShipEngineAPIError: If the response from the API is invalid.
+            requests.RequestException: If the request still fails after the configured retries.
+            DeadlineExceededError: If the current deadline passes before the request succeeds.
+        """
+        retries: int = self.config.retries if self.config is not None else 0
+        attempt: int = 0
+
+        while True:
+            try:
+                response = self.session.post(url, data=data)
+            except TRANSIENT_ERRORS:
+                if attempt >= retries:
+                    raise
+            else:
+                if (
+                    response.status_code not in TRANSIENT_STATUS_CODES
+                    or attempt >= retries
+                ):
+                    return self._handle_response(response)
+
+            attempt += 1
+            backoff = self._get_backoff_time(attempt)
+            check_deadline(backoff)
+            time.sleep(backoff)
+
+    def _get_if_exists(self, url: str) -> Optional[dict[str, Any]]:
+        """
+        Retrieves a resource, returning None if the API reports it does not exist.
+
+        Args:
+            url (str): The resource to retrieve.
+
+        Returns:
+            Optional[dict[str, Any]]: The decoded response, or None on a 404.
+
+        Raises:
+            requests.HTTPError: If the API answered with a transient 5xx error.
+            ShipEngineAPIError: If the response from the API is invalid.
+        """
+        response = self.session.get(url)
+
+        if response.status_code == 404:
+            return None
+
+        if response.status_code in TRANSIENT_STATUS_CODES:
+            response.raise_for_status()
+
+        response_dict: dict[str, Any] = self._handle_response(response)
+
+        return response_dict
+
+    def _coalesce(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        """
+        Runs `fetch`, sharing its result with concurrent calls of the same key when single flight is enabled.
+
+        Args:
+            key (Hashable): Identifies requests that return the same result, usually the URL.
+            fetch (Callable[[], T]): Sends the request and decodes the response.
+
+        Returns:
+            T: The decoded response, shared between every caller of the same key.
+        """
+        if self._single_flight is None:
+            return fetch()
+        return self._single_flight.do(key, fetch)
+
+    def _get_backoff_time(self, attempt: int) -> float:
+        if self.config is None or attempt <= 1:
+            return 0
+        backoff: float = self.config.backoff_factor * (2 ** (attempt - 1))
+        return backoff
+
+
+class AsyncBaseService:
+    """Base class for the awaitable services, backed by a shared httpx.AsyncClient."""
+
+    def __init__(
+        self,
+        session: "httpx.AsyncClient",
+        config: Optional[UnofficialShipEngineConfig] = None,
+    ):
+        self.session = session
+        self.config = config
+        self._single_flight: Optional[AsyncSingleFlight] = (
+            AsyncSingleFlight() if config is not None and config.single_flight else None
         )
+        self._json: JSONBackend = get_json_backend(
+            config.json_backend if config is not None else None
+        )
+        self._sparse: bool = config is not None and config.sparse_payloads
+        self._lazy: bool = config is not None and config.lazy_models
+        self._intern: bool = config is not None and config.intern_models
+
+    def _handle_response(self, response: "httpx.Response") -> Any:
+        """Parses the body of a response once and raises the error it reports. See BaseService._handle_response."""
+        return parse_response(self._json, response)
+
+    def _dumps(self, value: Any) -> bytes:
+        """Encodes a request body with the configured JSON backend. See BaseService._dumps."""
+        return self._json.dumps(encode_value(value, self._sparse))
+
+    def _decode(self, cls: type[T], data: dict[str, Any]) -> T:
+        """Builds a model from a parsed response. See BaseService._decode."""
+        return decode(cls, data, self._lazy, self._intern)
+
+    def _template(self, cls: type[T], **shared: Any) -> RequestTemplate[T]:
+        """Creates a request template. See BaseService._template."""
+        return RequestTemplate(cls, self._json, self._sparse, **shared)
+
+    def _paginate(
+        self, url: str, cls: type[T], key: str, params: dict[str, Any]
+    ) -> AsyncIterator[T]:
+        """Yields the models of every page of a paged endpoint. See BaseService._paginate."""
+
+        async def fetch_page(page: int) -> Page[T]:
+            response = await self.session.get(url, params={**params, "page": page})
+            response_dict: dict[str, Any] = self._handle_response(response)
+            items = [self._decode(cls, item) for item in response_dict[key]]
+            return items, has_next_page(response_dict, page)
+
+        return async_paginate(fetch_page)
+
+    async def _post_with_retries(self, url: str, data: bytes) -> Any:
+        """
+        Sends a POST that is safe to repeat, retrying 5xx responses. See BaseService._post_with_retries.
+
+        Connection failures are already retried by the transport for every method.
+        """
+        retries: int = self.config.retries if self.config is not None else 0
+        attempt: int = 0
+
+        while True:
+            response = await self.session.post(url, content=data)
+            if response.status_code not in TRANSIENT_STATUS_CODES or attempt >= retries:
+                return self._handle_response(response)
+
+            attempt += 1
+            backoff = self._get_backoff_time(attempt)
+            check_deadline(backoff)
+            await asyncio.sleep(backoff)
+
+    async def _post_with_recovery(
+        self,
+        url: str,
+        pending: dict[str, R],
+        encode: Callable[[list[R]], bytes],
+        decode: Callable[[dict[str, Any]], list[T]],
+        recover: Callable[[str], Awaitable[Optional[T]]],
+    ) -> list[T]:
+        """
+        Sends a non-idempotent POST, retrying transient failures without creating duplicates. See
+        BaseService._post_with_recovery.
+
+        `recover` should raise httpx.HTTPStatusError for a 5xx so the lookup is retried.
+        """
+        import httpx
+
+        transient_errors = (httpx.TransportError,)
+        lookup_errors = transient_errors + (httpx.HTTPStatusError,)
+
+        pending = dict(pending)
+        keys: list[str] = list(pending)
+        results: dict[str, T] = {}
+        retries: int = self.config.retries if self.config is not None else 0
+        attempt: int = 0
+
+        while pending:
+            try:
+                response = await self.session.post(
+                    url, content=encode(list(pending.values()))
+                )
+            except transient_errors:
+                if attempt >= retries:
+                    raise
+            else:
+                if (
+                    response.status_code not in TRANSIENT_STATUS_CODES
+                    or attempt >= retries
+                ):
+                    response_dict = self._handle_response(response)
+                    results.update(zip(pending, decode(response_dict)))
+                    break
+
+            # The outcome is unknown, so nothing is posted again until every
+            # pending request has been looked up.
+            while True:
+                attempt += 1
+                backoff = self._get_backoff_time(attempt)
+                check_deadline(backoff)
+                await asyncio.sleep(backoff)
+
+                try:
+                    for key in list(pending):
+                        if (result := await recover(key)) is not None:
+                            results[key] = result
+                            del pending[key]
+                    break
+                except lookup_errors:
+                    if attempt >= retries:
+                        raise
+
+        return [results[key] for key in keys]
+
+    async def _get_if_exists(self, url: str) -> Optional[dict[str, Any]]:
+        """Retrieves a resource, returning None on a 404. See BaseService._get_if_exists."""
+        response = await self.session.get(url)
+
+        if response.status_code == 404:
+            return None
+
+        if response.status_code in TRANSIENT_STATUS_CODES:
+            response.raise_for_status()
+
+        response_dict: dict[str, Any] = self._handle_response(response)
+
+        return response_dict
+
+    async def _coalesce(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Awaits `fetch`, coalescing concurrent calls of the same key. See BaseService._coalesce."""
+        if self._single_flight is None:
+            return await fetch()
+        return await self._single_flight.do(key, fetch)
+
+    def _get_backoff_time(self, attempt: int) -> float:
+        if self.config is None or attempt <= 1:
+            return 0
+        backoff: float = self.config.backoff_factor * (2 ** (attempt - 1))
+        return backoff
@@ -3,6 +3,8 @@ from typing import Any, Self, Optional
 
 from attrs import define, field, validators
 
+from unofficial_shipengine.utils.deserialize import decode
+
 from .enums import (
     ChargeEvent,
     LabelFormat,
@@ -162,39 +164,4 @@ class Label:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        if "form_download" in data.keys() and data["form_download"] is not None:
-            form_download: URL = URL(**data.pop("form_download"))
-        else:
-            form_download = data.pop("form_download", None)
-
-        if (
-            "paperless_download" in data.keys()
-            and data["paperless_download"] is not None
-        ):
-            paperless_download: PaperlessDownload = PaperlessDownload(
-                **data.pop("paperless_download")
-            )
-        else:
-            paperless_download = data.pop("paperless_download", None)
-
-        label_download: LabelDownload = LabelDownload(**data.pop("label_download"))
-        shipment_cost: Value = Value(**data.pop("shipment_cost"))
-        insurance_cost: Value = Value(**data.pop("insurance_cost"))
-        requested_comparison_amount: Value = Value(
-            **data.pop("requested_comparison_amount")
-        )
-
-        packages: list[PackageLabel] = [
-            PackageLabel.from_dict(p) for p in data.pop("packages")
-        ]
-
-        return cls(
-            label_download=label_download,
-            form_download=form_download,
-            shipment_cost=shipment_cost,
-            insurance_cost=insurance_cost,
-            requested_comparison_amount=requested_comparison_amount,
-            paperless_download=paperless_download,
-            packages=packages,
-            **data
-        )
+        return decode(cls, data)
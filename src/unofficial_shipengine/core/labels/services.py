@@ -1,12 +1,21 @@
-import json
-from typing import Union
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable, Iterator, Union, Optional
 
-from attrs import asdict
+from attrs import evolve
 
-from unofficial_shipengine.utils.serialize import serializer
 from .models import Label, LabelRequest, ReturnLabelRequest
-from ..common.services import BaseService
+from ..common.services import (
+    BaseService,
+    AsyncBaseService,
+    BULK_MAX_WORKERS,
+    LIST_PAGE_SIZE,
+)
 from ..tracking.models import TrackingInformation
+from ...utils.bulk import BulkResult, async_run_bounded, result_of, run_bounded
+from ...utils.checkpoint import Checkpoint, CheckpointRun
+from ...utils.pagination import query_params
+from ...utils.templates import RequestTemplate
 
 
 class LabelService(BaseService):
@@ -17,12 +26,24 @@ class LabelService(BaseService):
         purchase_label(label_request: LabelRequest) -> Label:
             Purchases a shipping label.
 
+        purchase_labels(label_requests: Iterable[LabelRequest], max_workers: Optional[int], checkpoint: Optional[Checkpoint]) -> Iterator[BulkResult]:
+            Purchases any number of labels concurrently.
+
+        template(**shared: Any) -> RequestTemplate[LabelRequest]:
+            Creates a template for labels that share most of their fields.
+
+        purchase_label_from_template(template: RequestTemplate[LabelRequest], **varying: Any) -> Label:
+            Purchases a label that only differs from a template in a few fields.
+
         create_return_label(label: Union[Label, str], return_label_request: ReturnLabelRequest) -> Label:
             Creates a return label for an existing label.
 
         get_by_id(label_id: str) -> Label:
             Retrieves a label by its ID.
 
+        list_labels(status: Optional[Union[Label.Status, str]] = None, batch_id: Optional[str] = None, ...) -> Iterator[Label]:
+            Yields the labels matching the given filters, page after page.
+
         get_label_tracking_info(label: Union[Label, str]) -> TrackingInformation:
             Retrieves tracking information for a label.
     """
@@ -41,16 +62,183 @@ class LabelService(BaseService):
             ShipEngineAPIError: If the response from the API is invalid.
         """
         url = "https://api.shipengine.com/v1/labels"
-        json_data = json.dumps(asdict(label_request, value_serializer=serializer))
+
+        if self.config is not None and self.config.safe_post_retries:
+            return self._purchase_with_recovery(url, label_request)
+
+        json_data = self._dumps(label_request)
 
         response = self.session.post(url, data=json_data)
-        self._handle_response(response)
-        response_dict = response.json()
+        response_dict = self._handle_response(response)
+
+        label: Label = self._decode(Label, response_dict)
+
+        return label
+
+    def purchase_labels(
+        self,
+        label_requests: Iterable[LabelRequest],
+        max_workers: Optional[int] = None,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> Iterator[BulkResult[LabelRequest, Label]]:
+        """
+        Purchases any number of labels concurrently.
+
+        At most `max_workers` purchases are in flight, and the next request is only read from
+        `label_requests` once one finishes and its result has been consumed, so a generator of
+        any length can be passed. A purchase that fails only fails its own result.
+
+        With a checkpoint, every shipment needs an external_shipment_id. Labels the checkpoint
+        records as bought are fetched by ID instead of bought again, and purchases an earlier
+        run started but never saw the answer to are looked up by external_shipment_id first.
+
+        Args:
+            label_requests (Iterable[LabelRequest]): The labels to purchase.
+            max_workers (Optional[int]): The number of purchases in flight. Defaults to BULK_MAX_WORKERS for a client
+                created with thread_safe=True, and to 1 otherwise.
+            checkpoint (Optional[Checkpoint]): Records the progress, so the run can be resumed. Defaults to None.
+
+        Returns:
+            Iterator[BulkResult[LabelRequest, Label]]: A result per request, yielded as its purchase finishes.
+                `index` is the position of the request in `label_requests`.
+
+        Raises:
+            ValueError: If more than one worker is asked for on a client that is not thread_safe.
+        """
+        workers = self._bulk_workers(max_workers)
+        run = CheckpointRun(checkpoint) if checkpoint is not None else None
+
+        def purchase(item: tuple[int, LabelRequest]) -> Label:
+            _, label_request = item
+            if run is None:
+                return self.purchase_label(label_request)
+
+            key = label_request.shipment.external_shipment_id
+            recorded, label_id = run.claim(key)
+
+            if label_id is not None:
+                return self.get_by_id(label_id)
+            if recorded and (label := self._find_by_external_id(key)) is not None:
+                run.finish(key, label.label_id)
+                return label
+
+            run.start(key)
+            label = self.purchase_label(label_request)
+            run.finish(key, label.label_id)
+
+            return label
+
+        def results() -> Iterator[BulkResult[LabelRequest, Label]]:
+            for (index, label_request), future in run_bounded(
+                purchase, enumerate(label_requests), workers
+            ):
+                yield result_of(index, label_request, future)
+
+        return results()
+
+    def template(self, **shared: Any) -> RequestTemplate[LabelRequest]:
+        """
+        Creates a template for labels that share most of their fields.
+
+        The shared fields are encoded once, so purchasing labels from the template only
+        encodes the fields that differ. The shipment can itself be a template, see
+        ShipmentService.template, whose varying fields are then passed as a dict.
+
+        Args:
+            **shared (Any): The values of the shared LabelRequest fields.
+
+        Returns:
+            RequestTemplate[LabelRequest]: The template, for purchase_label_from_template.
+
+        Raises:
+            TypeError: If a shared field is not a field of LabelRequest.
+        """
+        return self._template(LabelRequest, **shared)
+
+    def purchase_label_from_template(
+        self, template: RequestTemplate[LabelRequest], **varying: Any
+    ) -> Label:
+        """
+        Purchases a label that only differs from a template in a few fields.
+
+        Args:
+            template (RequestTemplate[LabelRequest]): The template, see template.
+            **varying (Any): The fields of the label that differ from the template, e.g. shipment={"ship_to": address}.
+
+        Returns:
+            Label: The purchased Label object.
+
+        Raises:
+            TypeError: If a varying field is not a field of LabelRequest.
+            ShipEngineAPIError: If the response from the API is invalid.
+        """
+        url = "https://api.shipengine.com/v1/labels"
+
+        if self.config is not None and self.config.safe_post_retries:
+            # The generated external_shipment_id has to be set on the request, so it is
+            # built and encoded in full.
+            return self._purchase_with_recovery(url, template.build(**varying))
+
+        response = self.session.post(url, data=template.encode(**varying))
+        response_dict = self._handle_response(response)
+
+        label: Label = self._decode(Label, response_dict)
+
+        return label
+
+    def _purchase_with_recovery(self, url: str, label_request: LabelRequest) -> Label:
+        """
+        Purchases a label, retrying transient failures without buying the label twice.
+
+        A shipment without an external_shipment_id gets a generated one, which is used
+        to look up whether a failed attempt already purchased the label.
+
+        Args:
+            url (str): The labels endpoint.
+            label_request (LabelRequest): The request data for purchasing a label.
+
+        Returns:
+            Label: The purchased Label object.
 
-        label: Label = Label.from_dict(response_dict)
+        Raises:
+            ShipEngineAPIError: If the response from the API is invalid.
+        """
+        external_shipment_id = label_request.shipment.external_shipment_id
+
+        if not external_shipment_id:
+            external_shipment_id = uuid.uuid4().hex
+            label_request = evolve(
+                label_request,
+                shipment=evolve(
+                    label_request.shipment, external_shipment_id=external_shipment_id
+                ),
+            )
+
+        def encode(label_requests: list[LabelRequest]) -> bytes:
+            return self._dumps(label_requests[0])
+
+        def decode(response_dict: dict[str, Any]) -> list[Label]:
+            return [self._decode(Label, response_dict)]
+
+        [label] = self._post_with_recovery(
+            url,
+            {external_shipment_id: label_request},
+            encode,
+            decode,
+            self._find_by_external_id,
+        )
 
         return label
 
+    def _find_by_external_id(self, external_shipment_id: str) -> Optional[Label]:
+        url = (
+            f"https://api.shipengine.com/v1/labels/"
+            f"external_shipment_id/{external_shipment_id}"
+        )
+        response_dict = self._get_if_exists(url)
+
+        return self._decode(Label, response_dict) if response_dict else None
+
     def create_return_label(
         self, label: Union[Label, str], return_label_request: ReturnLabelRequest
     ) -> Label:
@@ -71,15 +259,12 @@ class LabelService(BaseService):
             label = label.label_id
 
         url = f"https://api.shipengine.com/v1/labels/{label}/return"
-        json_data = json.dumps(
-            asdict(return_label_request, value_serializer=serializer)
-        )
+        json_data = self._dumps(return_label_request)
 
         response = self.session.post(url, data=json_data)
-        self._handle_response(response)
-        response_dict = response.json()
+        response_dict = self._handle_response(response)
 
-        return_label: Label = Label.from_dict(response_dict)
+        return_label: Label = self._decode(Label, response_dict)
 
         return return_label
 
@@ -97,13 +282,54 @@ class LabelService(BaseService):
             ShipEngineAPIError: If the response from the API is invalid.
         """
         url = f"https://api.shipengine.com/v1/labels/{label_id}"
-        response = self.session.get(url)
-        self._handle_response(response)
-        response_dict = response.json()
 
-        label: Label = Label.from_dict(response_dict)
+        def fetch() -> Label:
+            response = self.session.get(url)
+            response_dict = self._handle_response(response)
 
-        return label
+            label: Label = self._decode(Label, response_dict)
+
+            return label
+
+        return self._coalesce(url, fetch)
+
+    def list_labels(
+        self,
+        status: Optional[Union[Label.Status, str]] = None,
+        batch_id: Optional[str] = None,
+        created_at_start: Optional[Union[datetime, str]] = None,
+        created_at_end: Optional[Union[datetime, str]] = None,
+        page_size: int = LIST_PAGE_SIZE,
+    ) -> Iterator[Label]:
+        """
+        Yields the labels matching the given filters, page after page.
+
+        Pages are fetched as the labels are consumed, and a thread_safe client prefetches the
+        next one, so the result set is never loaded whole.
+
+        Args:
+            status (Optional[Union[Label.Status, str]], optional): Only labels with this status.
+            batch_id (Optional[str], optional): Only labels of this batch.
+            created_at_start (Optional[Union[datetime, str]], optional): Only labels created at or after this time.
+            created_at_end (Optional[Union[datetime, str]], optional): Only labels created at or before this time.
+            page_size (int, optional): The number of labels per page. Defaults to LIST_PAGE_SIZE.
+
+        Returns:
+            Iterator[Label]: The labels.
+
+        Raises:
+            ShipEngineAPIError: If the response from the API is invalid.
+        """
+        url: str = "https://api.shipengine.com/v1/labels"
+        params = query_params(
+            label_status=status,
+            batch_id=batch_id,
+            created_at_start=created_at_start,
+            created_at_end=created_at_end,
+            page_size=page_size,
+        )
+
+        return self._paginate(url, Label, "labels", params)
 
     def get_label_tracking_info(self, label: Union[Label, str]) -> TrackingInformation:
         """
@@ -123,11 +349,199 @@ class LabelService(BaseService):
 
         url = f"https://api.shipengine.com/v1/labels/{label}/track"
         response = self.session.get(url)
-        self._handle_response(response)
-        response_dict = response.json()
+        response_dict = self._handle_response(response)
+
+        tracking_information: TrackingInformation = self._decode(
+            TrackingInformation, response_dict
+        )
+
+        return tracking_information
+
+
+class AsyncLabelService(AsyncBaseService):
+    """
+    AsyncLabelService is the awaitable counterpart of LabelService.
+
+    Every method takes the same arguments and returns the same models as its
+    LabelService equivalent.
+    """
+
+    async def purchase_label(self, label_request: LabelRequest) -> Label:
+        """Purchases a shipping label. See LabelService.purchase_label."""
+        url = "https://api.shipengine.com/v1/labels"
+
+        if self.config is not None and self.config.safe_post_retries:
+            return await self._purchase_with_recovery(url, label_request)
+
+        json_data = self._dumps(label_request)
+
+        response = await self.session.post(url, content=json_data)
+        response_dict = self._handle_response(response)
+
+        label: Label = self._decode(Label, response_dict)
+
+        return label
+
+    async def purchase_labels(
+        self,
+        label_requests: Iterable[LabelRequest],
+        max_workers: int = BULK_MAX_WORKERS,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> AsyncIterator[BulkResult[LabelRequest, Label]]:
+        """Purchases any number of labels concurrently. See LabelService.purchase_labels."""
+        run = None
+        if checkpoint is not None:
+            run = await CheckpointRun.load_async(checkpoint)
+
+        async def purchase(item: tuple[int, LabelRequest]) -> Label:
+            _, label_request = item
+            if run is None:
+                return await self.purchase_label(label_request)
+
+            key = label_request.shipment.external_shipment_id
+            recorded, label_id = run.claim(key)
+
+            if label_id is not None:
+                return await self.get_by_id(label_id)
+            if recorded and (label := await self._find_by_external_id(key)) is not None:
+                await run.finish_async(key, label.label_id)
+                return label
+
+            await run.start_async(key)
+            label = await self.purchase_label(label_request)
+            await run.finish_async(key, label.label_id)
+
+            return label
+
+        async for (index, label_request), task in async_run_bounded(
+            purchase, enumerate(label_requests), max_workers
+        ):
+            yield result_of(index, label_request, task)
+
+    async def _purchase_with_recovery(
+        self, url: str, label_request: LabelRequest
+    ) -> Label:
+        """Purchases a label without buying it twice. See LabelService._purchase_with_recovery."""
+        external_shipment_id = label_request.shipment.external_shipment_id
+
+        if not external_shipment_id:
+            external_shipment_id = uuid.uuid4().hex
+            label_request = evolve(
+                label_request,
+                shipment=evolve(
+                    label_request.shipment, external_shipment_id=external_shipment_id
+                ),
+            )
+
+        def encode(label_requests: list[LabelRequest]) -> bytes:
+            return self._dumps(label_requests[0])
+
+        def decode(response_dict: dict[str, Any]) -> list[Label]:
+            return [self._decode(Label, response_dict)]
+
+        [label] = await self._post_with_recovery(
+            url,
+            {external_shipment_id: label_request},
+            encode,
+            decode,
+            self._find_by_external_id,
+        )
+
+        return label
+
+    async def _find_by_external_id(self, external_shipment_id: str) -> Optional[Label]:
+        url = (
+            f"https://api.shipengine.com/v1/labels/"
+            f"external_shipment_id/{external_shipment_id}"
+        )
+        response_dict = await self._get_if_exists(url)
+
+        return self._decode(Label, response_dict) if response_dict else None
+
+    def template(self, **shared: Any) -> RequestTemplate[LabelRequest]:
+        """Creates a label request template. See LabelService.template."""
+        return self._template(LabelRequest, **shared)
+
+    async def purchase_label_from_template(
+        self, template: RequestTemplate[LabelRequest], **varying: Any
+    ) -> Label:
+        """Purchases a label from a template. See LabelService.purchase_label_from_template."""
+        url = "https://api.shipengine.com/v1/labels"
+
+        if self.config is not None and self.config.safe_post_retries:
+            return await self._purchase_with_recovery(url, template.build(**varying))
+
+        response = await self.session.post(url, content=template.encode(**varying))
+        response_dict = self._handle_response(response)
+
+        label: Label = self._decode(Label, response_dict)
+
+        return label
+
+    async def create_return_label(
+        self, label: Union[Label, str], return_label_request: ReturnLabelRequest
+    ) -> Label:
+        """Creates a return label for an existing label. See LabelService.create_return_label."""
+        if isinstance(label, Label):
+            label = label.label_id
+
+        url = f"https://api.shipengine.com/v1/labels/{label}/return"
+        json_data = self._dumps(return_label_request)
+
+        response = await self.session.post(url, content=json_data)
+        response_dict = self._handle_response(response)
+
+        return_label: Label = self._decode(Label, response_dict)
+
+        return return_label
+
+    async def get_by_id(self, label_id: str) -> Label:
+        """Retrieves a label by its ID. See LabelService.get_by_id."""
+        url = f"https://api.shipengine.com/v1/labels/{label_id}"
+
+        async def fetch() -> Label:
+            response = await self.session.get(url)
+            response_dict = self._handle_response(response)
+
+            label: Label = self._decode(Label, response_dict)
+
+            return label
+
+        return await self._coalesce(url, fetch)
+
+    def list_labels(
+        self,
+        status: Optional[Union[Label.Status, str]] = None,
+        batch_id: Optional[str] = None,
+        created_at_start: Optional[Union[datetime, str]] = None,
+        created_at_end: Optional[Union[datetime, str]] = None,
+        page_size: int = LIST_PAGE_SIZE,
+    ) -> AsyncIterator[Label]:
+        """Yields the labels matching the given filters. See LabelService.list_labels."""
+        url: str = "https://api.shipengine.com/v1/labels"
+        params = query_params(
+            label_status=status,
+            batch_id=batch_id,
+            created_at_start=created_at_start,
+            created_at_end=created_at_end,
+            page_size=page_size,
+        )
+
+        return self._paginate(url, Label, "labels", params)
+
+    async def get_label_tracking_info(
+        self, label: Union[Label, str]
+    ) -> TrackingInformation:
+        """Retrieves tracking information for a label. See LabelService.get_label_tracking_info."""
+        if isinstance(label, Label):
+            label = label.label_id
+
+        url = f"https://api.shipengine.com/v1/labels/{label}/track"
+        response = await self.session.get(url)
+        response_dict = self._handle_response(response)
 
-        tracking_information: TrackingInformation = TrackingInformation.from_dict(
-            response_dict
+        tracking_information: TrackingInformation = self._decode(
+            TrackingInformation, response_dict
         )
 
         return tracking_information
@@ -3,6 +3,8 @@ from typing import Self, Any
 
 from attrs import define, field, validators
 
+from unofficial_shipengine.utils.deserialize import decode
+
 from .enums import Confirmation, InsuranceProvider, OrderSourceCode
 from ..common.enums import ValidateAddress
 from ..common.models import (
@@ -236,19 +238,4 @@ class Shipment(ShipmentRequest):
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        ship_to = Address(**data.pop("ship_to"))
-        ship_from = Address(**data.pop("ship_from"))
-        return_to = Address(**data.pop("return_to"))
-        packages = [Package.from_dict(p) for p in data.pop("packages")]
-        total_weight = Weight(**data.pop("total_weight"))
-        advanced_options = AdvancedOptions(**data.pop("advanced_options"))
-
-        return cls(
-            ship_to=ship_to,
-            ship_from=ship_from,
-            advanced_options=advanced_options,
-            return_to=return_to,
-            packages=packages,
-            total_weight=total_weight,
-            **data,
-        )
+        return decode(cls, data)
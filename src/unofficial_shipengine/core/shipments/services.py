@@ -1,11 +1,51 @@
-import json
-from typing import Union
+import uuid
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Union,
+    Optional,
+    TYPE_CHECKING,
+)
+
+import requests
+from attrs import evolve
 
-from attrs import asdict
-
-from unofficial_shipengine.utils.serialize import serializer
 from .models import ShipmentRequest, Shipment
-from ..common.services import BaseService
+from ..common.services import (
+    BaseService,
+    AsyncBaseService,
+    BULK_CHUNK_SIZE,
+    BULK_MAX_WORKERS,
+    LIST_PAGE_SIZE,
+)
+from ...exceptions import BulkItemError, ShipEngineAPIError
+from ...unofficial_shipengine_config import UnofficialShipEngineConfig
+from ...utils.bulk import (
+    BulkResult,
+    async_run_bounded,
+    chunked,
+    results_of,
+    run_bounded,
+)
+from ...utils.micro_batch import AsyncMicroBatcher, MicroBatcher
+from ...utils.pagination import query_params
+from ...utils.templates import RequestTemplate
+
+if TYPE_CHECKING:
+    import httpx
+
+
+def _rejected(error: Exception) -> bool:
+    # A 4xx answer to a micro-batch means none of its shipments were created, so they are
+    # sent one by one and only the callers of invalid shipments get an error.
+    return (
+        isinstance(error, ShipEngineAPIError)
+        and error.status_code is not None
+        and 400 <= error.status_code < 500
+    )
 
 
 class ShipmentService(BaseService):
@@ -16,12 +56,24 @@ class ShipmentService(BaseService):
         create_shipment(shipment_request: Union[ShipmentRequest, list[ShipmentRequest]]) -> Union[Shipment, list[Shipment]]:
             Creates a shipment or a list of shipments.
 
+        create_shipments(shipment_requests: Iterable[ShipmentRequest], chunk_size: int, max_workers: Optional[int]) -> Iterator[BulkResult]:
+            Creates any number of shipments in chunks sent concurrently.
+
+        template(**shared: Any) -> RequestTemplate[ShipmentRequest]:
+            Creates a template for shipments that share most of their fields.
+
+        create_shipments_from_template(template: RequestTemplate[ShipmentRequest], variants: list[dict[str, Any]]) -> list[Shipment]:
+            Creates shipments that only differ from a template in a few fields.
+
         get_by_id(shipment_id: str) -> Shipment:
             Retrieves a shipment by its ID.
 
         get_by_external_id(external_shipment_id: str) -> Shipment:
             Retrieves a shipment by its external ID.
 
+        list_shipments(status: Optional[Union[Shipment.Status, str]] = None, batch_id: Optional[str] = None, ...) -> Iterator[Shipment]:
+            Yields the shipments matching the given filters, page after page.
+
         update_shipment(shipment: Shipment) -> Shipment:
             Updates an existing shipment.
 
@@ -29,12 +81,31 @@ class ShipmentService(BaseService):
             Cancels a shipment.
     """
 
+    def __init__(
+        self,
+        session: requests.Session,
+        config: Optional[UnofficialShipEngineConfig] = None,
+    ):
+        super().__init__(session, config)
+        self._batcher: Optional[MicroBatcher[ShipmentRequest, Shipment]] = None
+
+        if config is not None and config.micro_batch_size:
+            self._batcher = MicroBatcher(
+                self._create_shipments,
+                config.micro_batch_size,
+                config.micro_batch_delay,
+                _rejected,
+            )
+
     def create_shipment(
         self, shipment_request: Union[ShipmentRequest, list[ShipmentRequest]]
     ) -> Union[Shipment, list[Shipment]]:
         """
         Creates a shipment or a list of shipments.
 
+        With micro_batch_size configured, a single shipment is sent together with those of other
+        concurrent calls, see UnofficialShipEngineConfig.
+
         Args:
             shipment_request (Union[ShipmentRequest, list[ShipmentRequest]]): The shipment request or a list of shipment requests.
 
@@ -46,23 +117,187 @@ class ShipmentService(BaseService):
         """
         if isinstance(shipment_request, list):
             shipment_requests = shipment_request
+        elif self._batcher is not None:
+            return self._batcher.submit(shipment_request)
         else:
             shipment_requests = [shipment_request]
 
+        shipments = self._create_shipments(shipment_requests)
+
+        if isinstance(shipment_request, ShipmentRequest):
+            return shipments[0]
+
+        return shipments
+
+    def _create_shipments(
+        self, shipment_requests: list[ShipmentRequest]
+    ) -> list[Shipment]:
         url = "https://api.shipengine.com/v1/shipments"
-        data = [asdict(sr, value_serializer=serializer) for sr in shipment_requests]
-        json_data: str = json.dumps({"shipments": data})
+
+        if self.config is not None and self.config.safe_post_retries:
+            return self._create_with_recovery(url, shipment_requests)
+
+        json_data: bytes = self._dumps({"shipments": shipment_requests})
 
         response = self.session.post(url, data=json_data)
-        self._handle_response(response)
-        response_dict = response.json()
+        response_dict = self._handle_response(response)
 
-        shipments = [Shipment.from_dict(s) for s in response_dict["shipments"]]
+        return [self._decode(Shipment, s) for s in response_dict["shipments"]]
 
-        if isinstance(shipment_request, ShipmentRequest):
-            return shipments[0]
+    def create_shipments(
+        self,
+        shipment_requests: Iterable[ShipmentRequest],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[BulkResult[ShipmentRequest, Shipment]]:
+        """
+        Creates any number of shipments in chunks sent concurrently.
 
-        return shipments
+        The requests are split into chunks of `chunk_size` shipments, each sent as one request,
+        with at most `max_workers` of them in flight. Requests are read from `shipment_requests`
+        only as chunks are sent, so a generator of any length can be passed. A chunk that fails,
+        e.g. with a ShipEngineAPIError or a network error, only fails its own shipments, and a
+        shipment the API returned errors for gets a BulkItemError. With safe_post_retries, every
+        chunk is retried like create_shipment.
+
+        Args:
+            shipment_requests (Iterable[ShipmentRequest]): The shipments to create.
+            chunk_size (int): The number of shipments sent per request. Defaults to BULK_CHUNK_SIZE.
+            max_workers (Optional[int]): The number of requests in flight. Defaults to BULK_MAX_WORKERS for a client
+                created with thread_safe=True, and to 1, one chunk at a time, otherwise.
+
+        Returns:
+            Iterator[BulkResult[ShipmentRequest, Shipment]]: A result per request, yielded as its chunk finishes.
+                `index` is the position of the request in `shipment_requests`.
+
+        Raises:
+            ValueError: If more than one worker is asked for on a client that is not thread_safe.
+        """
+        workers = self._bulk_workers(max_workers)
+
+        def create(chunk: list[tuple[int, ShipmentRequest]]) -> list[Shipment]:
+            return self._create_shipments([sr for _, sr in chunk])
+
+        def results() -> Iterator[BulkResult[ShipmentRequest, Shipment]]:
+            chunks = chunked(enumerate(shipment_requests), chunk_size)
+            for chunk, future in run_bounded(create, chunks, workers):
+                yield from results_of(chunk, future, _shipment_error)
+
+        return results()
+
+    def template(self, **shared: Any) -> RequestTemplate[ShipmentRequest]:
+        """
+        Creates a template for shipments that share most of their fields.
+
+        The shared fields, e.g. carrier_id, service_code and ship_from, are encoded once, so
+        creating shipments from the template only encodes the fields that differ.
+
+        Args:
+            **shared (Any): The values of the shared ShipmentRequest fields.
+
+        Returns:
+            RequestTemplate[ShipmentRequest]: The template, for create_shipments_from_template.
+
+        Raises:
+            TypeError: If a shared field is not a field of ShipmentRequest.
+        """
+        return self._template(ShipmentRequest, **shared)
+
+    def create_shipments_from_template(
+        self,
+        template: RequestTemplate[ShipmentRequest],
+        variants: list[dict[str, Any]],
+    ) -> list[Shipment]:
+        """
+        Creates shipments that only differ from a template in a few fields.
+
+        Args:
+            template (RequestTemplate[ShipmentRequest]): The template, see template.
+            variants (list[dict[str, Any]]): The fields of each shipment that differ from the template, e.g. ship_to and packages.
+
+        Returns:
+            list[Shipment]: The created shipments, in the order of the variants.
+
+        Raises:
+            TypeError: If a variant has a field that is not a field of ShipmentRequest.
+            ShipEngineAPIError: If the response from the API is invalid.
+        """
+        url = "https://api.shipengine.com/v1/shipments"
+
+        if self.config is not None and self.config.safe_post_retries:
+            return self._create_from_template_with_recovery(url, template, variants)
+
+        response = self.session.post(url, data=_encode_variants(template, variants))
+        response_dict = self._handle_response(response)
+
+        return [self._decode(Shipment, s) for s in response_dict["shipments"]]
+
+    def _create_from_template_with_recovery(
+        self,
+        url: str,
+        template: RequestTemplate[ShipmentRequest],
+        variants: list[dict[str, Any]],
+    ) -> list[Shipment]:
+        """
+        Creates shipments from a template, retrying transient failures like _create_with_recovery.
+
+        Raises:
+            ValueError: If two variants share an external_shipment_id.
+        """
+
+        def encode(pending_variants: list[dict[str, Any]]) -> bytes:
+            return _encode_variants(template, pending_variants)
+
+        def decode(response_dict: dict[str, Any]) -> list[Shipment]:
+            return [self._decode(Shipment, s) for s in response_dict["shipments"]]
+
+        return self._post_with_recovery(
+            url, _pending_variants(variants), encode, decode, self._find_by_external_id
+        )
+
+    def _create_with_recovery(
+        self, url: str, shipment_requests: list[ShipmentRequest]
+    ) -> list[Shipment]:
+        """
+        Creates shipments, retrying transient failures without creating any shipment twice.
+
+        Requests without an external_shipment_id get a generated one, which is used to
+        look up whether a failed attempt already created the shipment.
+
+        Args:
+            url (str): The shipments endpoint.
+            shipment_requests (list[ShipmentRequest]): The shipments to create.
+
+        Returns:
+            list[Shipment]: The created shipments, in the order of the requests.
+
+        Raises:
+            ValueError: If two requests share an external_shipment_id.
+            ShipEngineAPIError: If the response from the API is invalid.
+        """
+
+        def encode(srs: list[ShipmentRequest]) -> bytes:
+            return self._dumps({"shipments": srs})
+
+        def decode(response_dict: dict[str, Any]) -> list[Shipment]:
+            return [self._decode(Shipment, s) for s in response_dict["shipments"]]
+
+        return self._post_with_recovery(
+            url,
+            _pending_requests(shipment_requests),
+            encode,
+            decode,
+            self._find_by_external_id,
+        )
+
+    def _find_by_external_id(self, external_shipment_id: str) -> Optional[Shipment]:
+        url = (
+            f"https://api.shipengine.com/v1/shipments/"
+            f"external_shipment_id/{external_shipment_id}"
+        )
+        response_dict = self._get_if_exists(url)
+
+        return self._decode(Shipment, response_dict) if response_dict else None
 
     def get_by_id(self, shipment_id: str) -> Shipment:
         """
@@ -79,11 +314,13 @@ class ShipmentService(BaseService):
         """
         url = f"https://api.shipengine.com/v1/shipments/{shipment_id}"
 
-        response = self.session.get(url)
-        self._handle_response(response)
-        response_dict = response.json()
+        def fetch() -> Shipment:
+            response = self.session.get(url)
+            response_dict = self._handle_response(response)
+
+            return self._decode(Shipment, response_dict)
 
-        return Shipment.from_dict(response_dict)
+        return self._coalesce(url, fetch)
 
     def get_by_external_id(self, external_shipment_id: str) -> Shipment:
         """
@@ -104,10 +341,47 @@ class ShipmentService(BaseService):
         )
 
         response = self.session.get(url)
-        self._handle_response(response)
-        response_dict = response.json()
+        response_dict = self._handle_response(response)
+
+        return self._decode(Shipment, response_dict)
+
+    def list_shipments(
+        self,
+        status: Optional[Union[Shipment.Status, str]] = None,
+        batch_id: Optional[str] = None,
+        created_at_start: Optional[Union[datetime, str]] = None,
+        created_at_end: Optional[Union[datetime, str]] = None,
+        page_size: int = LIST_PAGE_SIZE,
+    ) -> Iterator[Shipment]:
+        """
+        Yields the shipments matching the given filters, page after page.
+
+        Pages are fetched as the shipments are consumed, and a thread_safe client prefetches the
+        next one, so the result set is never loaded whole.
 
-        return Shipment.from_dict(response_dict)
+        Args:
+            status (Optional[Union[Shipment.Status, str]], optional): Only shipments with this status.
+            batch_id (Optional[str], optional): Only shipments of this batch.
+            created_at_start (Optional[Union[datetime, str]], optional): Only shipments created at or after this time.
+            created_at_end (Optional[Union[datetime, str]], optional): Only shipments created at or before this time.
+            page_size (int, optional): The number of shipments per page. Defaults to LIST_PAGE_SIZE.
+
+        Returns:
+            Iterator[Shipment]: The shipments.
+
+        Raises:
+            ShipEngineAPIError: If the response from the API is invalid.
+        """
+        url: str = "https://api.shipengine.com/v1/shipments"
+        params = query_params(
+            shipment_status=status,
+            batch_id=batch_id,
+            created_at_start=created_at_start,
+            created_at_end=created_at_end,
+            page_size=page_size,
+        )
+
+        return self._paginate(url, Shipment, "shipments", params)
 
     def update_shipment(self, shipment: Shipment) -> Shipment:
         """
@@ -123,13 +397,12 @@ class ShipmentService(BaseService):
             ShipEngineAPIError: If the response from the API is invalid.
         """
         url = f"https://api.shipengine.com/v1/shipments/{shipment.shipment_id}"
-        json_data = json.dumps(asdict(shipment, value_serializer=serializer))
+        json_data = self._dumps(shipment)
 
         response = self.session.put(url, data=json_data)
-        self._handle_response(response)
-        response_dict = response.json()
+        response_dict = self._handle_response(response)
 
-        return Shipment.from_dict(response_dict)
+        return self._decode(Shipment, response_dict)
 
     def cancel_shipment(self, shipment: Union[Shipment, str]) -> None:
         """
@@ -147,3 +420,257 @@ class ShipmentService(BaseService):
         url = f"https://api.shipengine.com/v1/shipments/{shipment}/cancel"
         response = self.session.put(url)
         self._handle_response(response)
+
+
+class AsyncShipmentService(AsyncBaseService):
+    """
+    AsyncShipmentService is the awaitable counterpart of ShipmentService.
+
+    Every method takes the same arguments and returns the same models as its
+    ShipmentService equivalent.
+    """
+
+    def __init__(
+        self,
+        session: "httpx.AsyncClient",
+        config: Optional[UnofficialShipEngineConfig] = None,
+    ):
+        super().__init__(session, config)
+        self._batcher: Optional[AsyncMicroBatcher[ShipmentRequest, Shipment]] = None
+
+        if config is not None and config.micro_batch_size:
+            self._batcher = AsyncMicroBatcher(
+                self._create_shipments,
+                config.micro_batch_size,
+                config.micro_batch_delay,
+                _rejected,
+            )
+
+    async def create_shipment(
+        self, shipment_request: Union[ShipmentRequest, list[ShipmentRequest]]
+    ) -> Union[Shipment, list[Shipment]]:
+        """Creates a shipment or a list of shipments. See ShipmentService.create_shipment."""
+        if isinstance(shipment_request, list):
+            shipment_requests = shipment_request
+        elif self._batcher is not None:
+            return await self._batcher.submit(shipment_request)
+        else:
+            shipment_requests = [shipment_request]
+
+        shipments = await self._create_shipments(shipment_requests)
+
+        if isinstance(shipment_request, ShipmentRequest):
+            return shipments[0]
+
+        return shipments
+
+    async def _create_shipments(
+        self, shipment_requests: list[ShipmentRequest]
+    ) -> list[Shipment]:
+        url = "https://api.shipengine.com/v1/shipments"
+
+        if self.config is not None and self.config.safe_post_retries:
+            return await self._create_with_recovery(url, shipment_requests)
+
+        json_data: bytes = self._dumps({"shipments": shipment_requests})
+
+        response = await self.session.post(url, content=json_data)
+        response_dict = self._handle_response(response)
+
+        return [self._decode(Shipment, s) for s in response_dict["shipments"]]
+
+    async def create_shipments(
+        self,
+        shipment_requests: Iterable[ShipmentRequest],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        max_workers: int = BULK_MAX_WORKERS,
+    ) -> AsyncIterator[BulkResult[ShipmentRequest, Shipment]]:
+        """Creates any number of shipments in chunks sent concurrently. See ShipmentService.create_shipments."""
+
+        async def create(chunk: list[tuple[int, ShipmentRequest]]) -> list[Shipment]:
+            return await self._create_shipments([sr for _, sr in chunk])
+
+        chunks = chunked(enumerate(shipment_requests), chunk_size)
+        async for chunk, task in async_run_bounded(create, chunks, max_workers):
+            for result in results_of(chunk, task, _shipment_error):
+                yield result
+
+    def template(self, **shared: Any) -> RequestTemplate[ShipmentRequest]:
+        """Creates a shipment request template. See ShipmentService.template."""
+        return self._template(ShipmentRequest, **shared)
+
+    async def create_shipments_from_template(
+        self,
+        template: RequestTemplate[ShipmentRequest],
+        variants: list[dict[str, Any]],
+    ) -> list[Shipment]:
+        """Creates shipments from a template. See ShipmentService.create_shipments_from_template."""
+        url = "https://api.shipengine.com/v1/shipments"
+
+        if self.config is not None and self.config.safe_post_retries:
+            return await self._create_from_template_with_recovery(
+                url, template, variants
+            )
+
+        response = await self.session.post(
+            url, content=_encode_variants(template, variants)
+        )
+        response_dict = self._handle_response(response)
+
+        return [self._decode(Shipment, s) for s in response_dict["shipments"]]
+
+    async def _create_from_template_with_recovery(
+        self,
+        url: str,
+        template: RequestTemplate[ShipmentRequest],
+        variants: list[dict[str, Any]],
+    ) -> list[Shipment]:
+        """Creates shipments from a template without duplicates. See ShipmentService._create_from_template_with_recovery."""
+
+        def encode(pending_variants: list[dict[str, Any]]) -> bytes:
+            return _encode_variants(template, pending_variants)
+
+        def decode(response_dict: dict[str, Any]) -> list[Shipment]:
+            return [self._decode(Shipment, s) for s in response_dict["shipments"]]
+
+        return await self._post_with_recovery(
+            url, _pending_variants(variants), encode, decode, self._find_by_external_id
+        )
+
+    async def _create_with_recovery(
+        self, url: str, shipment_requests: list[ShipmentRequest]
+    ) -> list[Shipment]:
+        """Creates shipments without creating any twice. See ShipmentService._create_with_recovery."""
+
+        def encode(srs: list[ShipmentRequest]) -> bytes:
+            return self._dumps({"shipments": srs})
+
+        def decode(response_dict: dict[str, Any]) -> list[Shipment]:
+            return [self._decode(Shipment, s) for s in response_dict["shipments"]]
+
+        return await self._post_with_recovery(
+            url,
+            _pending_requests(shipment_requests),
+            encode,
+            decode,
+            self._find_by_external_id,
+        )
+
+    async def _find_by_external_id(
+        self, external_shipment_id: str
+    ) -> Optional[Shipment]:
+        url = (
+            f"https://api.shipengine.com/v1/shipments/"
+            f"external_shipment_id/{external_shipment_id}"
+        )
+        response_dict = await self._get_if_exists(url)
+
+        return self._decode(Shipment, response_dict) if response_dict else None
+
+    async def get_by_id(self, shipment_id: str) -> Shipment:
+        """Retrieves a shipment by its ID. See ShipmentService.get_by_id."""
+        url = f"https://api.shipengine.com/v1/shipments/{shipment_id}"
+
+        async def fetch() -> Shipment:
+            response = await self.session.get(url)
+            response_dict = self._handle_response(response)
+
+            return self._decode(Shipment, response_dict)
+
+        return await self._coalesce(url, fetch)
+
+    async def get_by_external_id(self, external_shipment_id: str) -> Shipment:
+        """Retrieves a shipment by its external ID. See ShipmentService.get_by_external_id."""
+        url = (
+            f"https://api.shipengine.com/v1/shipments/"
+            f"external_shipment_id/{external_shipment_id}"
+        )
+
+        response = await self.session.get(url)
+        response_dict = self._handle_response(response)
+
+        return self._decode(Shipment, response_dict)
+
+    def list_shipments(
+        self,
+        status: Optional[Union[Shipment.Status, str]] = None,
+        batch_id: Optional[str] = None,
+        created_at_start: Optional[Union[datetime, str]] = None,
+        created_at_end: Optional[Union[datetime, str]] = None,
+        page_size: int = LIST_PAGE_SIZE,
+    ) -> AsyncIterator[Shipment]:
+        """Yields the shipments matching the given filters. See ShipmentService.list_shipments."""
+        url: str = "https://api.shipengine.com/v1/shipments"
+        params = query_params(
+            shipment_status=status,
+            batch_id=batch_id,
+            created_at_start=created_at_start,
+            created_at_end=created_at_end,
+            page_size=page_size,
+        )
+
+        return self._paginate(url, Shipment, "shipments", params)
+
+    async def update_shipment(self, shipment: Shipment) -> Shipment:
+        """Updates an existing shipment. See ShipmentService.update_shipment."""
+        url = f"https://api.shipengine.com/v1/shipments/{shipment.shipment_id}"
+        json_data = self._dumps(shipment)
+
+        response = await self.session.put(url, content=json_data)
+        response_dict = self._handle_response(response)
+
+        return self._decode(Shipment, response_dict)
+
+    async def cancel_shipment(self, shipment: Union[Shipment, str]) -> None:
+        """Cancels a shipment. See ShipmentService.cancel_shipment."""
+        if isinstance(shipment, Shipment):
+            shipment = shipment.shipment_id
+
+        url = f"https://api.shipengine.com/v1/shipments/{shipment}/cancel"
+        response = await self.session.put(url)
+        self._handle_response(response)
+
+
+def _pending_requests(
+    shipment_requests: list[ShipmentRequest],
+) -> dict[str, ShipmentRequest]:
+    # Keys every request by its external_shipment_id, generating the missing ones.
+    pending: dict[str, ShipmentRequest] = {}
+
+    for sr in shipment_requests:
+        if not sr.external_shipment_id:
+            sr = evolve(sr, external_shipment_id=uuid.uuid4().hex)
+        if sr.external_shipment_id in pending:
+            raise ValueError(
+                f"Duplicate external_shipment_id: {sr.external_shipment_id}"
+            )
+        pending[sr.external_shipment_id] = sr
+
+    return pending
+
+
+def _pending_variants(variants: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    # Keys every variant by its external_shipment_id, generating the missing ones.
+    pending: dict[str, dict[str, Any]] = {}
+
+    for variant in variants:
+        external_id = variant.get("external_shipment_id")
+        if not external_id:
+            external_id = uuid.uuid4().hex
+            variant = {**variant, "external_shipment_id": external_id}
+        if external_id in pending:
+            raise ValueError(f"Duplicate external_shipment_id: {external_id}")
+        pending[external_id] = variant
+
+    return pending
+
+
+def _encode_variants(
+    template: RequestTemplate[ShipmentRequest], variants: list[dict[str, Any]]
+) -> bytes:
+    shipments = b",".join([template.encode(**variant) for variant in variants])
+    return b'{"shipments":[' + shipments + b"]}"
+
+
+def _shipment_error(shipment: Shipment) -> Optional[BulkItemError]:
+    return BulkItemError(shipment.errors) if shipment.errors else None
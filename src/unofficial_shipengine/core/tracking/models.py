@@ -2,6 +2,8 @@ from typing import Any, Self
 
 from attrs import define
 
+from unofficial_shipengine.utils.deserialize import decode
+
 from .enums import TrackingStatusCode
 
 
@@ -46,5 +48,4 @@ class TrackingInformation:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        events: list[TrackEvent] = [TrackEvent(**e) for e in data.pop("events")]
-        return cls(events=events, **data)
+        return decode(cls, data)
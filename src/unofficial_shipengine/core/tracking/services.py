@@ -1,5 +1,5 @@
 from unofficial_shipengine.core.tracking.models import TrackingInformation
-from ..common.services import BaseService
+from ..common.services import BaseService, AsyncBaseService
 
 
 class TrackingService(BaseService):
@@ -36,15 +36,17 @@ class TrackingService(BaseService):
         url = "https://api.shipengine.com/v1/tracking"
         params = {"carrier_code": carrier_code, "tracking_number": tracking_number}
 
-        response = self.session.get(url, params=params)
-        self._handle_response(response)
-        response_dict = response.json()
+        def fetch() -> TrackingInformation:
+            response = self.session.get(url, params=params)
+            response_dict = self._handle_response(response)
+
+            tracking_information: TrackingInformation = self._decode(
+                TrackingInformation, response_dict
+            )
 
-        tracking_information: TrackingInformation = TrackingInformation.from_dict(
-            response_dict
-        )
+            return tracking_information
 
-        return tracking_information
+        return self._coalesce((url, carrier_code, tracking_number), fetch)
 
     def start_tracking_package(self, carrier_code: str, tracking_number: str) -> None:
         """
@@ -90,3 +92,51 @@ class TrackingService(BaseService):
         params = {"carrier_code": carrier_code, "tracking_number": tracking_number}
         response = self.session.post(url, params=params)
         self._handle_response(response)
+
+
+class AsyncTrackingService(AsyncBaseService):
+    """
+    AsyncTrackingService is the awaitable counterpart of TrackingService.
+
+    Every method takes the same arguments and returns the same models as its
+    TrackingService equivalent.
+    """
+
+    async def get_tracking_information(
+        self, carrier_code: str, tracking_number: str
+    ) -> TrackingInformation:
+        """Retrieves tracking information for a package. See TrackingService.get_tracking_information."""
+        url = "https://api.shipengine.com/v1/tracking"
+        params = {"carrier_code": carrier_code, "tracking_number": tracking_number}
+
+        async def fetch() -> TrackingInformation:
+            response = await self.session.get(url, params=params)
+            response_dict = self._handle_response(response)
+
+            tracking_information: TrackingInformation = self._decode(
+                TrackingInformation, response_dict
+            )
+
+            return tracking_information
+
+        return await self._coalesce((url, carrier_code, tracking_number), fetch)
+
+    async def start_tracking_package(
+        self, carrier_code: str, tracking_number: str
+    ) -> None:
+        """Starts tracking a package. See TrackingService.start_tracking_package."""
+        await self._track_package("start", carrier_code, tracking_number)
+
+    async def stop_tracking_package(
+        self, carrier_code: str, tracking_number: str
+    ) -> None:
+        """Stops tracking a package. See TrackingService.stop_tracking_package."""
+        await self._track_package("stop", carrier_code, tracking_number)
+
+    async def _track_package(
+        self, action: str, carrier_code: str, tracking_number: str
+    ) -> None:
+        url = f"https://api.shipengine.com/v1/tracking/{action}"
+        params = {"carrier_code": carrier_code, "tracking_number": tracking_number}
+        response = await self.session.post(url, params=params)
+        self._handle_response(response)
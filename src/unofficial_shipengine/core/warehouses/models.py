@@ -2,6 +2,8 @@ from typing import Self, Any
 
 from attrs import define, field
 
+from unofficial_shipengine.utils.deserialize import decode
+
 from ..common.models import Address
 
 
@@ -24,6 +26,4 @@ class Warehouse:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        origin_address: Address = Address(**data.pop("origin_address"))
-        return_address: Address = Address(**data.pop("return_address"))
-        return cls(origin_address=origin_address, return_address=return_address, **data)
+        return decode(cls, data)
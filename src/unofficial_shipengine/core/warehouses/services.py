@@ -1,11 +1,14 @@
-import json
-from typing import Union
+from typing import Optional, Union, TYPE_CHECKING
 
-from attrs import asdict
+import requests
 
-from unofficial_shipengine.utils.serialize import serializer
 from .models import WarehouseRequest, Warehouse
-from ..common.services import BaseService
+from ..common.services import BaseService, AsyncBaseService
+from ...unofficial_shipengine_config import UnofficialShipEngineConfig
+from ...utils.cache import TTLCache
+
+if TYPE_CHECKING:
+    import httpx
 
 
 class WarehouseService(BaseService):
@@ -19,10 +22,18 @@ class WarehouseService(BaseService):
         delete_warehouse(warehouse: Union[Warehouse, str]) -> None:
             Deletes a warehouse.
 
-        get_by_id(warehouse_id: str) -> Warehouse:
+        get_by_id(warehouse_id: str, refresh: bool = False) -> Warehouse:
             Retrieves a warehouse by its ID.
     """
 
+    def __init__(
+        self,
+        session: requests.Session,
+        config: Optional[UnofficialShipEngineConfig] = None,
+    ):
+        super().__init__(session, config)
+        self._cache: Optional[TTLCache[str, Warehouse]] = _warehouse_cache(config)
+
     def create_warehouse(self, warehouse_request: WarehouseRequest) -> Warehouse:
         """
         Create a new warehouse.
@@ -36,13 +47,16 @@ class WarehouseService(BaseService):
         Raises:
             ShipEngineAPIError: If the request to create the warehouse fails.
         """
-        data: str = json.dumps(asdict(warehouse_request, value_serializer=serializer))
+        data: bytes = self._dumps(warehouse_request)
         url = "https://api.shipengine.com/v1/warehouses"
         response = self.session.post(url, data=data)
-        response_dict = json.loads(response.text)
-        self._handle_response(response)
+        response_dict = self._handle_response(response)
 
-        return Warehouse.from_dict(response_dict)
+        warehouse: Warehouse = self._decode(Warehouse, response_dict)
+        if self._cache is not None:
+            self._cache.put(warehouse.warehouse_id, warehouse)
+
+        return warehouse
 
     def delete_warehouse(self, warehouse: Union[Warehouse, str]) -> None:
         """
@@ -58,15 +72,23 @@ class WarehouseService(BaseService):
             warehouse = warehouse.warehouse_id
 
         url = f"https://api.shipengine.com/v1/warehouses/{warehouse}"
-        response = self.session.delete(url)
-        self._handle_response(response)
-
-    def get_by_id(self, warehouse_id: str) -> Warehouse:
+        try:
+            response = self.session.delete(url)
+            self._handle_response(response)
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(warehouse)
+
+    def get_by_id(self, warehouse_id: str, refresh: bool = False) -> Warehouse:
         """
         Retrieve a warehouse by its ID.
 
+        With warehouse_cache enabled, a warehouse created, or retrieved within warehouse_cache_ttl
+        seconds, is returned without a request.
+
         Args:
             warehouse_id (str): The ID of the warehouse to retrieve.
+            refresh (bool, optional): Whether to retrieve the warehouse even if it is cached. Defaults to False.
 
         Returns:
             Warehouse: An object representing the retrieved warehouse.
@@ -74,11 +96,89 @@ class WarehouseService(BaseService):
         Raises:
             ShipEngineAPIError: If the request to retrieve the warehouse fails.
         """
+        generation = None
+        if self._cache is not None:
+            if not refresh and (cached := self._cache.get(warehouse_id)) is not None:
+                return cached
+            # A delete_warehouse finishing while the request is in flight stops the
+            # response from being cached.
+            generation = self._cache.generation(warehouse_id)
+
         url = f"https://api.shipengine.com/v1/warehouses/{warehouse_id}"
         response = self.session.get(url)
-        response_dict = json.loads(response.text)
-        self._handle_response(response)
+        response_dict = self._handle_response(response)
 
-        warehouse: Warehouse = Warehouse.from_dict(response_dict)
+        warehouse: Warehouse = self._decode(Warehouse, response_dict)
+        if self._cache is not None:
+            self._cache.put(warehouse_id, warehouse, generation)
 
         return warehouse
+
+
+class AsyncWarehouseService(AsyncBaseService):
+    """
+    AsyncWarehouseService is the awaitable counterpart of WarehouseService.
+
+    Every method takes the same arguments and returns the same models as its
+    WarehouseService equivalent.
+    """
+
+    def __init__(
+        self,
+        session: "httpx.AsyncClient",
+        config: Optional[UnofficialShipEngineConfig] = None,
+    ):
+        super().__init__(session, config)
+        self._cache: Optional[TTLCache[str, Warehouse]] = _warehouse_cache(config)
+
+    async def create_warehouse(self, warehouse_request: WarehouseRequest) -> Warehouse:
+        """Create a new warehouse. See WarehouseService.create_warehouse."""
+        data: bytes = self._dumps(warehouse_request)
+        url = "https://api.shipengine.com/v1/warehouses"
+        response = await self.session.post(url, content=data)
+        response_dict = self._handle_response(response)
+
+        warehouse: Warehouse = self._decode(Warehouse, response_dict)
+        if self._cache is not None:
+            self._cache.put(warehouse.warehouse_id, warehouse)
+
+        return warehouse
+
+    async def delete_warehouse(self, warehouse: Union[Warehouse, str]) -> None:
+        """Delete a warehouse. See WarehouseService.delete_warehouse."""
+        if isinstance(warehouse, Warehouse):
+            warehouse = warehouse.warehouse_id
+
+        url = f"https://api.shipengine.com/v1/warehouses/{warehouse}"
+        try:
+            response = await self.session.delete(url)
+            self._handle_response(response)
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(warehouse)
+
+    async def get_by_id(self, warehouse_id: str, refresh: bool = False) -> Warehouse:
+        """Retrieve a warehouse by its ID. See WarehouseService.get_by_id."""
+        generation = None
+        if self._cache is not None:
+            if not refresh and (cached := self._cache.get(warehouse_id)) is not None:
+                return cached
+            generation = self._cache.generation(warehouse_id)
+
+        url = f"https://api.shipengine.com/v1/warehouses/{warehouse_id}"
+        response = await self.session.get(url)
+        response_dict = self._handle_response(response)
+
+        warehouse: Warehouse = self._decode(Warehouse, response_dict)
+        if self._cache is not None:
+            self._cache.put(warehouse_id, warehouse, generation)
+
+        return warehouse
+
+
+def _warehouse_cache(
+    config: Optional[UnofficialShipEngineConfig],
+) -> Optional[TTLCache[str, Warehouse]]:
+    if config is None or not config.warehouse_cache:
+        return None
+    return TTLCache(config.warehouse_cache_ttl)
@@ -1,10 +1,53 @@
+from typing import Optional
+
+
 class ShipEngineAPIError(Exception):
     """Base class for all ShipEngine API errors."""
 
-    def __init__(self, request_id: str, errors: list[str]):
+    def __init__(
+        self, request_id: str, errors: list[str], status_code: Optional[int] = None
+    ):
         self.request_id = request_id
         self.errors = errors
+        self.status_code = status_code
         super().__init__(self._format_message())
 
     def _format_message(self):
         return f"ShipEngine API Error (Request ID: {self.request_id}): {self.errors}"
+
+
+class DeadlineExceededError(Exception):
+    """Raised when a request cannot be completed before the deadline set with `deadline`."""
+
+    def __init__(self, remaining: float):
+        self.remaining = remaining
+        super().__init__(self._format_message())
+
+    def _format_message(self):
+        return f"Deadline exceeded ({max(0.0, self.remaining):.3f}s left)"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint family whose circuit breaker is open."""
+
+    def __init__(self, family: str, retry_after: float):
+        self.family = family
+        self.retry_after = retry_after
+        super().__init__(self._format_message())
+
+    def _format_message(self):
+        return (
+            f"Circuit open for {self.family} endpoints "
+            f"(retry in {max(0.0, self.retry_after):.3f}s)"
+        )
+
+
+class BulkItemError(Exception):
+    """Reported in the BulkResult of an item the API returned errors for in an otherwise successful bulk call."""
+
+    def __init__(self, errors: list[str]):
+        self.errors = errors
+        super().__init__(self._format_message())
+
+    def _format_message(self):
+        return f"ShipEngine API Error for bulk item: {self.errors}"
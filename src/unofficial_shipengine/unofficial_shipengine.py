@@ -1,15 +1,30 @@
-from typing import Union, Mapping, Any
+from contextlib import AbstractContextManager
+from types import TracebackType
+from typing import Union, Mapping, Any, Optional, Self, TYPE_CHECKING
 
 import requests
-from requests.adapters import HTTPAdapter, Retry
-
-from .core.batches.services import BatchService
-from .core.carriers.services import CarrierService
-from .core.labels.services import LabelService
-from .core.shipments.services import ShipmentService
-from .core.tracking.services import TrackingService
-from .core.warehouses.services import WarehouseService
+
+from .core.batches.services import BatchService, AsyncBatchService
+from .core.carriers.services import CarrierService, AsyncCarrierService
+from .core.labels.services import LabelService, AsyncLabelService
+from .core.shipments.services import ShipmentService, AsyncShipmentService
+from .core.tracking.services import TrackingService, AsyncTrackingService
+from .core.warehouses.services import WarehouseService, AsyncWarehouseService
 from .unofficial_shipengine_config import UnofficialShipEngineConfig
+from .utils.adapters import ShipEngineHTTPAdapter, PoolStats, DeadlineRetry
+from .utils.circuit_breaker import CircuitBreakers
+from .utils.rate_limit import RateLimiter
+from .utils.sessions import ThreadLocalSession
+from .utils.timeouts import EndpointTimeouts, deadline
+
+if TYPE_CHECKING:
+    import httpx
+
+# Connection pool limits for AsyncUnofficialShipEngine, sized so one event loop
+# can keep a few hundred requests in flight over keep-alive connections.
+ASYNC_MAX_CONNECTIONS: int = 200
+ASYNC_MAX_KEEPALIVE_CONNECTIONS: int = 200
+ASYNC_KEEPALIVE_EXPIRY: float = 30.0
 
 
 class UnofficialShipEngine:
@@ -22,20 +37,30 @@ class UnofficialShipEngine:
         """
         Initializes the UnofficialShipEngine client with the provided configuration.
 
+        Connection pool activity is counted in the `pool_stats` attribute. When `rate_limit` is
+        configured, the `rate_limiter` attribute holds the token bucket shared by every request.
+        The `timeouts` attribute holds the timeout applied to each endpoint class. When `circuit_breaker`
+        is configured, `circuit_breakers` holds the circuit of each endpoint family, use its
+        `add_listener` method to be notified when one changes state.
+
         Args:
             config (Union[UnofficialShipEngineConfig, dict[str, Union[float, int, str]], str]):
                 The configuration for the ShipEngine client. It can be an UnofficialShipEngineConfig object,
                 a dictionary, or a string representing just the API key and the rest of the values will default.
         """
         self.config = self._parse_config(config)
+        self.pool_stats = PoolStats()
+        self.rate_limiter = self._create_rate_limiter(self.config)
+        self.timeouts = self._create_timeouts(self.config)
+        self.circuit_breakers = self._create_circuit_breakers(self.config)
         self._session = self._create_session()
 
-        self.shipments = ShipmentService(self._session)
-        self.carriers = CarrierService(self._session)
-        self.batches = BatchService(self._session)
-        self.warehouses = WarehouseService(self._session)
-        self.labels = LabelService(self._session)
-        self.tracking = TrackingService(self._session)
+        self.shipments = ShipmentService(self._session, self.config)
+        self.carriers = CarrierService(self._session, self.config)
+        self.batches = BatchService(self._session, self.config)
+        self.warehouses = WarehouseService(self._session, self.config)
+        self.labels = LabelService(self._session, self.config)
+        self.tracking = TrackingService(self._session, self.config)
 
     @staticmethod
     def _parse_config(
@@ -64,26 +89,220 @@ class UnofficialShipEngine:
         else:
             raise ValueError("Invalid configuration type provided")
 
+    @staticmethod
+    def _create_rate_limiter(
+        config: UnofficialShipEngineConfig,
+    ) -> Optional[RateLimiter]:
+        """
+        Creates the rate limiter described by the configuration.
+
+        Args:
+            config (UnofficialShipEngineConfig): The client configuration.
+
+        Returns:
+            Optional[RateLimiter]: The rate limiter, or None if rate limiting is not configured.
+        """
+        if config.rate_limit is None:
+            return None
+
+        return RateLimiter(
+            config.rate_limit,
+            burst=config.rate_limit_burst,
+            backend=config.rate_limit_backend,
+        )
+
+    @staticmethod
+    def deadline(seconds: float) -> AbstractContextManager[None]:
+        """
+        Caps the total time of the API calls made inside a `with` block.
+
+        The budget covers every retry and backoff sleep of every call in the block, and each
+        attempt's timeouts are cut to the time left. Calls that cannot finish in time raise
+        DeadlineExceededError.
+
+        Args:
+            seconds (float): The time budget, in seconds.
+
+        Returns:
+            AbstractContextManager[None]: The context manager enforcing the deadline.
+        """
+        return deadline(seconds)
+
+    @staticmethod
+    def _create_timeouts(config: UnofficialShipEngineConfig) -> EndpointTimeouts:
+        """
+        Creates the per endpoint class timeouts described by the configuration.
+
+        Args:
+            config (UnofficialShipEngineConfig): The client configuration.
+
+        Returns:
+            EndpointTimeouts: The timeouts of each endpoint class.
+        """
+        return EndpointTimeouts(
+            connect=config.connect_timeout,
+            default=config.read_timeout,
+            label_purchase=config.label_purchase_timeout,
+            tracking=config.tracking_timeout,
+            batch_processing=config.batch_processing_timeout,
+        )
+
+    @staticmethod
+    def _create_circuit_breakers(
+        config: UnofficialShipEngineConfig,
+    ) -> Optional[CircuitBreakers]:
+        """
+        Creates the circuit breakers described by the configuration.
+
+        Args:
+            config (UnofficialShipEngineConfig): The client configuration.
+
+        Returns:
+            Optional[CircuitBreakers]: The circuit breakers, or None if they are not configured.
+        """
+        if config.circuit_breaker is None:
+            return None
+
+        return CircuitBreakers(config.circuit_breaker)
+
     def _create_session(self) -> requests.Session:
         """
         Creates a configured requests session for making API calls.
 
+        With `thread_safe` enabled the returned session hands every thread its own session,
+        all of them mounted on the same adapter and therefore sharing one connection pool.
+
         Returns:
-            requests.Session: The configured session with headers and retry strategy.
+            requests.Session: The configured session with headers, connection pool and retry strategy.
         """
-        session = requests.Session()
-        session.headers = {
-            "Host": "api.shipengine.com",
-            "API-Key": self.config.api_key,
-            "Content-Type": "application/json",
-        }
-
-        retry = Retry(
+        retry = DeadlineRetry(
             total=self.config.retries,
             backoff_factor=self.config.backoff_factor,
             status_forcelist=[500, 502, 503, 504],
         )
 
-        session.mount("https://", HTTPAdapter(max_retries=retry))
+        adapter = ShipEngineHTTPAdapter(
+            pool_stats=self.pool_stats,
+            pool_idle_timeout=self.config.pool_idle_timeout,
+            rate_limiter=self.rate_limiter,
+            timeouts=self.timeouts,
+            circuit_breakers=self.circuit_breakers,
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block,
+            max_retries=retry,
+        )
 
-        return session
+        def session_factory() -> requests.Session:
+            session = requests.Session()
+            session.headers = {
+                "Host": "api.shipengine.com",
+                "API-Key": self.config.api_key,
+                "Content-Type": "application/json",
+            }
+            session.mount("https://", adapter)
+            return session
+
+        if self.config.thread_safe:
+            return ThreadLocalSession(session_factory)
+
+        return session_factory()
+
+
+class AsyncUnofficialShipEngine:
+    def __init__(
+        self,
+        config: Union[
+            UnofficialShipEngineConfig, dict[str, Union[float, int, str]], str
+        ],
+    ) -> None:
+        """
+        Initializes the AsyncUnofficialShipEngine client with the provided configuration.
+
+        The async client exposes the same services as UnofficialShipEngine, with every
+        method awaitable. All requests share one pooled keep-alive httpx.AsyncClient, so
+        close the client with `aclose()` or use it as an async context manager.
+
+        Requires the optional httpx dependency: `pip install unofficial-shipengine[async]`.
+
+        Args:
+            config (Union[UnofficialShipEngineConfig, dict[str, Union[float, int, str]], str]):
+                The configuration for the ShipEngine client. It can be an UnofficialShipEngineConfig object,
+                a dictionary, or a string representing just the API key and the rest of the values will default.
+        """
+        self.config = UnofficialShipEngine._parse_config(config)
+        self.rate_limiter = UnofficialShipEngine._create_rate_limiter(self.config)
+        self.timeouts = UnofficialShipEngine._create_timeouts(self.config)
+        self.circuit_breakers = UnofficialShipEngine._create_circuit_breakers(
+            self.config
+        )
+        self._session = self._create_session()
+
+        self.shipments = AsyncShipmentService(self._session, self.config)
+        self.carriers = AsyncCarrierService(self._session, self.config)
+        self.batches = AsyncBatchService(self._session, self.config)
+        self.warehouses = AsyncWarehouseService(self._session, self.config)
+        self.labels = AsyncLabelService(self._session, self.config)
+        self.tracking = AsyncTrackingService(self._session, self.config)
+
+    deadline = staticmethod(UnofficialShipEngine.deadline)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the pooled connections held by the client."""
+        await self._session.aclose()
+
+    def _create_session(self) -> "httpx.AsyncClient":
+        """
+        Creates a configured httpx client for making API calls.
+
+        Returns:
+            httpx.AsyncClient: The configured client with headers, connection pool and retry strategy.
+
+        Raises:
+            ImportError: If httpx is not installed.
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "AsyncUnofficialShipEngine requires httpx, "
+                "install it with `pip install unofficial-shipengine[async]`"
+            ) from e
+
+        from .utils.async_transport import AsyncRetryTransport
+
+        limits = httpx.Limits(
+            max_connections=ASYNC_MAX_CONNECTIONS,
+            max_keepalive_connections=ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=ASYNC_KEEPALIVE_EXPIRY,
+        )
+
+        transport = AsyncRetryTransport(
+            httpx.AsyncHTTPTransport(limits=limits),
+            retries=self.config.retries,
+            backoff_factor=self.config.backoff_factor,
+            rate_limiter=self.rate_limiter,
+            timeouts=self.timeouts,
+            circuit_breakers=self.circuit_breakers,
+        )
+
+        return httpx.AsyncClient(
+            headers={
+                "Host": "api.shipengine.com",
+                "API-Key": self.config.api_key,
+                "Content-Type": "application/json",
+            },
+            transport=transport,
+            timeout=None,
+        )
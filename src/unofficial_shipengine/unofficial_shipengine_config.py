@@ -1,7 +1,11 @@
-from typing import Self, Any
+from typing import Self, Any, Optional
 
 from attrs import define, field
 
+from .utils.circuit_breaker import CircuitBreakerPolicy
+from .utils.json_backend import JSONBackend
+from .utils.rate_limit import RateLimitBackend
+
 
 @define
 class UnofficialShipEngineConfig:
@@ -12,11 +16,93 @@ class UnofficialShipEngineConfig:
         api_key (str): The API key for authenticating with the ShipEngine API.
         retries (int): The number of retries for API requests in case of failure. Defaults to 3.
         backoff_factor (float): The backoff factor for retrying API requests. Defaults to 0.5.
+        pool_connections (int): The number of per-host connection pools to keep. Defaults to 10.
+        pool_maxsize (int): The maximum number of keep-alive connections kept per host. Set it to at least
+            the number of threads sharing the client, otherwise connections are discarded. Defaults to 10.
+        pool_block (bool): Whether requests wait for a free connection once pool_maxsize connections are
+            in use instead of opening extra ones that get discarded afterwards. Defaults to False.
+        pool_idle_timeout (Optional[float]): Seconds a keep-alive connection may sit idle before it is
+            closed and replaced instead of reused. Defaults to None, which never recycles connections.
+        thread_safe (bool): Whether every thread gets its own session, all sharing one connection pool, so a
+            single client can be used from many threads at once. Defaults to False.
+        rate_limit (Optional[float]): Requests per second the client may send, enforced with a token bucket
+            before requests reach the API. Defaults to None, which does not throttle.
+        rate_limit_burst (Optional[int]): Requests that may be sent back to back before throttling kicks in.
+            Defaults to None, which allows one second's worth of requests.
+        rate_limit_backend (Optional[RateLimitBackend]): Where the token bucket is kept. Defaults to None, which
+            keeps it in memory for this client. Pass a FileLockBackend to share one limit between processes.
+        safe_post_retries (bool): Whether purchase_label and create_shipment retry network failures and 5xx
+            responses. Before posting again the client looks the request up by its external_shipment_id, so a
+            request the API already processed is never sent twice. Requests without an external_shipment_id
+            get a generated one. The async client honours it too. Defaults to False.
+        connect_timeout (float): Seconds to wait for a connection to the API. Defaults to 5.
+        read_timeout (float): Seconds to wait for a response from endpoints without a timeout of their own.
+            Defaults to 30.
+        label_purchase_timeout (float): Seconds to wait for a label purchase, which waits on the carrier.
+            Defaults to 90.
+        tracking_timeout (float): Seconds to wait for tracking information. Defaults to 10.
+        batch_processing_timeout (float): Seconds to wait for a batch to be submitted for processing.
+            Defaults to 120.
+        circuit_breaker (Optional[CircuitBreakerPolicy]): Trips a circuit breaker per endpoint family (labels,
+            shipments, tracking, batches) when its error rate or latency crosses the policy's thresholds, after
+            which calls to that family raise CircuitOpenError right away. Defaults to None, which never trips.
+        single_flight (bool): Whether concurrent identical calls to the get_by_id methods of shipments, labels
+            and batches, and to get_tracking_information, share one request and the model it returns. Callers
+            then receive the same object and must not modify it. Defaults to False.
+        json_backend (Optional[JSONBackend]): Parses response bodies and encodes request bodies, straight from
+            and to bytes. Defaults to None, which uses orjson when it is installed and the json module otherwise.
+        sparse_payloads (bool): Whether request bodies leave out the fields of models that are None, or still at a
+            default of False or an empty list, which the API reads the same as missing. Other defaults are always
+            sent. Defaults to False.
+        lazy_models (bool): Whether responses are returned as read-only views that decode each field, and build
+            the models nested in it, the first time it is read. Views are instances of the model classes and compare
+            equal to them, but cannot be modified: use attrs.evolve to get a modified copy. Defaults to False.
+        intern_models (bool): Whether identical Address, Weight, Value and URL models are decoded into one shared
+            instance, and carrier_id, carrier_code, service_code and package_code strings are interned, which cuts
+            the memory of long-lived caches of models. Shared models must not be modified. Defaults to False.
+        micro_batch_size (Optional[int]): Whether create_shipment calls for a single shipment, from any number of threads,
+            are held back and sent together as one multi-shipment request, once this many are waiting or after
+            micro_batch_delay. Every caller still gets its own Shipment or error. Defaults to None, which sends every
+            call on its own.
+        micro_batch_delay (float): The longest a single-shipment create_shipment call is held back to join others, in
+            seconds. Defaults to 0.005.
+        carrier_catalog_ttl (Optional[float]): Seconds the carrier catalog of carriers.get_catalog is reused for before it
+            is fetched again. Defaults to 300. None keeps it until carriers.refresh_catalog is called.
+        warehouse_cache (bool): Whether warehouses are kept in memory, by warehouse_id, once created or retrieved, so
+            warehouses.get_by_id answers from memory. Deleting a warehouse drops it. Cached warehouses are shared between
+            callers and must not be modified. Defaults to False.
+        warehouse_cache_ttl (Optional[float]): Seconds a cached warehouse is returned for before get_by_id retrieves it
+            again. Defaults to None, which keeps it until it is deleted through this client.
     """
 
     api_key: str
     retries: int = field(default=3)
     backoff_factor: float = field(default=0.5)
+    pool_connections: int = field(default=10)
+    pool_maxsize: int = field(default=10)
+    pool_block: bool = field(default=False)
+    pool_idle_timeout: Optional[float] = field(default=None)
+    thread_safe: bool = field(default=False)
+    rate_limit: Optional[float] = field(default=None)
+    rate_limit_burst: Optional[int] = field(default=None)
+    rate_limit_backend: Optional[RateLimitBackend] = field(default=None)
+    safe_post_retries: bool = field(default=False)
+    connect_timeout: float = field(default=5.0)
+    read_timeout: float = field(default=30.0)
+    label_purchase_timeout: float = field(default=90.0)
+    tracking_timeout: float = field(default=10.0)
+    batch_processing_timeout: float = field(default=120.0)
+    circuit_breaker: Optional[CircuitBreakerPolicy] = field(default=None)
+    single_flight: bool = field(default=False)
+    json_backend: Optional[JSONBackend] = field(default=None)
+    sparse_payloads: bool = field(default=False)
+    lazy_models: bool = field(default=False)
+    intern_models: bool = field(default=False)
+    micro_batch_size: Optional[int] = field(default=None)
+    micro_batch_delay: float = field(default=0.005)
+    carrier_catalog_ttl: Optional[float] = field(default=300.0)
+    warehouse_cache: bool = field(default=False)
+    warehouse_cache_ttl: Optional[float] = field(default=None)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
@@ -0,0 +1,322 @@
+import queue
+import threading
+import time
+import weakref
+from types import TracebackType
+from typing import Any, Optional, Self, Union
+
+from attrs import define, field
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from urllib3 import BaseHTTPResponse, PoolManager, Retry
+from urllib3.connectionpool import (
+    ConnectionPool,
+    HTTPConnectionPool,
+    HTTPSConnectionPool,
+)
+from urllib3.util.timeout import Timeout
+
+from .circuit_breaker import CircuitBreaker, CircuitBreakers, FAILURE_STATUS_CODES
+from .rate_limit import RateLimiter, parse_retry_after
+from .timeouts import EndpointTimeouts, cap_timeout, check_deadline
+
+
+@define
+class PoolStats:
+    """
+    PoolStats counts what happens to the connections of the client's connection pool.
+
+    A healthy pool shows `reused` growing much faster than `created`. A growing
+    `discarded` count means pool_maxsize is smaller than the number of concurrent
+    requests and every discarded connection costs a new TLS handshake later.
+
+    Attributes:
+        created (int): Connections opened, each one paying for a TCP and TLS handshake.
+        reused (int): Requests sent over an already open keep-alive connection.
+        discarded (int): Connections closed because the pool was full when they were returned.
+        recycled (int): Connections closed before reuse because they sat idle past pool_idle_timeout.
+    """
+
+    created: int = field(default=0)
+    reused: int = field(default=0)
+    discarded: int = field(default=0)
+    recycled: int = field(default=0)
+    _lock: threading.Lock = field(
+        factory=threading.Lock, init=False, repr=False, eq=False
+    )
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.created = self.reused = self.discarded = self.recycled = 0
+
+
+class StatsHTTPSConnectionPool(HTTPSConnectionPool):
+    """HTTPSConnectionPool that reports to PoolStats and recycles idle connections."""
+
+    pool_stats: Optional[PoolStats] = None
+    idle_timeout: Optional[float] = None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._last_used: weakref.WeakKeyDictionary[Any, float] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        conn = super()._get_conn(timeout)
+
+        if not conn.is_closed:
+            last_used = self._last_used.get(conn)
+            if (
+                self.idle_timeout is not None
+                and last_used is not None
+                and time.monotonic() - last_used > self.idle_timeout
+            ):
+                conn.close()
+                self._record("recycled")
+            else:
+                self._record("reused")
+
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        if conn is not None:
+            self._last_used[conn] = time.monotonic()
+
+        if self.pool is not None and not self.block:
+            try:
+                self.pool.put(conn, block=False)
+                return
+            except queue.Full:
+                self._record("discarded")
+
+        super()._put_conn(conn)
+
+    def _validate_conn(self, conn: Any) -> None:
+        if conn.is_closed:
+            self._record("created")
+
+        super()._validate_conn(conn)
+
+    def _record(self, counter: str) -> None:
+        if self.pool_stats is not None:
+            self.pool_stats.increment(counter)
+
+
+class StatsPoolManager(PoolManager):
+    """PoolManager that hands its PoolStats and idle timeout to every HTTPS pool it creates."""
+
+    def __init__(
+        self,
+        pool_stats: Optional[PoolStats] = None,
+        idle_timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.pool_stats = pool_stats
+        self.idle_timeout = idle_timeout
+        self.pool_classes_by_scheme = {
+            **self.pool_classes_by_scheme,
+            "https": StatsHTTPSConnectionPool,
+        }
+
+    def _new_pool(
+        self,
+        scheme: str,
+        host: str,
+        port: int,
+        request_context: Optional[dict[str, Any]] = None,
+    ) -> HTTPConnectionPool:
+        pool = super()._new_pool(scheme, host, port, request_context)
+
+        if isinstance(pool, StatsHTTPSConnectionPool):
+            pool.pool_stats = self.pool_stats
+            pool.idle_timeout = self.idle_timeout
+
+        return pool
+
+
+class DeadlineTimeout(Timeout):
+    """Timeout whose connect and read timeouts never run past the current deadline."""
+
+    def clone(self) -> "DeadlineTimeout":
+        return DeadlineTimeout(connect=self._connect, read=self._read, total=self.total)
+
+    @property
+    def connect_timeout(self) -> Any:
+        return cap_timeout(self.resolve_default_timeout(super().connect_timeout))
+
+    @property
+    def read_timeout(self) -> Optional[float]:
+        return cap_timeout(super().read_timeout)
+
+
+class DeadlineRetry(Retry):
+    """
+    Retry that gives up instead of sleeping past the current deadline.
+
+    It leaves 429 responses to ShipEngineHTTPAdapter, which retries them for every method
+    and takes a rate limiter token for each attempt, so they are not retried twice over.
+    """
+
+    RETRY_AFTER_STATUS_CODES = frozenset({413, 503})
+
+    def increment(
+        self,
+        method: Optional[str] = None,
+        url: Optional[str] = None,
+        response: Optional[BaseHTTPResponse] = None,
+        error: Optional[Exception] = None,
+        _pool: Optional[ConnectionPool] = None,
+        _stacktrace: Optional[TracebackType] = None,
+    ) -> Self:
+        new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+
+        wait = new_retry.get_backoff_time()
+        if response is not None and self.respect_retry_after_header:
+            wait = max(wait, new_retry.get_retry_after(response) or 0)
+
+        check_deadline(wait)
+        return new_retry
+
+
+class ShipEngineHTTPAdapter(HTTPAdapter):
+    """
+    ShipEngineHTTPAdapter is the HTTPAdapter mounted on the client's session.
+
+    On top of HTTPAdapter it reports connection pool activity to a PoolStats
+    object and closes keep-alive connections that have been idle longer than
+    `pool_idle_timeout` seconds instead of reusing them, which avoids sending
+    requests down sockets the server or a load balancer already dropped.
+
+    Every request first takes a token from `rate_limiter`, if one is set. A 429
+    response is retried, for any method since the API did not process the request,
+    after waiting for its Retry-After header or the retry backoff when the header
+    is missing. The wait is applied to the rate limiter so every thread sharing it
+    backs off, not only the one that got the 429.
+
+    Requests sent without a timeout get the one of their endpoint class from
+    `timeouts`. Inside a `deadline` block every attempt's timeouts are cut to the
+    time left, and retries that could not finish in time raise DeadlineExceededError.
+
+    Requests to an endpoint family guarded by `circuit_breakers` raise
+    CircuitOpenError without being sent while its circuit is open, and report
+    their outcome and latency to it otherwise.
+
+    Args:
+        pool_stats (Optional[PoolStats]): Where to record pool activity.
+        pool_idle_timeout (Optional[float]): Seconds a pooled connection may sit idle before it is recycled.
+        rate_limiter (Optional[RateLimiter]): Throttles the requests sent through the adapter.
+        timeouts (Optional[EndpointTimeouts]): The default timeouts of each endpoint class.
+        circuit_breakers (Optional[CircuitBreakers]): The circuit breakers of the endpoint families.
+        **kwargs: Passed through to HTTPAdapter (pool_connections, pool_maxsize, pool_block, max_retries).
+    """
+
+    def __init__(
+        self,
+        pool_stats: Optional[PoolStats] = None,
+        pool_idle_timeout: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        timeouts: Optional[EndpointTimeouts] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.pool_stats = pool_stats
+        self.pool_idle_timeout = pool_idle_timeout
+        self.rate_limiter = rate_limiter
+        self.timeouts = timeouts
+        self.circuit_breakers = circuit_breakers
+        super().__init__(**kwargs)
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+
+        self.poolmanager = StatsPoolManager(
+            pool_stats=self.pool_stats,
+            idle_timeout=self.pool_idle_timeout,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:  # type: ignore[override]
+        retries: int = self.max_retries.total or 0
+        attempt: int = 0
+        kwargs["timeout"] = self._get_timeout(request, kwargs.get("timeout"))
+        breaker: Optional[CircuitBreaker] = None
+        if self.circuit_breakers is not None:
+            breaker = self.circuit_breakers.for_url(request.url or "")
+
+        while True:
+            check_deadline()
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            response = self._send_guarded(breaker, request, **kwargs)
+
+            if response.status_code != 429 or attempt >= retries:
+                return response
+
+            attempt += 1
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = self.max_retries.backoff_factor * (2 ** (attempt - 1))
+
+            response.close()
+            check_deadline(delay)
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.pause(delay)
+            else:
+                time.sleep(delay)
+
+    def _send_guarded(
+        self, breaker: Optional[CircuitBreaker], request: PreparedRequest, **kwargs: Any
+    ) -> Response:
+        if breaker is None:
+            return super().send(request, **kwargs)
+
+        breaker.before_call()
+        start = time.monotonic()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            breaker.record(time.monotonic() - start, failed=True)
+            raise
+        except BaseException:
+            # Interrupted before the outcome is known, so the probe slot is handed back.
+            breaker.release()
+            raise
+
+        failed = response.status_code in FAILURE_STATUS_CODES
+        breaker.record(time.monotonic() - start, failed=failed)
+        return response
+
+    def _get_timeout(
+        self,
+        request: PreparedRequest,
+        timeout: Union[None, float, tuple[Optional[float], Optional[float]], Timeout],
+    ) -> Timeout:
+        if isinstance(timeout, Timeout):
+            return timeout
+
+        if timeout is None:
+            if self.timeouts is None:
+                return DeadlineTimeout(connect=None, read=None)
+            timeout = self.timeouts.for_request(request.method or "", request.url or "")
+
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return DeadlineTimeout(connect=connect, read=read)
+
+        return DeadlineTimeout(connect=timeout, read=timeout)
@@ -0,0 +1,167 @@
+import asyncio
+import time
+from typing import Optional
+
+import httpx
+
+from .circuit_breaker import CircuitBreaker, CircuitBreakers, FAILURE_STATUS_CODES
+from .rate_limit import RateLimiter, parse_retry_after
+from .timeouts import EndpointTimeouts, cap_timeout, check_deadline
+
+RETRY_STATUS_CODES: frozenset[int] = frozenset([500, 502, 503, 504])
+RETRY_METHODS: frozenset[str] = frozenset(
+    ["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"]
+)
+BACKOFF_MAX: float = 120.0
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """
+    AsyncRetryTransport wraps an httpx transport with the same retry policy the
+    synchronous client gets from urllib3's Retry.
+
+    Idempotent requests are retried on 500/502/503/504 responses and on transport
+    errors, connection failures are retried for every method since the request
+    never reached the server. Sleeps between attempts grow as
+    backoff_factor * 2 ** (attempt - 1), with no sleep before the first retry.
+
+    Like ShipEngineHTTPAdapter, every attempt takes a token from `rate_limiter`
+    and 429 responses are retried for any method after their Retry-After delay,
+    requests without a timeout get the one of their endpoint class from `timeouts`
+    and every attempt is held to the current `deadline`. Attempts to an endpoint
+    family whose circuit in `circuit_breakers` is open raise CircuitOpenError.
+
+    Attributes:
+        transport (httpx.AsyncBaseTransport): The transport that sends the requests.
+        retries (int): The maximum number of retries per request.
+        backoff_factor (float): The backoff factor applied between retries.
+        rate_limiter (Optional[RateLimiter]): Throttles the requests sent through the transport.
+        timeouts (Optional[EndpointTimeouts]): The default timeouts of each endpoint class.
+        circuit_breakers (Optional[CircuitBreakers]): The circuit breakers of the endpoint families.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        retries: int,
+        backoff_factor: float,
+        rate_limiter: Optional[RateLimiter] = None,
+        timeouts: Optional[EndpointTimeouts] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+    ) -> None:
+        self.transport = transport
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.rate_limiter = rate_limiter
+        self.timeouts = timeouts
+        self.circuit_breakers = circuit_breakers
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt: int = 0
+        timeout = self._get_timeout(request)
+        breaker: Optional[CircuitBreaker] = None
+        if self.circuit_breakers is not None:
+            breaker = self.circuit_breakers.for_url(str(request.url))
+
+        while True:
+            check_deadline()
+
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+
+            request.extensions["timeout"] = {
+                key: cap_timeout(value) for key, value in timeout.items()
+            }
+
+            try:
+                response = await self._send_guarded(breaker, request)
+            except httpx.TransportError as e:
+                retryable = isinstance(e, httpx.ConnectError) or (
+                    request.method in RETRY_METHODS
+                )
+                if attempt >= self.retries or not retryable:
+                    raise
+            else:
+                if response.status_code == 429 and attempt < self.retries:
+                    attempt += 1
+                    await response.aclose()
+                    await self._wait_for_rate_limit(response, attempt)
+                    continue
+
+                if (
+                    attempt >= self.retries
+                    or request.method not in RETRY_METHODS
+                    or response.status_code not in RETRY_STATUS_CODES
+                ):
+                    return response
+
+                await response.aclose()
+
+            attempt += 1
+            backoff = self._get_backoff_time(attempt)
+            check_deadline(backoff)
+            await asyncio.sleep(backoff)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    async def _send_guarded(
+        self, breaker: Optional[CircuitBreaker], request: httpx.Request
+    ) -> httpx.Response:
+        if breaker is None:
+            return await self.transport.handle_async_request(request)
+
+        breaker.before_call()
+        start = time.monotonic()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception:
+            breaker.record(time.monotonic() - start, failed=True)
+            raise
+        except BaseException:
+            # Cancelled before the outcome is known, so the probe slot is handed back.
+            breaker.release()
+            raise
+
+        failed = response.status_code in FAILURE_STATUS_CODES
+        breaker.record(time.monotonic() - start, failed=failed)
+        return response
+
+    async def _wait_for_rate_limit(
+        self, response: httpx.Response, attempt: int
+    ) -> None:
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = self.backoff_factor * (2 ** (attempt - 1))
+
+        check_deadline(delay)
+
+        if self.rate_limiter is not None:
+            await self.rate_limiter.pause_async(delay)
+        else:
+            await asyncio.sleep(delay)
+
+    def _get_timeout(self, request: httpx.Request) -> dict[str, Optional[float]]:
+        timeout: dict[str, Optional[float]] = dict(
+            request.extensions.get("timeout", {})
+        )
+
+        if self.timeouts is not None:
+            connect, read = self.timeouts.for_request(request.method, str(request.url))
+            defaults = {
+                "connect": connect,
+                "read": read,
+                "write": read,
+                "pool": connect,
+            }
+            for key, value in defaults.items():
+                if timeout.get(key) is None:
+                    timeout[key] = value
+
+        return timeout
+
+    def _get_backoff_time(self, attempt: int) -> float:
+        if attempt <= 1:
+            return 0
+        backoff: float = self.backoff_factor * (2 ** (attempt - 1))
+        return min(BACKOFF_MAX, backoff)
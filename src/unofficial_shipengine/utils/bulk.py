@@ -0,0 +1,231 @@
+import asyncio
+import contextvars
+import itertools
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from attrs import define, field
+
+R = TypeVar("R")
+T = TypeVar("T")
+
+
+@define
+class BulkResult(Generic[R, T]):
+    """
+    BulkResult is the outcome of one item of a bulk call.
+
+    Results are yielded as the API answers, not in input order: use `index` or the request's
+    own identifiers, e.g. its external_shipment_id, to match them to the input.
+
+    Attributes:
+        index (int): The position of the item in the input.
+        request (R): The item.
+        value (Optional[T]): What the API returned for the item, if anything.
+        error (Optional[Exception]): Why the item failed, or None if it succeeded.
+    """
+
+    index: int
+    request: R
+    value: Optional[T] = field(default=None)
+    error: Optional[Exception] = field(default=None)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item succeeded."""
+        return self.error is None
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Splits an iterable into lists of `size` items, the last one possibly shorter.
+
+    Items are read only as the chunks are consumed, so a generator is never read ahead.
+
+    Args:
+        items (Iterable[T]): The items.
+        size (int): The number of items in a chunk.
+
+    Returns:
+        Iterator[list[T]]: The chunks.
+
+    Raises:
+        ValueError: If `size` is less than 1.
+    """
+    if size < 1:
+        raise ValueError(f"Chunk size must be at least 1, got {size}")
+
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def run_bounded(
+    fn: Callable[[T], R], items: Iterable[T], max_workers: int
+) -> Iterator[tuple[T, "Future[R]"]]:
+    """
+    Calls `fn` on every item from a pool of threads and yields the calls as they finish.
+
+    At most `max_workers` calls are in flight, and an item is only read from `items` once a
+    worker is free for it, so memory stays bounded however many items there are. Every call
+    runs in a copy of the caller's context, which carries a deadline set with `deadline`
+    over to the workers. Closing the iterator early waits for the calls in flight.
+
+    Args:
+        fn (Callable[[T], R]): The call to make for each item.
+        items (Iterable[T]): The items.
+        max_workers (int): The maximum number of calls in flight.
+
+    Returns:
+        Iterator[tuple[T, Future[R]]]: Each item with the finished future of its call.
+
+    Raises:
+        ValueError: If `max_workers` is less than 1.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+    iterator = iter(items)
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        pending: dict[Future[R], T] = {}
+
+        for item in itertools.islice(iterator, max_workers):
+            context = contextvars.copy_context()
+            pending[executor.submit(context.run, fn, item)] = item
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                yield pending.pop(future), future
+
+            for item in itertools.islice(iterator, max_workers - len(pending)):
+                context = contextvars.copy_context()
+                pending[executor.submit(context.run, fn, item)] = item
+
+
+async def async_run_bounded(
+    fn: Callable[[T], Awaitable[R]], items: Iterable[T], max_workers: int
+) -> AsyncIterator[tuple[T, "asyncio.Task[R]"]]:
+    """
+    Awaits `fn` on every item concurrently and yields the calls as they finish.
+
+    The awaitable counterpart of run_bounded: at most `max_workers` calls are in flight,
+    and closing the iterator early cancels them.
+
+    Args:
+        fn (Callable[[T], Awaitable[R]]): The call to make for each item.
+        items (Iterable[T]): The items.
+        max_workers (int): The maximum number of calls in flight.
+
+    Returns:
+        AsyncIterator[tuple[T, asyncio.Task[R]]]: Each item with the finished task of its call.
+
+    Raises:
+        ValueError: If `max_workers` is less than 1.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+    iterator = iter(items)
+    pending: dict[asyncio.Task[R], T] = {}
+
+    def start(item: T) -> None:
+        pending[asyncio.ensure_future(_call(fn, item))] = item
+
+    try:
+        for item in itertools.islice(iterator, max_workers):
+            start(item)
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                yield pending.pop(task), task
+
+            for item in itertools.islice(iterator, max_workers - len(pending)):
+                start(item)
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _call(fn: Callable[[T], Awaitable[R]], item: T) -> R:
+    result: R = await fn(item)
+    return result
+
+
+def result_of(
+    index: int,
+    request: R,
+    future: Union["Future[T]", "asyncio.Future[T]"],
+) -> BulkResult[R, T]:
+    """
+    Builds the result of a request sent as a call of its own.
+
+    Args:
+        index (int): The position of the request in the input.
+        request (R): The request.
+        future (Union[Future[T], asyncio.Future[T]]): The finished call.
+
+    Returns:
+        BulkResult[R, T]: The value the call returned, or the exception it raised.
+    """
+    error = future.exception()
+    if error is None:
+        return BulkResult(index, request, future.result())
+    if not isinstance(error, Exception):
+        raise error
+
+    return BulkResult(index, request, error=error)
+
+
+def results_of(
+    chunk: list[tuple[int, R]],
+    future: Union["Future[list[T]]", "asyncio.Future[list[T]]"],
+    error_of: Callable[[T], Optional[Exception]],
+) -> list[BulkResult[R, T]]:
+    """
+    Builds the results of a chunk of indexed requests sent as one call.
+
+    A call that raised fails every request of the chunk with its exception, and so does a
+    call that returned a different number of values than there are requests, with a
+    ValueError. Otherwise the values are matched to the requests by position, and `error_of`
+    tells which of them the API reported an error for.
+
+    Args:
+        chunk (list[tuple[int, R]]): The requests, with their positions in the input.
+        future (Union[Future[list[T]], asyncio.Future[list[T]]]): The finished call, returning one value per request.
+        error_of (Callable[[T], Optional[Exception]]): The error reported for a value, if any.
+
+    Returns:
+        list[BulkResult[R, T]]: The results, in the order of the chunk.
+    """
+    error = future.exception()
+    if error is not None:
+        if not isinstance(error, Exception):
+            raise error
+        return [BulkResult(index, request, error=error) for index, request in chunk]
+
+    values = future.result()
+    if len(values) != len(chunk):
+        error = ValueError(
+            f"Expected {len(chunk)} results for the chunk, got {len(values)}"
+        )
+        return [BulkResult(index, request, error=error) for index, request in chunk]
+
+    return [
+        BulkResult(index, request, value, error_of(value))
+        for (index, request), value in zip(chunk, values)
+    ]
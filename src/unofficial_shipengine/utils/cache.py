@@ -0,0 +1,98 @@
+import threading
+import time
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    TTLCache keeps values in memory for a limited time, safe to share between threads.
+
+    Every invalidation advances the generation of its key. A caller that fetches a value while
+    another may invalidate it reads the generation first and passes it to put, which then
+    ignores the value if the key was invalidated in the meantime.
+
+    Args:
+        ttl (Optional[float]): The seconds a value stays fresh after it is stored, None to keep it
+            until it is invalidated.
+        clock (Callable[[], float]): Returns the current time in seconds. Defaults to time.monotonic.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl is not None and ttl < 0:
+            raise ValueError(f"Invalid cache TTL: {ttl}")
+
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: dict[K, tuple[V, float]] = {}
+        self._generations: dict[K, int] = {}
+        self._cleared: int = 0
+        self._counter: int = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Returns the value stored for a key, if it is still fresh.
+
+        Args:
+            key (K): The key.
+
+        Returns:
+            Optional[V]: The value, or None if it is missing or has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, stored_at = entry
+            if self.ttl is not None and self._clock() - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+
+            return value
+
+    def generation(self, key: K) -> int:
+        """Returns the generation of a key, which changes whenever the key is invalidated."""
+        with self._lock:
+            return self._generation(key)
+
+    def put(self, key: K, value: V, generation: Optional[int] = None) -> None:
+        """
+        Stores the value of a key, fresh from now on.
+
+        Args:
+            key (K): The key.
+            value (V): The value.
+            generation (Optional[int]): The generation of the key read before the value was fetched.
+                The value is not stored if the key has been invalidated since. Defaults to None,
+                which always stores it.
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation(key):
+                return
+            self._entries[key] = (value, self._clock())
+
+    def invalidate(self, key: K) -> None:
+        """Drops the value of a key, if there is one, and advances its generation."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._counter += 1
+            self._generations[key] = self._counter
+
+    def clear(self) -> None:
+        """Drops every value, advancing the generation of every key."""
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._counter += 1
+            self._cleared = self._counter
+
+    def _generation(self, key: K) -> int:
+        return max(self._generations.get(key, 0), self._cleared)
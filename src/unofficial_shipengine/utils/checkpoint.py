@@ -0,0 +1,176 @@
+import asyncio
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional, Union
+
+
+class Checkpoint(ABC):
+    """
+    Checkpoint records the progress of a bulk call, so an interrupted run can resume without
+    creating anything twice.
+
+    Every item is keyed by an ID the API stores with what it creates, e.g. the
+    external_shipment_id of a label's shipment. The key is recorded as started, with no result,
+    right before the item is sent, and recorded again with the ID of the result once the API
+    has answered. A key that was started but never finished is looked up by its external ID
+    on the next run instead of being sent again.
+
+    Implement this to keep the progress wherever a run is resumed from, e.g. a database table.
+
+    Attributes:
+        blocking (bool): Whether `load` and `record` may block, e.g. on disk or network I/O. The
+            async client then runs them in a worker thread instead of on the event loop.
+    """
+
+    blocking: bool = True
+
+    @abstractmethod
+    def load(self) -> dict[str, Optional[str]]:
+        """
+        Returns the progress recorded so far.
+
+        Returns:
+            dict[str, Optional[str]]: The ID of the result of every recorded key, or None for
+                the keys that were started but never finished.
+        """
+
+    @abstractmethod
+    def record(self, key: str, result_id: Optional[str]) -> None:
+        """
+        Records that an item is about to be sent, or what was created for it.
+
+        Args:
+            key (str): The key of the item.
+            result_id (Optional[str]): The ID of the result, None when the item is started.
+        """
+
+
+class InMemoryCheckpoint(Checkpoint):
+    """InMemoryCheckpoint keeps the progress in a dict, so runs resume within the same process."""
+
+    blocking = False
+
+    def __init__(self) -> None:
+        self._entries: dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> dict[str, Optional[str]]:
+        with self._lock:
+            return dict(self._entries)
+
+    def record(self, key: str, result_id: Optional[str]) -> None:
+        with self._lock:
+            self._entries[key] = result_id
+
+
+class FileCheckpoint(Checkpoint):
+    """
+    FileCheckpoint appends the progress to a file, one JSON object per line.
+
+    Every line is flushed to disk before the item is sent, so the file survives the process
+    being killed mid-run. A line cut short by a crash is ignored when the file is loaded.
+
+    Args:
+        path (Union[str, os.PathLike[str]]): The file, created if it does not exist.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def load(self) -> dict[str, Optional[str]]:
+        entries: dict[str, Optional[str]] = {}
+
+        with self._lock:
+            if not self.path.exists():
+                return entries
+            lines = self.path.read_text().splitlines()
+
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            entries[entry["key"]] = entry["id"]
+
+        return entries
+
+    def record(self, key: str, result_id: Optional[str]) -> None:
+        line = json.dumps({"key": key, "id": result_id}) + "\n"
+
+        with self._lock:
+            with open(self.path, "a") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+
+class CheckpointRun:
+    """
+    CheckpointRun tracks the items of one run against the progress of a Checkpoint.
+
+    Args:
+        checkpoint (Checkpoint): The recorded progress, loaded once when the run starts.
+    """
+
+    def __init__(self, checkpoint: Checkpoint) -> None:
+        self._checkpoint = checkpoint
+        self._entries = checkpoint.load()
+        self._claimed: set[str] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    async def load_async(cls, checkpoint: Checkpoint) -> "CheckpointRun":
+        """Starts a run without blocking the event loop on loading the progress."""
+        if checkpoint.blocking:
+            return await asyncio.to_thread(cls, checkpoint)
+        return cls(checkpoint)
+
+    def claim(self, key: Optional[str]) -> tuple[bool, Optional[str]]:
+        """
+        Claims the key of an item for this run and returns its recorded progress.
+
+        Args:
+            key (Optional[str]): The key of the item.
+
+        Returns:
+            tuple[bool, Optional[str]]: Whether the key was recorded by an earlier run, and the ID of its result
+                if it finished.
+
+        Raises:
+            ValueError: If the item has no key, or another item of the run has the same key.
+        """
+        if not key:
+            raise ValueError("Checkpointed items need an external_shipment_id")
+
+        with self._lock:
+            if key in self._claimed:
+                raise ValueError(f"Duplicate external_shipment_id: {key}")
+            self._claimed.add(key)
+
+            return key in self._entries, self._entries.get(key)
+
+    def start(self, key: str) -> None:
+        """Records that the item of `key` is about to be sent."""
+        self._checkpoint.record(key, None)
+
+    def finish(self, key: str, result_id: str) -> None:
+        """Records the ID of what was created for the item of `key`."""
+        self._checkpoint.record(key, result_id)
+
+    async def start_async(self, key: str) -> None:
+        """See CheckpointRun.start, without blocking the event loop."""
+        await self._record_async(key, None)
+
+    async def finish_async(self, key: str, result_id: str) -> None:
+        """See CheckpointRun.finish, without blocking the event loop."""
+        await self._record_async(key, result_id)
+
+    async def _record_async(self, key: str, result_id: Optional[str]) -> None:
+        if self._checkpoint.blocking:
+            await asyncio.to_thread(self._checkpoint.record, key, result_id)
+        else:
+            self._checkpoint.record(key, result_id)
@@ -0,0 +1,264 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+from attrs import define, field
+
+from ..exceptions import CircuitOpenError
+from .timeouts import TRACKING_PATH
+
+FAILURE_STATUS_CODES: frozenset[int] = frozenset([500, 502, 503, 504])
+ENDPOINT_FAMILIES: tuple[str, ...] = ("labels", "shipments", "tracking", "batches")
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@define
+class CircuitBreakerPolicy:
+    """
+    CircuitBreakerPolicy decides when a circuit breaker trips and how it recovers.
+
+    Attributes:
+        failure_rate_threshold (float): Share of failed calls in the window that opens the circuit. Failed
+            calls are network errors, timeouts and 5xx responses. Defaults to 0.5.
+        slow_call_duration (Optional[float]): Seconds after which a call counts as slow. Defaults to None,
+            which ignores latency.
+        slow_call_rate_threshold (float): Share of slow calls in the window that opens the circuit. Defaults to 0.5.
+        window_size (int): How many of the latest calls the rates are computed over. Defaults to 20.
+        minimum_calls (int): Calls needed in the window before the circuit may open. Defaults to 10.
+        open_duration (float): Seconds the circuit fails fast before letting probes through. Defaults to 30.
+        half_open_probes (int): Calls let through while half-open, all of which must succeed to close the
+            circuit again. Defaults to 1.
+    """
+
+    failure_rate_threshold: float = field(default=0.5)
+    slow_call_duration: Optional[float] = field(default=None)
+    slow_call_rate_threshold: float = field(default=0.5)
+    window_size: int = field(default=20)
+    minimum_calls: int = field(default=10)
+    open_duration: float = field(default=30.0)
+    half_open_probes: int = field(default=1)
+
+
+@define
+class CircuitEvent:
+    """
+    CircuitEvent reports a circuit breaker changing state.
+
+    Attributes:
+        family (str): The endpoint family of the circuit, e.g. "labels".
+        previous_state (CircuitState): The state the circuit left.
+        state (CircuitState): The state the circuit entered.
+        failure_rate (float): Share of failed calls in the window when the state changed.
+        slow_call_rate (float): Share of slow calls in the window when the state changed.
+    """
+
+    family: str
+    previous_state: CircuitState
+    state: CircuitState
+    failure_rate: float
+    slow_call_rate: float
+
+
+class CircuitBreaker:
+    """
+    CircuitBreaker tracks the health of one endpoint family and fails calls fast while it is down.
+
+    The circuit starts closed and records the outcome of every call in a sliding window. Once the
+    failure or slow call rate crosses the policy's threshold it opens, and every call raises
+    CircuitOpenError without reaching the API. After `open_duration` it turns half-open and lets
+    `half_open_probes` calls through: if they all succeed it closes, otherwise it opens again.
+
+    Args:
+        family (str): The endpoint family the circuit guards.
+        policy (CircuitBreakerPolicy): When to trip and how to recover.
+        on_state_change (Optional[Callable[[CircuitEvent], None]]): Called after every state change.
+    """
+
+    def __init__(
+        self,
+        family: str,
+        policy: CircuitBreakerPolicy,
+        on_state_change: Optional[Callable[[CircuitEvent], None]] = None,
+    ) -> None:
+        self.family = family
+        self.policy = policy
+        self.on_state_change = on_state_change
+        self._state = CircuitState.CLOSED
+        self._window: deque[tuple[bool, bool]] = deque(maxlen=policy.window_size)
+        self._opened_at: float = 0.0
+        self._probes: int = 0
+        self._probe_successes: int = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def before_call(self) -> None:
+        """
+        Lets a call through, or fails it fast while the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with every probe already in flight.
+        """
+        event: Optional[CircuitEvent] = None
+
+        with self._lock:
+            if self._state is CircuitState.OPEN:
+                retry_after = self._opened_at + self.policy.open_duration
+                retry_after -= time.monotonic()
+                if retry_after > 0:
+                    raise CircuitOpenError(self.family, retry_after)
+                event = self._transition(CircuitState.HALF_OPEN)
+
+            if self._state is CircuitState.HALF_OPEN:
+                if self._probes >= self.policy.half_open_probes:
+                    raise CircuitOpenError(self.family, 0.0)
+                self._probes += 1
+
+        self._emit(event)
+
+    def release(self) -> None:
+        """
+        Hands back the probe slot of a call let through by `before_call` that never reached the API,
+        e.g. because it was cancelled, without recording an outcome.
+        """
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def record(self, duration: float, failed: bool) -> None:
+        """
+        Records the outcome of a call let through by `before_call`.
+
+        Args:
+            duration (float): How long the call took, in seconds.
+            failed (bool): Whether the call failed.
+        """
+        slow = (
+            self.policy.slow_call_duration is not None
+            and duration > self.policy.slow_call_duration
+        )
+        event: Optional[CircuitEvent] = None
+
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._probes -= 1
+                if failed or slow:
+                    event = self._transition(CircuitState.OPEN)
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.policy.half_open_probes:
+                        self._window.clear()
+                        event = self._transition(CircuitState.CLOSED)
+            elif self._state is CircuitState.CLOSED:
+                self._window.append((failed, slow))
+                if self._should_trip():
+                    event = self._transition(CircuitState.OPEN)
+
+        self._emit(event)
+
+    def _should_trip(self) -> bool:
+        if len(self._window) < self.policy.minimum_calls:
+            return False
+
+        failure_rate, slow_call_rate = self._rates()
+        return (
+            failure_rate >= self.policy.failure_rate_threshold
+            or slow_call_rate >= self.policy.slow_call_rate_threshold
+        )
+
+    def _rates(self) -> tuple[float, float]:
+        if not self._window:
+            return 0.0, 0.0
+
+        failures = sum(failed for failed, _ in self._window)
+        slow_calls = sum(slow for _, slow in self._window)
+        return failures / len(self._window), slow_calls / len(self._window)
+
+    def _transition(self, state: CircuitState) -> CircuitEvent:
+        failure_rate, slow_call_rate = self._rates()
+        event = CircuitEvent(
+            self.family, self._state, state, failure_rate, slow_call_rate
+        )
+
+        self._state = state
+        self._probes = 0
+        self._probe_successes = 0
+        if state is CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+
+        return event
+
+    def _emit(self, event: Optional[CircuitEvent]) -> None:
+        if event is not None and self.on_state_change is not None:
+            self.on_state_change(event)
+
+
+class CircuitBreakers:
+    """
+    CircuitBreakers holds one CircuitBreaker per endpoint family and dispatches their events.
+
+    Requests to endpoints outside the families, such as carriers and warehouses, are not guarded.
+
+    Args:
+        policy (CircuitBreakerPolicy): The policy every circuit follows.
+    """
+
+    def __init__(self, policy: CircuitBreakerPolicy) -> None:
+        self.policy = policy
+        self._listeners: list[Callable[[CircuitEvent], None]] = []
+        self._breakers: dict[str, CircuitBreaker] = {
+            family: CircuitBreaker(family, policy, self._dispatch)
+            for family in ENDPOINT_FAMILIES
+        }
+
+    def __getitem__(self, family: str) -> CircuitBreaker:
+        return self._breakers[family]
+
+    def add_listener(self, listener: Callable[[CircuitEvent], None]) -> None:
+        """
+        Subscribes to the state changes of every circuit.
+
+        Listeners are called on the thread whose call changed the state, so they should return quickly.
+
+        Args:
+            listener (Callable[[CircuitEvent], None]): Called with every CircuitEvent.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[CircuitEvent], None]) -> None:
+        self._listeners.remove(listener)
+
+    def for_url(self, url: str) -> Optional[CircuitBreaker]:
+        """
+        Looks up the circuit guarding the endpoint family of a URL.
+
+        Args:
+            url (str): The URL of the request.
+
+        Returns:
+            Optional[CircuitBreaker]: The circuit, or None if the endpoint is not guarded.
+        """
+        path = urlsplit(url).path
+
+        if TRACKING_PATH.match(path):
+            return self._breakers["tracking"]
+
+        segments = path.strip("/").split("/")
+        if len(segments) < 2:
+            return None
+
+        return self._breakers.get(segments[1])
+
+    def _dispatch(self, event: CircuitEvent) -> None:
+        for listener in list(self._listeners):
+            listener(event)
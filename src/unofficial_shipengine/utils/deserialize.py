@@ -0,0 +1,363 @@
+import threading
+from enum import Enum
+from types import MemberDescriptorType
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
+
+from attrs import NOTHING, Factory, fields, has, resolve_types
+from attrs.exceptions import FrozenInstanceError
+
+from .interning import FLYWEIGHT_TYPES, INTERNED_FIELDS, FlyweightTable, intern_string
+
+T = TypeVar("T")
+
+Decoder = Callable[[dict[str, Any]], Any]
+
+# Decoders keyed by their (lazy, intern) options, then by class.
+_decoders: dict[tuple[bool, bool], dict[type, Decoder]] = {
+    (lazy, intern): {} for lazy in (False, True) for intern in (False, True)
+}
+_compiling: set[tuple[type, bool, bool]] = set()
+_lock = threading.RLock()
+
+
+def decode(
+    cls: type[T], data: dict[str, Any], lazy: bool = False, intern: bool = False
+) -> T:
+    """
+    Builds an attrs model, and every model nested in it, from an API response.
+
+    The decoder of each class is generated once and reads every field straight from `data`:
+    nested models and lists of models are decoded in the same pass, enum values are looked up
+    in a table built from the enum, and keys the model has no field for are ignored. `data` is
+    never modified.
+
+    Validators are not run, the API is trusted to send valid values, so an enum value this
+    version does not know is kept as the raw value rather than rejected. A field missing from
+    `data` gets its default, or None if it has none.
+
+    A lazy model is a read-only view over `data` that decodes each field, and builds the
+    models nested in it, only when the field is first read. The view is an instance of a
+    subclass of `cls`, compares equal to the eager model and is copied into one by
+    attrs.evolve. It keeps a reference to `data`, which must not be modified afterwards.
+
+    Interning shares one instance between every identical model of a class marked with
+    flyweight, such as Address or Weight, and interns the catalog strings of INTERNED_FIELDS,
+    such as carrier_id. Shared instances must be treated as read-only.
+
+    Args:
+        cls (type[T]): The attrs class to build.
+        data (dict[str, Any]): The decoded JSON object.
+        lazy (bool): Whether to return a lazy view instead of decoding every field up front.
+        intern (bool): Whether to share identical flyweight models and intern catalog strings.
+
+    Returns:
+        T: The model.
+    """
+    decoder = _decoders[lazy, intern].get(cls)
+    if decoder is None:
+        decoder = get_decoder(cls, lazy, intern)
+    result: T = decoder(data)
+    return result
+
+
+def get_decoder(cls: type, lazy: bool = False, intern: bool = False) -> Decoder:
+    """
+    Returns the decoder of an attrs class, generating it on first use.
+
+    Args:
+        cls (type): An attrs class.
+        lazy (bool): Whether the decoder returns lazy views, see decode.
+        intern (bool): Whether the decoder shares flyweight models and interns strings, see decode.
+
+    Returns:
+        Decoder: A function building instances of `cls` from dicts.
+    """
+    decoders = _decoders[lazy, intern]
+    decoder = decoders.get(cls)
+    if decoder is not None:
+        return decoder
+
+    with _lock:
+        if cls in decoders:
+            return decoders[cls]
+
+        if (cls, lazy, intern) in _compiling:
+            # A class nested in itself: look the decoder up once it exists.
+            return lambda data: decoders[cls](data)
+
+        _compiling.add((cls, lazy, intern))
+        try:
+            if intern and cls in FLYWEIGHT_TYPES:
+                # Flyweights are small, so they are decoded eagerly even for lazy views.
+                decoder = FlyweightTable(cls, _compile_decoder(cls, True)).decode
+            elif lazy:
+                decoder = _compile_lazy_decoder(cls, intern)
+            else:
+                decoder = _compile_decoder(cls, intern)
+        finally:
+            _compiling.discard((cls, lazy, intern))
+
+        decoders[cls] = decoder
+        return decoder
+
+
+def _resolve_types(cls: type) -> None:
+    try:
+        resolve_types(cls)
+    except NameError:
+        # Forward references that cannot be resolved are decoded as plain values.
+        pass
+
+
+def _compile_decoder(cls: type, intern: bool) -> Decoder:
+    """
+    Generates the source of a decoder for `cls` and compiles it.
+
+    The instance is created without calling __init__ and every field is set through its slot,
+    or object.__setattr__ for classes without slots, which skips the validators and on_setattr
+    hooks of the class.
+    """
+    _resolve_types(cls)
+
+    namespace: dict[str, Any] = {
+        "cls": cls,
+        "new": object.__new__,
+        "setattr": object.__setattr__,
+        "MISSING": NOTHING,
+        "intern": intern_string,
+    }
+    lines: list[str] = [
+        f"def decode_{cls.__name__}(data):",
+        "    inst = new(cls)",
+        "    get = data.get",
+    ]
+
+    for i, attribute in enumerate(fields(cls)):
+        name = f"v{i}"
+        key = attribute.alias if attribute.init else attribute.name
+        expression = _field_expression(
+            name, attribute, f"t{i}", namespace, False, intern
+        )
+
+        lines.append(f"    {name} = get({key!r}, MISSING)")
+        lines.append(f"    if {name} is MISSING:")
+        lines.append(f"        {name} = {_default_expression(attribute, i, namespace)}")
+        if expression != name:
+            lines.append("    else:")
+            lines.append(f"        {name} = {expression}")
+        slot = getattr(cls, attribute.name, None)
+        if isinstance(slot, MemberDescriptorType):
+            # Writing through the slot descriptor is faster than object.__setattr__.
+            namespace[f"set{i}"] = slot.__set__
+            lines.append(f"    set{i}(inst, {name})")
+        else:
+            lines.append(f"    setattr(inst, {attribute.name!r}, {name})")
+
+    if hasattr(cls, "__attrs_post_init__"):
+        lines.append("    inst.__attrs_post_init__()")
+
+    lines.append("    return inst")
+
+    exec(compile("\n".join(lines), f"<decoder {cls.__qualname__}>", "exec"), namespace)
+
+    decoder: Decoder = namespace[f"decode_{cls.__name__}"]
+    return decoder
+
+
+def _compile_lazy_decoder(cls: type, intern: bool) -> Decoder:
+    """
+    Creates the view class of `cls` and returns a function wrapping dicts in it.
+
+    The view subclasses `cls` and shadows every field with a property that decodes the field
+    on first read and stores it in the field's slot, where later reads find it. Classes without
+    slots, or with an __attrs_post_init__ that needs every field, are decoded eagerly instead.
+    """
+    attributes = fields(cls)
+    slots = [getattr(cls, attribute.name, None) for attribute in attributes]
+
+    if hasattr(cls, "__attrs_post_init__") or not all(
+        isinstance(slot, MemberDescriptorType) for slot in slots
+    ):
+        return get_decoder(cls, False, intern)
+
+    _resolve_types(cls)
+
+    namespace: dict[str, Any] = {"MISSING": NOTHING, "intern": intern_string}
+    lines: list[str] = []
+
+    for i, (attribute, slot) in enumerate(zip(attributes, slots)):
+        name = f"v{i}"
+        key = attribute.alias if attribute.init else attribute.name
+        expression = _field_expression(
+            name, attribute, f"t{i}", namespace, True, intern
+        )
+        namespace[f"get{i}"] = cast(MemberDescriptorType, slot).__get__
+        namespace[f"set{i}"] = cast(MemberDescriptorType, slot).__set__
+
+        lines += [
+            f"def read_{attribute.name}(inst):",
+            "    try:",
+            f"        return get{i}(inst)",
+            "    except AttributeError:",
+            "        pass",
+            f"    {name} = get_data(inst).get({key!r}, MISSING)",
+            f"    if {name} is MISSING:",
+            f"        {name} = {_default_expression(attribute, i, namespace)}",
+            "    else:",
+            f"        {name} = {expression}",
+            f"    set{i}(inst, {name})",
+            f"    return {name}",
+        ]
+
+    names = tuple(attribute.name for attribute in attributes)
+
+    def __new__(view: type, *args: Any, **kwargs: Any) -> Any:
+        # attrs.evolve and copies build a new instance from the view's class, which
+        # has to be a regular instance of the model.
+        return cls(*args, **kwargs)
+
+    def __setattr__(self: Any, name: str, value: Any) -> None:
+        raise FrozenInstanceError()
+
+    def __delattr__(self: Any, name: str) -> None:
+        raise FrozenInstanceError()
+
+    def __eq__(self: Any, other: Any) -> Any:
+        if other.__class__ is not cls and other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in names)
+
+    def __ne__(self: Any, other: Any) -> Any:
+        result = __eq__(self, other)
+        return result if result is NotImplemented else not result
+
+    def __reduce__(self: Any) -> tuple[Any, ...]:
+        return decode, (cls, get_data(self))
+
+    view = type(
+        cls.__name__,
+        (cls,),
+        {
+            "__slots__": ("_view_data",),
+            "__qualname__": cls.__qualname__,
+            "__module__": cls.__module__,
+            "__new__": __new__,
+            "__setattr__": __setattr__,
+            "__delattr__": __delattr__,
+            "__eq__": __eq__,
+            "__ne__": __ne__,
+            "__hash__": cls.__hash__,
+            "__reduce__": __reduce__,
+        },
+    )
+    get_data = view._view_data.__get__  # type: ignore[attr-defined]
+    set_data = view._view_data.__set__  # type: ignore[attr-defined]
+    namespace["get_data"] = get_data
+
+    exec(compile("\n".join(lines), f"<view {cls.__qualname__}>", "exec"), namespace)
+
+    for attribute in attributes:
+        setattr(view, attribute.name, property(namespace[f"read_{attribute.name}"]))
+
+    def decode_view(data: dict[str, Any]) -> Any:
+        inst: Any = object.__new__(view)
+        set_data(inst, data)
+        return inst
+
+    return decode_view
+
+
+def _default_expression(attribute: Any, i: int, namespace: dict[str, Any]) -> str:
+    default = attribute.default
+
+    if default is NOTHING:
+        return "None"
+
+    # attrs.Factory is typed as a function but is a class at runtime.
+    is_factory = isinstance(default, cast(type, Factory))
+    namespace[f"d{i}"] = default.factory if is_factory else default
+
+    if is_factory:
+        return f"d{i}(inst)" if default.takes_self else f"d{i}()"
+
+    return f"d{i}"
+
+
+def _field_expression(
+    name: str,
+    attribute: Any,
+    type_name: str,
+    namespace: dict[str, Any],
+    lazy: bool,
+    intern: bool,
+) -> str:
+    """
+    Returns the expression converting the JSON value of a field into the type of its annotation.
+    """
+    if intern and attribute.name in INTERNED_FIELDS:
+        return f"intern({name}) if type({name}) is str else {name}"
+
+    return _value_expression(name, attribute.type, type_name, namespace, lazy, intern)
+
+
+def _value_expression(
+    name: str,
+    annotation: Any,
+    type_name: str,
+    namespace: dict[str, Any],
+    lazy: bool,
+    intern: bool,
+) -> str:
+    """
+    Returns the expression converting a JSON value into the type of its annotation.
+
+    Values that do not have the JSON type the annotation calls for, most often None,
+    are kept as they are.
+    """
+    item_type = _unwrap_optional(annotation)
+
+    if isinstance(item_type, type) and has(item_type):
+        namespace[f"decode_{type_name}"] = get_decoder(item_type, lazy, intern)
+        return f"decode_{type_name}({name}) if type({name}) is dict else {name}"
+
+    if isinstance(item_type, type) and issubclass(item_type, Enum):
+        table = {member.value: member for member in item_type}
+        namespace[f"{type_name}_members"] = table
+        namespace[f"{type_name}_values"] = frozenset(type(value) for value in table)
+        return (
+            f"{type_name}_members.get({name}, {name}) "
+            f"if type({name}) in {type_name}_values else {name}"
+        )
+
+    if get_origin(item_type) is list and get_args(item_type):
+        item_name = f"{name}_item"
+        item = _value_expression(
+            item_name,
+            get_args(item_type)[0],
+            f"{type_name}_item",
+            namespace,
+            lazy,
+            intern,
+        )
+        if item == item_name:
+            return name
+        return f"[{item} for {item_name} in {name}] if type({name}) is list else {name}"
+
+    return name
+
+
+def _unwrap_optional(annotation: Any) -> Optional[Any]:
+    if get_origin(annotation) is Union:
+        options = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(options) == 1:
+            return options[0]
+    return annotation
@@ -0,0 +1,78 @@
+import sys
+import weakref
+from typing import Any, Callable, TypeVar
+
+from attrs import NOTHING, fields
+
+T = TypeVar("T")
+
+# Catalog identifiers that repeat across most responses, interned when decoding with intern=True.
+INTERNED_FIELDS: frozenset[str] = frozenset(
+    ["carrier_id", "carrier_code", "service_code", "package_code"]
+)
+
+FLYWEIGHT_TYPES: set[type] = set()
+
+intern_string: Callable[[str], str] = sys.intern
+
+
+def flyweight(cls: type[T]) -> type[T]:
+    """
+    Marks an attrs class whose decoded instances are shared when decoding with intern=True.
+
+    Only mark small classes whose fields are plain JSON values, which are compared to find
+    identical instances.
+    """
+    FLYWEIGHT_TYPES.add(cls)
+    return cls
+
+
+class FlyweightTable:
+    """
+    FlyweightTable hands out one shared instance per distinct JSON object of a class.
+
+    Instances are looked up by the raw values of their fields, before anything is decoded,
+    and only held weakly, so an instance is dropped once no model refers to it anymore.
+
+    Args:
+        cls (type): A class marked with flyweight.
+        decoder (Callable[[dict[str, Any]], Any]): Decodes the instances that are not in the table yet.
+    """
+
+    def __init__(self, cls: type, decoder: Callable[[dict[str, Any]], Any]) -> None:
+        self._keys = tuple(
+            attribute.alias if attribute.init else attribute.name
+            for attribute in fields(cls)
+        )
+        self._decoder = decoder
+        self._instances: weakref.WeakValueDictionary[Any, Any] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def decode(self, data: dict[str, Any]) -> Any:
+        """
+        Returns the shared instance for `data`, decoding it if there is none yet.
+
+        Args:
+            data (dict[str, Any]): The decoded JSON object.
+
+        Returns:
+            Any: The shared instance.
+        """
+        values = tuple([data.get(key, NOTHING) for key in self._keys])
+        # The types are part of the key, so 1 and 1.0 or True do not share an instance.
+        key = (values, tuple(map(type, values)))
+
+        try:
+            inst = self._instances.get(key)
+        except TypeError:
+            # A value that cannot be hashed, e.g. a list, is not shared.
+            return self._decoder(data)
+
+        if inst is None:
+            inst = self._instances.setdefault(key, self._decoder(data))
+
+        return inst
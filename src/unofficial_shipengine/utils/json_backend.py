@@ -0,0 +1,103 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Union
+
+
+class JSONBackend(ABC):
+    """
+    JSONBackend parses response bodies and encodes request bodies.
+
+    Both directions work on bytes, the form bodies are received and sent in, so no
+    str is built just to be decoded or encoded again.
+    """
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Parses a JSON document.
+
+        Args:
+            data (Union[bytes, str]): The document, as UTF-8 bytes or text.
+
+        Returns:
+            Any: The parsed value.
+        """
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encodes a JSON-ready value.
+
+        Args:
+            value (Any): Dicts, lists, tuples, strings, numbers, booleans and None.
+
+        Returns:
+            bytes: The UTF-8 encoded document.
+        """
+
+
+class StdlibJSONBackend(JSONBackend):
+    """StdlibJSONBackend uses the json module of the standard library."""
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    OrjsonBackend uses orjson, which parses and encodes several times faster than json.
+
+    Install it with the orjson extra: `pip install unofficial_shipengine[orjson]`.
+
+    Raises:
+        ImportError: If orjson is not installed.
+    """
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError(
+                "OrjsonBackend requires orjson. "
+                "Install it with `pip install unofficial_shipengine[orjson]`."
+            ) from e
+
+        self._orjson = orjson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        # Like json.dumps, accept dicts keyed by numbers or enums.
+        result: bytes = self._orjson.dumps(value, option=self._orjson.OPT_NON_STR_KEYS)
+        return result
+
+
+_default_backend: Optional[JSONBackend] = None
+
+
+def get_json_backend(backend: Optional[JSONBackend] = None) -> JSONBackend:
+    """
+    Returns `backend`, or the fastest backend installed if it is None.
+
+    Args:
+        backend (Optional[JSONBackend]): The configured backend.
+
+    Returns:
+        JSONBackend: An OrjsonBackend when orjson is installed, a StdlibJSONBackend otherwise.
+    """
+    global _default_backend
+
+    if backend is not None:
+        return backend
+
+    if _default_backend is None:
+        try:
+            _default_backend = OrjsonBackend()
+        except ImportError:
+            _default_backend = StdlibJSONBackend()
+
+    return _default_backend
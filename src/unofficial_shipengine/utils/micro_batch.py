@@ -0,0 +1,251 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Generic, Optional, TypeVar, cast
+
+from ..exceptions import DeadlineExceededError
+from .timeouts import check_deadline, get_remaining
+
+R = TypeVar("R")
+T = TypeVar("T")
+
+
+class _Batch(Generic[R, T]):
+    def __init__(self) -> None:
+        self.items: list[R] = []
+        self.results: list[Any] = []
+        self.errors: list[Optional[BaseException]] = []
+        self.done = threading.Event()
+
+    def result(self, index: int) -> T:
+        error = self.errors[index]
+        if error is not None:
+            raise error
+        result: T = self.results[index]
+        return result
+
+    def finish(self, results: list[T]) -> None:
+        _check_count(results, len(self.items))
+        self.results = list(results)
+        self.errors = [None] * len(self.items)
+
+    def fail(self, error: BaseException) -> None:
+        self.results = [None] * len(self.items)
+        self.errors = [error] * len(self.items)
+
+    def add(self, result: Any, error: Optional[BaseException]) -> None:
+        self.results.append(result)
+        self.errors.append(error)
+
+
+class MicroBatcher(Generic[R, T]):
+    """
+    MicroBatcher gathers single-item calls from many threads and sends them as one call.
+
+    The first caller of a batch waits up to `max_delay` seconds, or until `max_size` items
+    have joined it, then sends every item with `send` and hands each caller the result at
+    its item's position. There is no background thread: the first caller does the sending,
+    within its own deadline, while the others wait for it.
+
+    When `send` raises an error `split_on` accepts for a batch of several items, e.g. the API
+    rejecting the whole request over one invalid item, every item is sent again on its own so
+    only the callers of failing items get an error. Any other error, and a batch answered with
+    the wrong number of results, is raised to every caller without sending anything again, as
+    the batch may already have taken effect.
+
+    Args:
+        send (Callable[[list[R]], list[T]]): Sends a batch, returning one result per item in order.
+        max_size (int): The number of items that sends a batch right away.
+        max_delay (float): The longest a batch waits for more items, in seconds.
+        split_on (Optional[Callable[[Exception], bool]]): Whether an error of a batch means nothing was
+            done, so its items are retried one by one. Defaults to never.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[R]], list[T]],
+        max_size: int,
+        max_delay: float,
+        split_on: Optional[Callable[[Exception], bool]] = None,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+
+        self._send = send
+        self._max_size = max_size
+        self._max_delay = max_delay
+        self._split_on = split_on
+        self._batch: _Batch[R, T] = _Batch()
+        self._lock = threading.Lock()
+        self._closed = threading.Condition(self._lock)
+
+    def submit(self, item: R) -> T:
+        """
+        Sends `item` as part of the next batch and returns its result.
+
+        Args:
+            item (R): The item.
+
+        Returns:
+            T: The result for the item.
+
+        Raises:
+            DeadlineExceededError: If the deadline passes while waiting for another caller's batch.
+            Exception: The error the batch, or the item on its own, failed with.
+        """
+        with self._lock:
+            batch = self._batch
+            index = len(batch.items)
+            batch.items.append(item)
+            if len(batch.items) >= self._max_size:
+                self._close()
+
+        if index > 0:
+            while not batch.done.wait(get_remaining()):
+                check_deadline()
+            return batch.result(index)
+
+        with self._lock:
+            self._closed.wait_for(lambda: self._batch is not batch, self._max_delay)
+            if self._batch is batch:
+                self._close()
+
+        try:
+            self._run(batch)
+        finally:
+            batch.done.set()
+
+        return batch.result(index)
+
+    def _close(self) -> None:
+        # Items arriving from now on start the next batch.
+        self._batch = _Batch()
+        self._closed.notify_all()
+
+    def _run(self, batch: _Batch[R, T]) -> None:
+        try:
+            try:
+                results = self._send(batch.items)
+            except Exception as e:
+                if not _splits(self._split_on, e, batch):
+                    raise
+                for item in batch.items:
+                    batch.add(*self._send_one(item))
+                return
+            batch.finish(results)
+        except BaseException as e:
+            batch.fail(e)
+            if not isinstance(e, Exception):
+                raise
+
+    def _send_one(self, item: R) -> tuple[Any, Optional[Exception]]:
+        try:
+            [result] = _check_count(self._send([item]), 1)
+        except Exception as e:
+            return None, e
+        return result, None
+
+
+class _TaskBatch(_Batch[R, T]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.full = asyncio.Event()
+        self.task: Optional[asyncio.Task[None]] = None
+
+
+class AsyncMicroBatcher(Generic[R, T]):
+    """
+    AsyncMicroBatcher is the awaitable counterpart of MicroBatcher.
+
+    Each batch is sent from a task of its own, so cancelling a caller never strands the
+    other callers of its batch, and each caller stops waiting for it at its own deadline.
+
+    Args:
+        send (Callable[[list[R]], Awaitable[list[T]]]): Sends a batch, returning one result per item in order.
+        max_size (int): The number of items that sends a batch right away.
+        max_delay (float): The longest a batch waits for more items, in seconds.
+        split_on (Optional[Callable[[Exception], bool]]): Whether an error of a batch means nothing was
+            done, so its items are retried one by one. Defaults to never.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[R]], Awaitable[list[T]]],
+        max_size: int,
+        max_delay: float,
+        split_on: Optional[Callable[[Exception], bool]] = None,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+
+        self._send = send
+        self._max_size = max_size
+        self._max_delay = max_delay
+        self._split_on = split_on
+        self._batch: Optional[_TaskBatch[R, T]] = None
+
+    async def submit(self, item: R) -> T:
+        """Sends `item` as part of the next batch and returns its result. See MicroBatcher.submit."""
+        batch = self._batch
+        if batch is None:
+            batch = self._batch = _TaskBatch()
+            batch.task = asyncio.ensure_future(self._flush(batch))
+
+        index = len(batch.items)
+        batch.items.append(item)
+        if len(batch.items) >= self._max_size:
+            batch.full.set()
+            self._batch = None
+
+        task = cast("asyncio.Task[None]", batch.task)
+        # asyncio.wait never cancels the task, and leaves its errors to batch.result.
+        await asyncio.wait([task], timeout=get_remaining())
+        if not task.done():
+            raise DeadlineExceededError(get_remaining() or 0.0)
+
+        return batch.result(index)
+
+    async def _flush(self, batch: _TaskBatch[R, T]) -> None:
+        try:
+            try:
+                await asyncio.wait_for(batch.full.wait(), self._max_delay)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                if self._batch is batch:
+                    self._batch = None
+
+            try:
+                results = await self._send(batch.items)
+            except Exception as e:
+                if not _splits(self._split_on, e, batch):
+                    raise
+                for item in batch.items:
+                    batch.add(*await self._send_one(item))
+                return
+            batch.finish(results)
+        except BaseException as e:
+            # Callers of the batch get the error, even a cancellation of the batch's task.
+            batch.fail(e)
+            if not isinstance(e, Exception):
+                raise
+
+    async def _send_one(self, item: R) -> tuple[Any, Optional[Exception]]:
+        try:
+            [result] = _check_count(await self._send([item]), 1)
+        except Exception as e:
+            return None, e
+        return result, None
+
+
+def _splits(
+    split_on: Optional[Callable[[Exception], bool]],
+    error: Exception,
+    batch: _Batch[Any, Any],
+) -> bool:
+    return split_on is not None and len(batch.items) > 1 and split_on(error)
+
+
+def _check_count(results: list[T], count: int) -> list[T]:
+    if len(results) != count:
+        raise ValueError(f"Expected {count} results for the batch, got {len(results)}")
+    return results
@@ -0,0 +1,128 @@
+import asyncio
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# The items of a page, and whether there is a page after it.
+Page = tuple[list[T], bool]
+
+
+def query_params(**params: Any) -> dict[str, Any]:
+    """
+    Builds the query parameters of a list endpoint from its filters.
+
+    Args:
+        **params (Any): The filters, by parameter name. None values are left out, enums are sent
+            by value and datetimes in ISO 8601.
+
+    Returns:
+        dict[str, Any]: The query parameters.
+    """
+    query: dict[str, Any] = {}
+
+    for name, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        query[name] = value
+
+    return query
+
+
+def has_next_page(response_dict: dict[str, Any], page: int) -> bool:
+    """
+    Tells whether a paged response of the API has a page after it.
+
+    Args:
+        response_dict (dict[str, Any]): The parsed response.
+        page (int): The number of the page, starting at 1.
+
+    Returns:
+        bool: Whether there is a next page, from the page count or else the next link.
+    """
+    pages = response_dict.get("pages")
+    if pages is not None:
+        has_next: bool = page < pages
+        return has_next
+
+    links = response_dict.get("links") or {}
+    return bool(links.get("next"))
+
+
+def paginate(fetch_page: Callable[[int], Page[T]], prefetch: bool) -> Iterator[T]:
+    """
+    Yields the items of every page of a paged endpoint, fetching the pages as they are needed.
+
+    Only the page being consumed is held, plus the next one with prefetch, so memory stays flat
+    however many pages there are. With prefetch, the next page is fetched from a background
+    thread, in a copy of the caller's context, while the caller works through the current one.
+
+    Args:
+        fetch_page (Callable[[int], Page[T]]): Fetches a page by number, starting at 1.
+        prefetch (bool): Whether to fetch the next page ahead of time. Only use it with a session that is
+            safe to share between threads.
+
+    Returns:
+        Iterator[T]: The items.
+    """
+    if not prefetch:
+        page = 1
+        while True:
+            items, has_next = fetch_page(page)
+            yield from items
+            if not has_next:
+                return
+            page += 1
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        future: Future[Page[T]] = executor.submit(
+            contextvars.copy_context().run, fetch_page, 1
+        )
+        page = 1
+        while True:
+            items, has_next = future.result()
+            if has_next:
+                page += 1
+                future = executor.submit(
+                    contextvars.copy_context().run, fetch_page, page
+                )
+            yield from items
+            if not has_next:
+                return
+    finally:
+        # A page still being fetched when the caller stops is dropped.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def async_paginate(
+    fetch_page: Callable[[int], Awaitable[Page[T]]],
+) -> AsyncIterator[T]:
+    """
+    Yields the items of every page of a paged endpoint. See paginate.
+
+    The next page is always fetched ahead of time, from a task of its own that is cancelled if
+    the caller stops early.
+    """
+    page = 1
+    task: asyncio.Future[Page[T]] = asyncio.ensure_future(fetch_page(page))
+
+    try:
+        while True:
+            items, has_next = await task
+            if has_next:
+                page += 1
+                task = asyncio.ensure_future(fetch_page(page))
+            for item in items:
+                yield item
+            if not has_next:
+                return
+    finally:
+        task.cancel()
@@ -0,0 +1,67 @@
+import time
+from typing import Callable, Optional
+
+
+class AdaptivePoller:
+    """
+    AdaptivePoller picks the delay before the next status poll of a long-running job from its progress.
+
+    While the job makes progress, the next poll is planned for halfway to when it should finish at
+    its current rate, so polls get closer together as the job nears its end. While it makes none,
+    the delay doubles. Delays always stay between `min_interval` and `max_interval`.
+
+    Args:
+        min_interval (float): The shortest delay, in seconds.
+        max_interval (float): The longest delay, in seconds.
+        clock (Callable[[], float]): Returns the current time in seconds. Defaults to time.monotonic.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < min_interval <= max_interval:
+            raise ValueError(
+                f"Invalid poll intervals: min {min_interval}, max {max_interval}"
+            )
+
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._clock = clock
+        self._delay = min_interval
+        self._last: Optional[tuple[int, float]] = None
+
+    def next_delay(self, done: int, total: int) -> float:
+        """
+        Records the progress seen by a poll and returns the delay before the next one.
+
+        Args:
+            done (int): The units of work the job has finished.
+            total (int): The units of work of the whole job.
+
+        Returns:
+            float: The delay, in seconds.
+        """
+        now = self._clock()
+
+        if self._last is None:
+            delay = self.min_interval
+        else:
+            last_done, last_time = self._last
+            progress = done - last_done
+            elapsed = now - last_time
+
+            if done >= total:
+                # Everything is done, only the status has yet to change.
+                delay = self.min_interval
+            elif progress > 0 and elapsed > 0:
+                delay = (total - done) * elapsed / progress / 2
+            else:
+                delay = self._delay * 2
+
+        self._delay = min(max(delay, self.min_interval), self.max_interval)
+        self._last = (done, now)
+
+        return self._delay
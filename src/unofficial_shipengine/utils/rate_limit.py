@@ -0,0 +1,259 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Optional, TypeVar, Union
+
+from attrs import define, asdict
+
+from .timeouts import check_deadline
+
+T = TypeVar("T")
+
+
+@define
+class RateLimitState:
+    """
+    RateLimitState is the token bucket state a RateLimitBackend stores.
+
+    Times are wall clock timestamps so several processes can share one state.
+
+    Attributes:
+        tokens (float): Requests that may be sent right away.
+        updated_at (float): When tokens was last refilled.
+        blocked_until (float): No request may be sent before this time, set from a 429 Retry-After.
+    """
+
+    tokens: float
+    updated_at: float
+    blocked_until: float = 0.0
+
+
+class RateLimitBackend(ABC):
+    """
+    RateLimitBackend stores a RateLimitState and applies updates to it atomically.
+
+    Implement this to share one rate limit between whatever the backend can reach,
+    e.g. a Redis key shared by several hosts.
+
+    Attributes:
+        blocking (bool): Whether `transact` may block, e.g. on a file lock or a network call.
+            The async client then runs it in a worker thread instead of on the event loop.
+    """
+
+    blocking: bool = True
+
+    @abstractmethod
+    def transact(
+        self,
+        update: Callable[[Optional[RateLimitState]], tuple[RateLimitState, T]],
+    ) -> T:
+        """
+        Atomically replaces the stored state with the one computed by `update`.
+
+        Args:
+            update (Callable): Receives the stored state, or None if there is none yet,
+                and returns the new state along with a result.
+
+        Returns:
+            T: The result returned by `update`.
+        """
+
+
+class InMemoryBackend(RateLimitBackend):
+    """InMemoryBackend keeps the state in memory, shared by every thread of the process."""
+
+    blocking = False
+
+    def __init__(self) -> None:
+        self._state: Optional[RateLimitState] = None
+        self._lock = threading.Lock()
+
+    def transact(
+        self,
+        update: Callable[[Optional[RateLimitState]], tuple[RateLimitState, T]],
+    ) -> T:
+        with self._lock:
+            self._state, result = update(self._state)
+        return result
+
+
+class FileLockBackend(RateLimitBackend):
+    """
+    FileLockBackend keeps the state in a file guarded by an OS file lock, so every
+    process on the host that points at the same path shares one rate limit.
+
+    Args:
+        path (Union[str, os.PathLike[str]]): The state file, created on first use.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = Path(path)
+
+    def transact(
+        self,
+        update: Callable[[Optional[RateLimitState]], tuple[RateLimitState, T]],
+    ) -> T:
+        with open(self.path, "a+b") as f:
+            _lock_file(f.fileno())
+            try:
+                f.seek(0)
+                raw = f.read()
+                state = RateLimitState(**json.loads(raw)) if raw else None
+
+                state, result = update(state)
+
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(asdict(state)).encode())
+                f.flush()
+            finally:
+                _unlock_file(f.fileno())
+
+        return result
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class RateLimiter:
+    """
+    RateLimiter is a token bucket that throttles requests before they reach the API.
+
+    The bucket holds up to `burst` tokens and refills at `rate` tokens per second,
+    every request takes one token and waits while the bucket is empty. After a 429
+    response `pause` blocks every caller sharing the bucket until Retry-After has
+    passed, not just the one that got rate limited.
+
+    Args:
+        rate (float): Requests per second allowed on average.
+        burst (Optional[int]): How many requests may be sent back to back. Defaults to max(1, rate).
+        backend (Optional[RateLimitBackend]): Where the bucket lives. Defaults to an InMemoryBackend
+            shared by the threads of this process, use a FileLockBackend to share it between processes.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        backend: Optional[RateLimitBackend] = None,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.backend = backend if backend is not None else InMemoryBackend()
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request may be sent.
+
+        Raises:
+            DeadlineExceededError: If the current deadline would pass before then.
+        """
+        while (wait := self.backend.transact(self._take)) > 0:
+            check_deadline(wait)
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Waits, without blocking the event loop, until a request may be sent. See RateLimiter.acquire."""
+        while (wait := await self._transact_async(self._take)) > 0:
+            check_deadline(wait)
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Holds back every request sharing this limiter for the given number of seconds."""
+        self.backend.transact(self._block(seconds))
+
+    async def pause_async(self, seconds: float) -> None:
+        """See RateLimiter.pause, without blocking the event loop."""
+        await self._transact_async(self._block(seconds))
+
+    async def _transact_async(
+        self,
+        update: Callable[[Optional[RateLimitState]], tuple[RateLimitState, T]],
+    ) -> T:
+        if self.backend.blocking:
+            return await asyncio.to_thread(self.backend.transact, update)
+        return self.backend.transact(update)
+
+    @staticmethod
+    def _block(
+        seconds: float,
+    ) -> Callable[[Optional[RateLimitState]], tuple[RateLimitState, None]]:
+        def block(state: Optional[RateLimitState]) -> tuple[RateLimitState, None]:
+            now = time.time()
+            state = state or RateLimitState(tokens=0.0, updated_at=now)
+            state.blocked_until = max(state.blocked_until, now + seconds)
+            return state, None
+
+        return block
+
+    def _take(self, state: Optional[RateLimitState]) -> tuple[RateLimitState, float]:
+        now = time.time()
+
+        if state is None:
+            state = RateLimitState(tokens=float(self.burst), updated_at=now)
+
+        if now < state.blocked_until:
+            return state, state.blocked_until - now
+
+        elapsed = max(0.0, now - state.updated_at)
+        state.tokens = min(float(self.burst), state.tokens + elapsed * self.rate)
+        state.updated_at = now
+
+        if state.tokens >= 1:
+            state.tokens -= 1
+            return state, 0.0
+
+        return state, (1 - state.tokens) / self.rate
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After header into seconds to wait.
+
+    Args:
+        value (Optional[str]): The header value, either delay-seconds or an HTTP date.
+
+    Returns:
+        Optional[float]: The seconds to wait, or None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
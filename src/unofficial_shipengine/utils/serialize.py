@@ -1,7 +1,316 @@
+import json
+import threading
+from functools import partial
 from enum import Enum
+from typing import Any, Callable, Union, cast, get_args, get_origin
+
+from attrs import NOTHING, Factory, fields, has
+
+Encoder = Callable[[Any], dict[str, Any]]
+FieldEncoder = Callable[[Any], Any]
+
+# Returned by field encoders for values a sparse encoder leaves out.
+OMIT: Any = object()
+
+# The types attrs.asdict copies as they are.
+ATOMIC_TYPES: frozenset[type] = frozenset(
+    [
+        type(None),
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        type,
+        type(Ellipsis),
+        property,
+        range,
+    ]
+)
+COLLECTION_TYPES = (tuple, list, set, frozenset)
+
+_encoders: dict[type, Encoder] = {}
+_sparse_encoders: dict[type, Encoder] = {}
+_field_encoders: dict[tuple[type, bool], dict[str, FieldEncoder]] = {}
+_compiling: set[tuple[type, bool]] = set()
+_lock = threading.RLock()
 
 
 def serializer(inst, field, value):
     if isinstance(value, Enum):
         return value.value
     return value
+
+
+def to_dict(inst: Any, sparse: bool = False) -> dict[str, Any]:
+    """
+    Converts an attrs model into the dict sent to the API.
+
+    Gives the same result as `asdict(inst, value_serializer=serializer)`, but through an
+    encoder generated once per class that reads every field directly, instead of walking
+    the fields and calling the serializer on every value for every instance.
+
+    A sparse dict leaves out the fields the API reads the same whether they are sent or
+    not: fields set to None, and fields still at a default of False or an empty list. Fields
+    with any other default, e.g. country_code="US" or an enum, are always sent, as the API
+    may default them differently.
+
+    Args:
+        inst (Any): An instance of an attrs class.
+        sparse (bool): Whether to leave out unset fields, in this model and every model nested in it.
+
+    Returns:
+        dict[str, Any]: The model as a JSON-ready dict, with enums replaced by their values.
+    """
+    encoder = (_sparse_encoders if sparse else _encoders).get(type(inst))
+    if encoder is None:
+        encoder = get_encoder(type(inst), sparse)
+    return encoder(inst)
+
+
+def to_json(value: Any, sparse: bool = False) -> str:
+    """
+    Converts an attrs model, or a list or dict of them, into the JSON sent to the API.
+
+    Args:
+        value (Any): The value to encode.
+        sparse (bool): Whether to leave out unset fields of models, see to_dict.
+
+    Returns:
+        str: The JSON document.
+    """
+    return json.dumps(encode_value(value, sparse))
+
+
+def encode_value(value: Any, sparse: bool = False) -> Any:
+    """
+    Converts any value into its JSON-ready form the way attrs.asdict converts attribute values.
+
+    Like attrs.asdict, tuples and sets keep their type and json.dumps turns tuples into arrays.
+
+    Args:
+        value (Any): The value to encode.
+        sparse (bool): Whether to leave out unset fields of models, see to_dict.
+
+    Returns:
+        Any: The encoded value.
+    """
+    value_type = type(value)
+
+    if value_type in ATOMIC_TYPES:
+        return value
+
+    encoder = (_sparse_encoders if sparse else _encoders).get(value_type)
+    if encoder is not None:
+        return encoder(value)
+
+    if has(value_type):
+        return get_encoder(value_type, sparse)(value)
+    if isinstance(value, Enum):
+        return encode_value(value.value, sparse)
+    if isinstance(value, COLLECTION_TYPES):
+        items = [encode_value(item, sparse) for item in value]
+        if value_type is list:
+            return items
+        try:
+            return value_type(items)
+        except TypeError:
+            if not issubclass(value_type, tuple):
+                raise
+            # A namedtuple takes its items as separate arguments.
+            return value_type(*items)
+    if isinstance(value, dict):
+        return {
+            encode_value(k, sparse): encode_value(v, sparse) for k, v in value.items()
+        }
+
+    return value
+
+
+def get_encoder(cls: type, sparse: bool = False) -> Encoder:
+    """
+    Returns the encoder of an attrs class, generating it on first use.
+
+    Args:
+        cls (type): An attrs class.
+        sparse (bool): Whether the encoder leaves out unset fields, see to_dict.
+
+    Returns:
+        Encoder: A function converting instances of `cls` into dicts.
+    """
+    encoders = _sparse_encoders if sparse else _encoders
+    encoder = encoders.get(cls)
+    if encoder is not None:
+        return encoder
+
+    with _lock:
+        if cls in encoders:
+            return encoders[cls]
+
+        if (cls, sparse) in _compiling:
+            # A class nested in itself: look the encoder up once it exists.
+            return lambda inst: encoders[cls](inst)
+
+        _compiling.add((cls, sparse))
+        try:
+            encoder = _compile_encoder(cls, sparse)
+        finally:
+            _compiling.discard((cls, sparse))
+
+        encoders[cls] = encoder
+        return encoder
+
+
+def _compile_encoder(cls: type, sparse: bool) -> Encoder:
+    """
+    Generates the source of an encoder for `cls` and compiles it.
+
+    Every field gets a fast path picked from its annotation, e.g. a nested model is handed
+    straight to that model's encoder and an enum is replaced by its value, guarded by a type
+    check that falls back to encode_value for anything the annotation did not promise.
+    A sparse encoder only sets the fields whose value is not omittable, see _omit_condition.
+    """
+    namespace: dict[str, Any] = {
+        "ATOMIC_TYPES": ATOMIC_TYPES,
+        "encode_value": partial(encode_value, sparse=True) if sparse else encode_value,
+    }
+    lines: list[str] = []
+
+    for i, attribute in enumerate(fields(cls)):
+        name = f"v{i}"
+        lines.append(f"    {name} = inst.{attribute.name}")
+        expression = _field_expression(name, attribute.type, f"t{i}", namespace, sparse)
+        assignment = f"result[{attribute.name!r}] = {expression}"
+        if sparse:
+            lines.append(f"    if not ({_omit_condition(name, attribute)}):")
+            lines.append(f"        {assignment}")
+        else:
+            lines.append(f"    {assignment}")
+
+    source = "\n".join(
+        [
+            f"def encode_{cls.__name__}(inst):",
+            "    result = {}",
+            *lines,
+            "    return result",
+        ]
+    )
+    exec(compile(source, f"<encoder {cls.__qualname__}>", "exec"), namespace)
+
+    encoder: Encoder = namespace[f"encode_{cls.__name__}"]
+    return encoder
+
+
+def get_field_encoders(cls: type, sparse: bool = False) -> dict[str, FieldEncoder]:
+    """
+    Returns functions encoding the value of each field of an attrs class on its own.
+
+    They encode a value the way the encoder of the class would in that field, for building
+    a dict from only some of the fields.
+
+    Args:
+        cls (type): An attrs class.
+        sparse (bool): Whether a value the sparse encoder leaves out is encoded as OMIT.
+
+    Returns:
+        dict[str, FieldEncoder]: The function of each field, by field name.
+    """
+    field_encoders = _field_encoders.get((cls, sparse))
+    if field_encoders is not None:
+        return field_encoders
+
+    with _lock:
+        if (cls, sparse) not in _field_encoders:
+            _field_encoders[cls, sparse] = _compile_field_encoders(cls, sparse)
+        return _field_encoders[cls, sparse]
+
+
+def _compile_field_encoders(cls: type, sparse: bool) -> dict[str, FieldEncoder]:
+    namespace: dict[str, Any] = {
+        "ATOMIC_TYPES": ATOMIC_TYPES,
+        "OMIT": OMIT,
+        "encode_value": partial(encode_value, sparse=True) if sparse else encode_value,
+    }
+    lines: list[str] = []
+
+    for i, attribute in enumerate(fields(cls)):
+        name = f"v{i}"
+        expression = _field_expression(name, attribute.type, f"t{i}", namespace, sparse)
+        lines.append(f"def encode_{attribute.name}({name}):")
+        if sparse:
+            lines.append(f"    if {_omit_condition(name, attribute)}:")
+            lines.append("        return OMIT")
+        lines.append(f"    return {expression}")
+
+    source = "\n".join(lines)
+    exec(compile(source, f"<field encoders {cls.__qualname__}>", "exec"), namespace)
+
+    return {
+        attribute.name: namespace[f"encode_{attribute.name}"]
+        for attribute in fields(cls)
+    }
+
+
+def _omit_condition(name: str, attribute: Any) -> str:
+    """
+    Returns the condition under which a sparse encoder leaves a field out.
+
+    None is always left out. False and empty lists are only left out when they are the
+    field's default, since that is how the API reads a missing flag or list as well.
+    """
+    default = attribute.default
+    # attrs.Factory is typed as a function but is a class at runtime.
+    is_factory = isinstance(default, cast(type, Factory))
+    if is_factory:
+        default = default.factory() if default.factory in (list, dict) else NOTHING
+
+    if default is False:
+        return f"{name} is None or {name} is False"
+    if type(default) in (list, dict) and not default:
+        return f"{name} is None or (type({name}) is {type(default).__name__} and not {name})"
+
+    return f"{name} is None"
+
+
+def _field_expression(
+    name: str,
+    annotation: Any,
+    type_name: str,
+    namespace: dict[str, Any],
+    sparse: bool,
+) -> str:
+    fallback = f"{name} if type({name}) in ATOMIC_TYPES else encode_value({name})"
+
+    if isinstance(annotation, type) and has(annotation):
+        namespace[type_name] = annotation
+        namespace[f"encode_{type_name}"] = get_encoder(annotation, sparse)
+        return (
+            f"encode_{type_name}({name}) if type({name}) is {type_name} "
+            f"else {fallback}"
+        )
+
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        namespace[type_name] = annotation
+        return (
+            f"encode_value({name}.value) if type({name}) is {type_name} "
+            f"else {fallback}"
+        )
+
+    if get_origin(annotation) is Union:
+        options = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(options) == 1:
+            return _field_expression(name, options[0], type_name, namespace, sparse)
+
+    if get_origin(annotation) is list:
+        (item_type,) = get_args(annotation) or (Any,)
+        item_name = f"{name}_item"
+        item = _field_expression(
+            item_name, item_type, f"{type_name}_item", namespace, sparse
+        )
+        return (
+            f"[{item} for {item_name} in {name}] if type({name}) is list "
+            f"else {fallback}"
+        )
+
+    return fallback
@@ -0,0 +1,61 @@
+import threading
+import weakref
+from typing import Any, Callable, Optional, Union
+
+import requests
+
+
+class ThreadLocalSession(requests.Session):
+    """
+    ThreadLocalSession is a requests.Session that sends every request through a
+    session owned by the calling thread.
+
+    requests.Session is not thread-safe: cookies, headers and redirect state are
+    shared mutable objects. Each thread that makes a request gets its own session
+    from `session_factory` the first time it calls in, and keeps it until the
+    thread exits. The factory should mount one shared HTTPAdapter on every session
+    it builds so all threads still draw from a single, thread-safe connection pool.
+
+    Args:
+        session_factory (Callable[[], requests.Session]): Builds the session for a new thread.
+    """
+
+    def __init__(self, session_factory: Callable[[], requests.Session]) -> None:
+        super().__init__()
+        self._session_factory = session_factory
+        self._local = threading.local()
+        self._sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> requests.Session:
+        """The session owned by the calling thread, created on first use."""
+        session: Optional[requests.Session] = getattr(self._local, "session", None)
+
+        if session is None:
+            session = self._session_factory()
+            self._local.session = session
+            with self._lock:
+                self._sessions.add(session)
+
+        return session
+
+    def request(  # type: ignore[override]
+        self,
+        method: Union[str, bytes],
+        url: Union[str, bytes],
+        *args: Any,
+        **kwargs: Any
+    ) -> requests.Response:
+        return self.current.request(method, url, *args, **kwargs)
+
+    def close(self) -> None:
+        """Closes the sessions of every thread, along with their adapters."""
+        with self._lock:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+        super().close()
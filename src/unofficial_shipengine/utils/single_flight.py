@@ -0,0 +1,99 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+
+from .timeouts import check_deadline, get_remaining
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    SingleFlight coalesces concurrent calls made with the same key into one.
+
+    The first caller of a key runs the function, every caller that arrives while it is
+    still running waits for it and gets the same result, or the same exception raised.
+    The result is shared, not copied, so callers must treat it as read-only. Once the call
+    finishes the key is forgotten, so the next call runs the function again.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Runs `fn`, unless a call with the same key is in flight, and returns its result.
+
+        Args:
+            key (Hashable): Identifies calls that return the same result.
+            fn (Callable[[], T]): Produces the result.
+
+        Returns:
+            T: The result of the call.
+
+        Raises:
+            DeadlineExceededError: If the current deadline passes while waiting on another caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            while not call.done.wait(get_remaining()):
+                check_deadline()
+            if call.error is not None:
+                raise call.error
+            result: T = call.result
+            return result
+
+        try:
+            result = call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return result
+
+
+class AsyncSingleFlight:
+    """
+    AsyncSingleFlight is the asyncio counterpart of SingleFlight, for calls made on one event loop.
+
+    The function runs in a task of its own that every caller awaits, so cancelling one caller,
+    even the first, never cancels the call the others are waiting for.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Awaits `fn`, unless a call with the same key is in flight. See SingleFlight.do."""
+        call = self._calls.get(key)
+
+        if call is None:
+            call = self._calls[key] = asyncio.ensure_future(fn())
+            call.add_done_callback(lambda done: self._forget(key, done))
+
+        result: T = await asyncio.shield(call)
+        return result
+
+    def _forget(self, key: Hashable, call: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        # Retrieve the exception so it is not reported when every caller was cancelled.
+        if not call.cancelled():
+            call.exception()
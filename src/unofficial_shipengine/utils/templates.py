@@ -0,0 +1,152 @@
+from typing import Any, Generic, TypeVar, cast
+
+from attrs import NOTHING, Factory, fields
+
+from .json_backend import JSONBackend
+from .serialize import OMIT, get_field_encoders
+
+T = TypeVar("T")
+
+
+class RequestTemplate(Generic[T]):
+    """
+    RequestTemplate encodes the fields many requests share once, and only the rest per request.
+
+    Every field of the model that is not passed to encode is taken from the template: the
+    shared value it was created with, or the field's default. Those fields are encoded into
+    JSON when a set of varying fields is first used, and the varying fields of each request
+    are spliced in next to them. A varying field overrides its shared value.
+
+    A shared value can itself be a RequestTemplate, e.g. the shipment of a label request,
+    in which case a request passes a dict of that template's varying fields for it, or a
+    model that replaces it.
+
+    Create templates with the template method of a service, which picks the JSON backend
+    and sparse setting of the client.
+
+    Args:
+        cls (type[T]): The request model.
+        json_backend (JSONBackend): Encodes the request bodies.
+        sparse (bool): Whether to leave out unset fields, see to_dict.
+        **shared (Any): The values of the shared fields, by field name.
+
+    Raises:
+        TypeError: If a shared field is not a field of `cls`.
+    """
+
+    def __init__(
+        self,
+        cls: type[T],
+        json_backend: JSONBackend,
+        sparse: bool = False,
+        **shared: Any,
+    ) -> None:
+        attributes = fields(cast(Any, cls))
+        unknown = shared.keys() - {attribute.name for attribute in attributes}
+        if unknown:
+            raise TypeError(f"{cls.__name__} has no fields {sorted(unknown)}")
+
+        self.cls = cls
+        self._json = json_backend
+        self._aliases = {attribute.name: attribute.alias for attribute in attributes}
+        self._encoders = get_field_encoders(cls, sparse)
+        self._values: dict[str, Any] = {
+            attribute.name: shared.get(attribute.name, _default(attribute))
+            for attribute in attributes
+        }
+        self._templates: dict[str, RequestTemplate[Any]] = {
+            name: value
+            for name, value in self._values.items()
+            if isinstance(value, RequestTemplate)
+        }
+        self._encoded: dict[str, Any] = {}
+        for name, value in self._values.items():
+            if name not in self._templates:
+                encoded = self._encoders[name](value)
+                if encoded is not OMIT:
+                    self._encoded[name] = encoded
+
+        self._shared_json: dict[frozenset[str], bytes] = {}
+
+    def build(self, **varying: Any) -> T:
+        """
+        Builds the request model, for when a request has to be sent on its own.
+
+        Args:
+            **varying (Any): The values of the fields that differ from the template.
+
+        Returns:
+            T: The request.
+        """
+        values = {**self._values, **varying}
+        for name, template in self._templates.items():
+            nested = varying.get(name, {})
+            if type(nested) is dict:
+                values[name] = template.build(**nested)
+
+        return self.cls(
+            **{self._aliases[name]: value for name, value in values.items()}
+        )
+
+    def encode(self, **varying: Any) -> bytes:
+        """
+        Encodes the JSON body of a request.
+
+        Args:
+            **varying (Any): The values of the fields that differ from the template.
+
+        Returns:
+            bytes: The JSON object.
+
+        Raises:
+            TypeError: If a varying field is not a field of the model.
+        """
+        names = frozenset(varying)
+        shared_json = self._shared_json.get(names)
+        if shared_json is None:
+            shared_json = self._encode_shared(names)
+
+        values: dict[str, Any] = {}
+        for name, value in varying.items():
+            if name in self._templates and type(value) is dict:
+                continue
+            encoded = self._encoders[name](value)
+            if encoded is not OMIT:
+                values[name] = encoded
+
+        parts = [shared_json]
+        if values:
+            parts.append(self._json.dumps(values)[1:-1])
+        for name, template in self._templates.items():
+            nested = varying.get(name, {})
+            if type(nested) is dict:
+                parts.append(b'"' + name.encode() + b'":' + template.encode(**nested))
+
+        return b"{" + b",".join(part for part in parts if part) + b"}"
+
+    def _encode_shared(self, names: frozenset[str]) -> bytes:
+        unknown = names - self._values.keys()
+        if unknown:
+            raise TypeError(f"{self.cls.__name__} has no fields {sorted(unknown)}")
+
+        shared = {
+            name: value for name, value in self._encoded.items() if name not in names
+        }
+        # The members of the encoded object, without its braces.
+        shared_json = self._json.dumps(shared)[1:-1]
+        self._shared_json[names] = shared_json
+
+        return shared_json
+
+
+def _default(attribute: Any) -> Any:
+    default = attribute.default
+
+    if default is NOTHING:
+        return None
+    # attrs.Factory is typed as a function but is a class at runtime.
+    is_factory = isinstance(default, cast(type, Factory))
+    if is_factory:
+        return None if default.takes_self else default.factory()
+
+    return default
@@ -0,0 +1,136 @@
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+from urllib.parse import urlsplit
+
+from attrs import define
+
+from ..exceptions import DeadlineExceededError
+
+LABEL_PURCHASE_PATH = re.compile(
+    r"^/v1/labels(/shipment/[^/]+|/rates/[^/]+|/[^/]+/return)?/?$"
+)
+TRACKING_PATH = re.compile(r"^/v1/(tracking|labels/[^/]+/track)/?$")
+BATCH_PROCESSING_PATH = re.compile(r"^/v1/batches/[^/]+/process/labels/?$")
+
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+@define
+class EndpointTimeouts:
+    """
+    EndpointTimeouts holds the read timeout of every endpoint class of the API.
+
+    Label purchases wait on the carrier and batch processing on every label of the batch,
+    so they get more time than the quick lookups tracking GETs are expected to be.
+
+    Attributes:
+        connect (float): Seconds to wait for a connection to be established.
+        default (float): Seconds to wait for a response from any other endpoint.
+        label_purchase (float): Seconds to wait for a label to be purchased.
+        tracking (float): Seconds to wait for tracking information.
+        batch_processing (float): Seconds to wait for a batch to be submitted for processing.
+    """
+
+    connect: float
+    default: float
+    label_purchase: float
+    tracking: float
+    batch_processing: float
+
+    def for_request(self, method: str, url: str) -> tuple[float, float]:
+        """
+        Looks up the timeouts of the endpoint a request is sent to.
+
+        Args:
+            method (str): The HTTP method of the request.
+            url (str): The URL of the request.
+
+        Returns:
+            tuple[float, float]: The connect and read timeouts, in seconds.
+        """
+        method = method.upper()
+        path = urlsplit(url).path
+
+        if method == "POST" and LABEL_PURCHASE_PATH.match(path):
+            read = self.label_purchase
+        elif method == "GET" and TRACKING_PATH.match(path):
+            read = self.tracking
+        elif method == "POST" and BATCH_PROCESSING_PATH.match(path):
+            read = self.batch_processing
+        else:
+            read = self.default
+
+        return self.connect, read
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Caps the total time the requests made inside the block may take.
+
+    The budget covers every attempt, retry and backoff sleep. Each attempt's timeouts shrink
+    to the time left, and a retry that could not finish in time is not made, raising
+    DeadlineExceededError instead. Nested deadlines never extend the one around them.
+
+    Args:
+        seconds (float): The time budget, in seconds.
+    """
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def get_remaining() -> Optional[float]:
+    """
+    Returns the seconds left before the current deadline, or None outside of a deadline.
+    """
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+def check_deadline(wait: float = 0.0) -> None:
+    """
+    Makes sure there is time left to wait the given seconds and then send a request.
+
+    Args:
+        wait (float): The seconds about to be spent sleeping before the next attempt.
+
+    Raises:
+        DeadlineExceededError: If the current deadline would have passed by then.
+    """
+    remaining = get_remaining()
+    if remaining is not None and remaining <= wait:
+        raise DeadlineExceededError(remaining)
+
+
+def cap_timeout(timeout: Optional[float]) -> Optional[float]:
+    """
+    Shortens a timeout so it ends no later than the current deadline.
+
+    Args:
+        timeout (Optional[float]): The timeout in seconds, None for no timeout.
+
+    Returns:
+        Optional[float]: The timeout, never longer than the time left.
+
+    Raises:
+        DeadlineExceededError: If the current deadline has already passed.
+    """
+    remaining = get_remaining()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise DeadlineExceededError(remaining)
+    return remaining if timeout is None else min(timeout, remaining)
@@ -1,6 +1,8 @@
+import asyncio
 from pathlib import Path
 
 import pytest
+import vcr
 
 from unofficial_shipengine.core.batches.models import Batch, BatchRequest, ProcessLabels
 from unofficial_shipengine.exceptions import ShipEngineAPIError
@@ -83,7 +85,7 @@ def test_create_batch_success(client, shipment_request):
     batch_request = BatchRequest(shipment_ids=[shipment.shipment_id])
     batch = client.batches.create_batch(batch_request)
 
-    assert batch.status == batch.Status.OPEN.value
+    assert batch.status == batch.Status.OPEN
 
 
 @pytest.mark.vcr
@@ -101,7 +103,7 @@ def test_delete_batch_success(client, shipment_request):
     client.batches.delete_batch(batch)
     batch = client.batches.get_by_id(batch.batch_id)
 
-    assert batch.status == batch.Status.ARCHIVED.value
+    assert batch.status == batch.Status.ARCHIVED
 
 
 @pytest.mark.vcr
@@ -120,10 +122,10 @@ def test_process_labels_success(client, shipment_request):
     batch = client.batches.get_by_id(batch.batch_id)
 
     assert batch.status in [
-        Batch.Status.QUEUED.value,
-        Batch.Status.PROCESSING.value,
-        Batch.Status.COMPLETED.value,
-        Batch.Status.COMPLETED_WITH_ERRORS.value,
+        Batch.Status.QUEUED,
+        Batch.Status.PROCESSING,
+        Batch.Status.COMPLETED,
+        Batch.Status.COMPLETED_WITH_ERRORS,
     ]
 
 
@@ -131,3 +133,76 @@ def test_process_labels_success(client, shipment_request):
 def test_process_labels_fail(client):
     with pytest.raises(ShipEngineAPIError):
         client.batches.process_labels("bad-batch-id", process_labels=ProcessLabels())
+
+
+def test_async_get_by_id_success(async_client) -> None:
+    async def get_by_id() -> Batch:
+        async with async_client:
+            return await async_client.batches.get_by_id("se-1942846")
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_by_id_success.yaml",
+        filter_headers=["API-Key"],
+    ):
+        batch = asyncio.run(get_by_id())
+
+    assert isinstance(batch, Batch)
+    assert batch.batch_id == "se-1942846"
+
+
+def test_async_get_by_id_fail(async_client) -> None:
+    async def get_by_id() -> Batch:
+        async with async_client:
+            return await async_client.batches.get_by_id("bad-batch-id")
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_by_id_fail.yaml",
+        filter_headers=["API-Key"],
+    ):
+        with pytest.raises(ShipEngineAPIError):
+            asyncio.run(get_by_id())
+
+
+def test_async_get_by_id_coalesces_concurrent_calls(single_flight_async_client) -> None:
+    async def get_twice() -> list[Batch]:
+        async with single_flight_async_client:
+            return await asyncio.gather(
+                single_flight_async_client.batches.get_by_id("se-1942846"),
+                single_flight_async_client.batches.get_by_id("se-1942846"),
+            )
+
+    # The cassette answers once, so a second request would fail.
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_by_id_success.yaml",
+        filter_headers=["API-Key"],
+    ):
+        first, second = asyncio.run(get_twice())
+
+    assert isinstance(first, Batch)
+    assert second is first
+
+
+def test_async_delete_batch_fail(async_client) -> None:
+    async def delete_batch() -> None:
+        async with async_client:
+            await async_client.batches.delete_batch("bad-batch-id")
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_delete_batch_fail.yaml",
+        filter_headers=["API-Key"],
+    ):
+        with pytest.raises(ShipEngineAPIError):
+            asyncio.run(delete_batch())
+
+
+def test_async_process_labels_fail(async_client) -> None:
+    async def process_labels() -> None:
+        async with async_client:
+            await async_client.batches.process_labels("bad-batch-id", ProcessLabels())
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_process_labels_fail.yaml",
+        filter_headers=["API-Key"],
+    ):
+        with pytest.raises(ShipEngineAPIError):
+            asyncio.run(process_labels())
@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from unofficial_shipengine.core.batches import services as batch_services
+from unofficial_shipengine.core.batches.models import Batch, BatchError, BatchRequest
+from unofficial_shipengine.exceptions import DeadlineExceededError
+
+ERRORS = [{"error": "Invalid postal code", "shipment_id": f"se-{i}"} for i in range(5)]
+
+
+class FakeBatchesAPI:
+    def __init__(self, batch, statuses, errors=()):
+        self.record = batch
+        self.statuses = list(statuses)
+        self.errors = list(errors)
+        self.posts = []
+        self.error_pages = []
+
+    def post(self, url, body):
+        self.posts.append(url)
+        if url.endswith("/batches"):
+            return 200, self.batch("open", 0)
+        return 204, None
+
+    def get(self, url, params):
+        if url.endswith("/errors"):
+            self.error_pages.append(params)
+            end = params["page"] * params["pagesize"]
+            start = end - params["pagesize"]
+            body = {
+                "errors": self.errors[start:end],
+                "pages": -(-len(self.errors) // params["pagesize"]),
+            }
+            return 200, body
+
+        status, completed = self.statuses.pop(0)
+        return 200, self.batch(status, completed)
+
+    def batch(self, status, completed):
+        errors = len(self.errors) if status == "completed_with_errors" else 0
+        return {
+            **self.record,
+            "status": status,
+            "count": 4,
+            "completed": completed,
+            "errors": errors,
+        }
+
+
+@pytest.fixture
+def batch(recorded_response):
+    return recorded_response("batches/vcr_cassettes/test_get_by_id_success.yaml", 3)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(batch_services.time, "sleep", slept.append)
+    return slept
+
+
+def test_run(sleeps, batch, api_client):
+    api = FakeBatchesAPI(
+        batch,
+        [("queued", 0), ("processing", 1), ("processing", 2), ("completed", 4)],
+    )
+    client = api_client(api)
+    seen = []
+
+    result = client.batches.run(
+        BatchRequest(shipment_ids=["se-1"]), on_progress=seen.append
+    )
+
+    assert result.batch.status == Batch.Status.COMPLETED
+    assert result.errors == []
+    assert [batch.completed for batch in seen] == [0, 1, 2, 4]
+    assert api.posts[1].endswith("/process/labels")
+    assert len(sleeps) == 3
+    assert api.error_pages == []
+
+
+def test_wait_until_complete_collects_errors(sleeps, batch, api_client):
+    errors = [
+        {"error": "Invalid postal code", "shipment_id": f"se-{i}"} for i in range(150)
+    ]
+    api = FakeBatchesAPI(batch, [("completed_with_errors", 1)], errors)
+    client = api_client(api)
+
+    result = client.batches.wait_until_complete("se-1942846")
+
+    assert result.batch.status == Batch.Status.COMPLETED_WITH_ERRORS
+    assert [error.shipment_id for error in result.errors] == [
+        f"se-{i}" for i in range(150)
+    ]
+    assert [params["page"] for params in api.error_pages] == [1, 2]
+    assert sleeps == []
+
+
+def test_wait_until_complete_gives_up_at_timeout(sleeps, batch, api_client):
+    api = FakeBatchesAPI(batch, [("processing", 0)] * 10)
+    client = api_client(api)
+
+    with pytest.raises(DeadlineExceededError):
+        client.batches.wait_until_complete("se-1942846", timeout=0.5)
+
+
+def test_iter_batch_errors(batch, api_client):
+    api = FakeBatchesAPI(batch, [], ERRORS)
+    client = api_client(api, thread_safe=True)
+
+    errors = list(client.batches.iter_batch_errors("se-1942846", pagesize=2))
+
+    assert all(isinstance(error, BatchError) for error in errors)
+    assert [error.shipment_id for error in errors] == [f"se-{i}" for i in range(5)]
+    assert api.error_pages == [{"pagesize": 2, "page": page} for page in (1, 2, 3)]
+
+
+def test_get_batch_errors_sends_query_params(batch, api_client):
+    api = FakeBatchesAPI(batch, [], ERRORS)
+    client = api_client(api)
+
+    response = client.batches.get_batch_errors("se-1942846", page=2, pagesize=2)
+
+    assert response["errors"] == ERRORS[2:4]
+    assert api.error_pages == [{"page": 2, "pagesize": 2}]
+
+
+def test_async_iter_batch_errors(batch, async_api_client):
+    api = FakeBatchesAPI(batch, [], ERRORS)
+
+    async def run():
+        async with async_api_client(api) as client:
+            return [
+                e async for e in client.batches.iter_batch_errors("se-1", pagesize=2)
+            ]
+
+    errors = asyncio.run(run())
+
+    assert [error.shipment_id for error in errors] == [f"se-{i}" for i in range(5)]
@@ -0,0 +1,12 @@
+from unofficial_shipengine.core.batches.models import Batch
+
+
+def test_list_batches(list_api, recorded_response, api_client):
+    batch = recorded_response("batches/vcr_cassettes/test_get_by_id_success.yaml", 3)
+    api = list_api("batches", batch, 3)
+    client = api_client(api, thread_safe=True)
+
+    batches = list(client.batches.list_batches(status="completed", page_size=1))
+
+    assert all(isinstance(batch, Batch) for batch in batches) and len(batches) == 3
+    assert [params["status"] for _, params in api.requests] == ["completed"] * 3
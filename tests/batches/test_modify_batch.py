@@ -0,0 +1,83 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from unofficial_shipengine.exceptions import ShipEngineAPIError
+
+ERROR = {"request_id": "abc", "errors": [{"message": "Shipment not found"}]}
+
+
+class FakeBatchAPI:
+    def __init__(self, bad=(), flaky=()):
+        self.bad = set(bad)
+        self.flaky = set(flaky)
+        self.bodies = []
+        self._lock = threading.Lock()
+
+    def post(self, url, body):
+        body = json.loads(body)
+        with self._lock:
+            self.bodies.append(body)
+            ids = set(body["shipment_ids"])
+            if ids & self.flaky:
+                self.flaky -= ids
+                return 503, None
+        if ids & self.bad:
+            return 400, ERROR
+        return 204, None
+
+
+def test_add_to_batch_in_chunks(api_client):
+    api = FakeBatchAPI()
+    client = api_client(api, thread_safe=True)
+    shipment_ids = [f"se-{i}" for i in range(250)]
+
+    result = client.batches.add_to_batch(
+        "se-batch", iter(shipment_ids), rates=["se-rate"], max_workers=3
+    )
+
+    assert result.ok
+    assert sorted(result.succeeded) == sorted(shipment_ids + ["se-rate"])
+    assert sorted(len(body["shipment_ids"]) for body in api.bodies) == [50, 100, 100]
+    assert [body["rate_ids"] for body in api.bodies if body["rate_ids"]] == [
+        ["se-rate"]
+    ]
+
+
+def test_remove_from_batch_reports_failed_chunks(api_client):
+    api = FakeBatchAPI(bad=["se-42"], flaky=["se-7"])
+    client = api_client(api, thread_safe=True, backoff_factor=0)
+    shipment_ids = [f"se-{i}" for i in range(100)]
+
+    result = client.batches.remove_from_batch("se-batch", shipment_ids, chunk_size=20)
+
+    assert not result.ok
+    assert sorted(result.failed) == sorted(f"se-{i}" for i in range(40, 60))
+    assert all(isinstance(e, ShipEngineAPIError) for e in result.failed.values())
+    assert len(result.succeeded) == 80
+    # The chunk hit by a 503 was sent again.
+    assert len(api.bodies) == 6
+
+
+def test_modify_batch_raises_when_nothing_landed(api_client):
+    api = FakeBatchAPI(bad=["se-1"])
+    client = api_client(api, thread_safe=True)
+
+    with pytest.raises(ShipEngineAPIError):
+        client.batches.add_to_batch("se-batch", ["se-1"])
+
+
+def test_async_add_to_batch(async_api_client):
+    api = FakeBatchAPI(bad=["se-3"])
+
+    async def run():
+        async with async_api_client(api) as client:
+            ids = [f"se-{i}" for i in range(10)]
+            return await client.batches.add_to_batch("se-batch", ids, chunk_size=2)
+
+    result = asyncio.run(run())
+
+    assert sorted(result.failed) == ["se-2", "se-3"]
+    assert len(result.succeeded) == 8
@@ -1,6 +1,8 @@
+import asyncio
 from pathlib import Path
 
 import pytest
+import vcr
 
 from unofficial_shipengine.core.carriers.models import Carrier
 from unofficial_shipengine.exceptions import ShipEngineAPIError
@@ -34,3 +36,31 @@ def test_get_by_id_success(client) -> None:
 def test_get_by_id_fail(client) -> None:
     with pytest.raises(ShipEngineAPIError):
         client.carriers.get_by_id("bad-carrier-id")
+
+
+def test_async_get_carriers(async_client) -> None:
+    async def get_carriers() -> list[Carrier]:
+        async with async_client:
+            return await async_client.carriers.get_carriers()
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_carriers.yaml",
+        filter_headers=["API-Key"],
+    ):
+        carriers: list[Carrier] = asyncio.run(get_carriers())
+
+    assert isinstance(carriers, list)
+    assert all(isinstance(obj, Carrier) for obj in carriers)
+
+
+def test_async_get_by_id_fail(async_client) -> None:
+    async def get_by_id() -> Carrier:
+        async with async_client:
+            return await async_client.carriers.get_by_id("bad-carrier-id")
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_by_id_fail.yaml",
+        filter_headers=["API-Key"],
+    ):
+        with pytest.raises(ShipEngineAPIError):
+            asyncio.run(get_by_id())
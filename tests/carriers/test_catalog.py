@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from unofficial_shipengine.core.carriers.models import Carrier, CarrierCatalog
+
+
+class FakeCarriersAPI:
+    def __init__(self, carriers, delay=0.0):
+        self.carriers = carriers
+        self.delay = delay
+        self.gets = 0
+
+    def get(self, url, params):
+        self.gets += 1
+        time.sleep(self.delay)
+        return 200, self.carriers
+
+
+@pytest.fixture
+def carriers(recorded_response):
+    return recorded_response("carriers/vcr_cassettes/test_get_carriers.yaml", 0)
+
+
+def test_carrier_catalog_indexes(carriers):
+    catalog = CarrierCatalog([Carrier.from_dict(c) for c in carriers["carriers"]])
+
+    assert catalog.get_by_id("se-2424646").carrier_code == "ups"
+    assert catalog.get_by_id("se-missing") is None
+    assert [c.carrier_id for c in catalog.get_by_carrier_code("stamps_com")] == [
+        "se-2424643"
+    ]
+    assert catalog.get_carrier_id("usps_priority_mail") == "se-2424643"
+    assert catalog.get_carrier_id("fedex_ground") is None
+    assert [s.carrier_code for s in catalog.get_services("ups_ground")] == ["ups"]
+    assert all(s.domestic for s in catalog.get_domestic_services())
+    assert all(s.international for s in catalog.get_international_services())
+    assert [
+        c.carrier_code for c in catalog.get_carriers_with_package("ups_10_kg_box")
+    ] == ["ups"]
+    assert catalog.get_services("fedex_ground") == ()
+    assert isinstance(catalog.get_domestic_services(), tuple)
+
+
+def test_get_catalog_is_cached_until_it_expires(carriers, clock, api_client):
+    api = FakeCarriersAPI(carriers)
+    client = api_client(api, carrier_catalog_ttl=60.0)
+    client.carriers._catalog._clock = clock
+
+    catalog = client.carriers.get_catalog()
+    assert client.carriers.get_catalog() is catalog
+    assert api.gets == 1
+
+    clock.now = 60.0
+    assert client.carriers.get_catalog() is not catalog
+    assert api.gets == 2
+
+    client.carriers.refresh_catalog()
+    assert api.gets == 3
+
+
+def test_get_catalog_coalesces_concurrent_fetches(carriers, api_client):
+    api = FakeCarriersAPI(carriers, delay=0.1)
+    client = api_client(api, thread_safe=True)
+    catalogs = []
+
+    def get_catalog():
+        catalogs.append(client.carriers.get_catalog())
+
+    threads = [threading.Thread(target=get_catalog) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert api.gets == 1
+    assert all(catalog is catalogs[0] for catalog in catalogs)
+
+
+def test_async_get_catalog_coalesces_concurrent_fetches(carriers, async_api_client):
+    api = FakeCarriersAPI(carriers)
+
+    async def run():
+        async with async_api_client(api) as client:
+            return await asyncio.gather(
+                *(client.carriers.get_catalog() for _ in range(5))
+            )
+
+    catalogs = asyncio.run(run())
+
+    assert api.gets == 1
+    assert all(catalog is catalogs[0] for catalog in catalogs)
+
+
+def test_async_get_catalog(carriers, async_api_client):
+    api = FakeCarriersAPI(carriers)
+
+    async def run():
+        async with async_api_client(api) as client:
+            first = await client.carriers.get_catalog()
+            return first, await client.carriers.get_catalog()
+
+    first, second = asyncio.run(run())
+
+    assert first is second
+    assert first.get_carrier_id("ups_ground") == "se-2424646"
+    assert api.gets == 1
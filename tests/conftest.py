@@ -1,16 +1,28 @@
+import io
+import json
 import os
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator, Optional
+from urllib.parse import parse_qsl, urlsplit
 
 import pytest
+import requests
 import vcr
+import yaml
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 from unofficial_shipengine.core.common.models import Address, Package, Weight
 from unofficial_shipengine.core.labels.models import LabelRequest, ReturnLabelRequest
 from unofficial_shipengine.core.shipments.models import ShipmentRequest
 from unofficial_shipengine.core.warehouses.models import WarehouseRequest, Warehouse
-from unofficial_shipengine.unofficial_shipengine import UnofficialShipEngine
+from unofficial_shipengine.unofficial_shipengine import (
+    UnofficialShipEngine,
+    AsyncUnofficialShipEngine,
+)
+from unofficial_shipengine.unofficial_shipengine_config import (
+    UnofficialShipEngineConfig,
+)
 
 load_dotenv()
 
@@ -18,6 +30,83 @@ load_dotenv()
 BASE_DIR = Path(__file__).resolve().parent
 
 
+def build_response(
+    status_code: int, body: bytes = b"{}", headers: Optional[dict] = None
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def load_response(cassette: str, index: int) -> dict:
+    path = BASE_DIR / cassette
+    interactions = yaml.safe_load(path.read_text())["interactions"]
+    return json.loads(interactions[index]["response"]["body"]["string"])
+
+
+class Clock:
+    """A clock for TTLCache and AdaptivePoller that only moves when a test sets `now`."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeListAPI:
+    """A fake API for call_api that serves `count` copies of `record` under `key`, a page at a time."""
+
+    def __init__(self, key: str, record: dict, count: int) -> None:
+        self.key = key
+        self.records = [{**record, "id": i} for i in range(count)]
+        self.requests: list[tuple[str, dict]] = []
+
+    def get(self, url: str, params: dict) -> tuple[int, dict]:
+        self.requests.append((url, params))
+        end = params["page"] * params["page_size"]
+        start = end - params["page_size"]
+        return 200, {
+            self.key: self.records[start:end],
+            "total": len(self.records),
+            "page": params["page"],
+            "pages": -(-len(self.records) // params["page_size"]),
+        }
+
+
+def call_api(
+    api: Any, method: str, url: str, body: Optional[bytes]
+) -> tuple[int, bytes]:
+    """
+    Answers a request from a fake API object.
+
+    The fake has a method per HTTP method it serves. get and delete are called with the URL
+    without its query and the query params, numbers as ints; post and put with the URL and
+    the request body. Each returns the status code and a body: bytes, None for an empty body,
+    or anything else to encode as JSON.
+    """
+    parts = urlsplit(url)
+    path = parts._replace(query="").geturl()
+    handler = getattr(api, method.lower())
+
+    if method in ("POST", "PUT"):
+        status_code, payload = handler(path, body)
+    else:
+        params = {
+            key: int(value) if value.isdigit() else value
+            for key, value in parse_qsl(parts.query)
+        }
+        status_code, payload = handler(path, params)
+
+    if payload is None:
+        return status_code, b""
+    if isinstance(payload, bytes):
+        return status_code, payload
+    return status_code, json.dumps(payload).encode()
+
+
 @pytest.fixture(scope="session")
 def vcr_config():
     return {"filter_headers": ["API-Key"]}
@@ -29,6 +118,90 @@ def client():
     return UnofficialShipEngine(api_key)
 
 
+@pytest.fixture(scope="function")
+def safe_client():
+    api_key = os.getenv("SHIPENGINE_API_KEY", "")
+    config = UnofficialShipEngineConfig(
+        api_key, safe_post_retries=True, backoff_factor=0
+    )
+    return UnofficialShipEngine(config)
+
+
+@pytest.fixture(scope="session")
+def make_response():
+    return build_response
+
+
+@pytest.fixture(scope="function")
+def clock():
+    return Clock()
+
+
+@pytest.fixture(scope="session")
+def recorded_response():
+    return load_response
+
+
+@pytest.fixture(scope="session")
+def list_api():
+    return FakeListAPI
+
+
+@pytest.fixture(scope="function")
+def api_client(monkeypatch):
+    """Creates clients whose requests go through the real adapter and are answered by a fake API, see call_api."""
+
+    def make(api, **options) -> UnofficialShipEngine:
+        def send(adapter, request, **kwargs) -> requests.Response:
+            body = (
+                request.body.encode() if isinstance(request.body, str) else request.body
+            )
+            status_code, content = call_api(api, request.method, request.url, body)
+            response = build_response(status_code, content)
+            response.request = request
+            response.url = request.url
+            return response
+
+        monkeypatch.setattr(HTTPAdapter, "send", send)
+        return UnofficialShipEngine(UnofficialShipEngineConfig("api-key", **options))
+
+    return make
+
+
+@pytest.fixture(scope="function")
+def async_api_client(monkeypatch):
+    """Creates async clients whose requests go through the real transport and are answered by a fake API."""
+    import httpx
+
+    def make(api, **options) -> AsyncUnofficialShipEngine:
+        async def handle_async_request(transport, request) -> httpx.Response:
+            body = await request.aread()
+            status_code, content = call_api(api, request.method, str(request.url), body)
+            return httpx.Response(status_code, content=content, request=request)
+
+        monkeypatch.setattr(
+            httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request
+        )
+        return AsyncUnofficialShipEngine(
+            UnofficialShipEngineConfig("api-key", **options)
+        )
+
+    return make
+
+
+@pytest.fixture(scope="function")
+def async_client():
+    api_key = os.getenv("SHIPENGINE_API_KEY", "")
+    return AsyncUnofficialShipEngine(api_key)
+
+
+@pytest.fixture(scope="function")
+def single_flight_async_client():
+    api_key = os.getenv("SHIPENGINE_API_KEY", "")
+    config = UnofficialShipEngineConfig(api_key, single_flight=True)
+    return AsyncUnofficialShipEngine(config)
+
+
 @pytest.fixture(scope="function")
 def warehouse_request():
     return WarehouseRequest(
@@ -76,6 +249,25 @@ def shipment_request(client, warehouse):
     )
 
 
+@pytest.fixture(scope="function")
+def offline_shipment_request():
+    """A shipment request that, unlike shipment_request, needs no warehouse or carrier from the API."""
+    return ShipmentRequest(
+        carrier_id="se-123",
+        service_code="usps_ground_advantage",
+        ship_to=Address(
+            name="Electronic Output Solutions",
+            phone="555-555-5555",
+            address_line1="2510 Commerce Way",
+            city_locality="Vista",
+            state_province="CA",
+            postal_code="92081",
+            country_code="US",
+        ),
+        packages=[Package(Weight(1, Weight.Unit.OUNCE))],
+    )
+
+
 @pytest.fixture(scope="function")
 def label_request(shipment_request):
     return LabelRequest(shipment=shipment_request)
@@ -1,10 +1,20 @@
+import asyncio
+import json
 from pathlib import Path
 
+import httpx
 import pytest
+import vcr
+import requests
+from attrs import evolve
 
-from unofficial_shipengine.core.labels.models import Label
+from unofficial_shipengine.core.labels.models import Label, LabelRequest
+from unofficial_shipengine.core.labels.services import AsyncLabelService
 from unofficial_shipengine.core.tracking.models import TrackingInformation
 from unofficial_shipengine.exceptions import ShipEngineAPIError
+from unofficial_shipengine.unofficial_shipengine_config import (
+    UnofficialShipEngineConfig,
+)
 
 BASE_DIR = Path(__file__).parent
 
@@ -19,7 +29,7 @@ def test_purchase_label_success(client, label_request) -> None:
     label = client.labels.purchase_label(label_request)
 
     assert isinstance(label, Label)
-    assert label.status == Label.Status.COMPLETED.value
+    assert label.status == Label.Status.COMPLETED
 
 
 @pytest.mark.vcr
@@ -72,3 +82,182 @@ def test_get_label_tracking_information_success(client, label_request) -> None:
 def test_get_label_tracking_information_failure(client, label_request) -> None:
     with pytest.raises(ShipEngineAPIError):
         client.labels.get_label_tracking_info("bad-label-id")
+
+
+@pytest.mark.vcr
+def test_purchase_label_recovers_purchased_label(
+    safe_client, label_request, monkeypatch, make_response
+) -> None:
+    post = safe_client._session.post
+    purchased = []
+    lookups = []
+
+    def dropped_post(url, **kwargs):
+        body = json.loads(kwargs["data"])
+        purchased.append((body, post(url, **kwargs).json()))
+        raise requests.ConnectionError("connection reset")
+
+    def get(url, **kwargs):
+        lookups.append(url)
+        if len(lookups) == 1:
+            return make_response(503, b"Service Unavailable")
+        return make_response(200, json.dumps(purchased[0][1]).encode())
+
+    monkeypatch.setattr(safe_client._session, "post", dropped_post)
+    monkeypatch.setattr(safe_client._session, "get", get)
+
+    label = safe_client.labels.purchase_label(label_request)
+
+    [(body, created)] = purchased
+    external_shipment_id = body["shipment"]["external_shipment_id"]
+    assert label.label_id == created["label_id"]
+    assert (
+        lookups
+        == [
+            "https://api.shipengine.com/v1/labels/external_shipment_id/"
+            f"{external_shipment_id}"
+        ]
+        * 2
+    )
+
+
+def test_async_purchase_label_recovers_purchased_label(
+    offline_shipment_request, recorded_response
+) -> None:
+    config = UnofficialShipEngineConfig(
+        "api_key", safe_post_retries=True, backoff_factor=0
+    )
+    purchased = recorded_response(
+        "labels/vcr_cassettes/test_purchase_label_success.yaml", 1
+    )
+    posts = []
+    lookups = []
+
+    def handler(request):
+        if request.method == "POST":
+            posts.append(json.loads(request.content))
+            raise httpx.ReadError("connection reset")
+        lookups.append(str(request.url))
+        if len(lookups) == 1:
+            return httpx.Response(503, content=b"Service Unavailable")
+        return httpx.Response(200, json=purchased)
+
+    async def purchase_label() -> Label:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+            service = AsyncLabelService(session, config)
+            return await service.purchase_label(
+                LabelRequest(shipment=offline_shipment_request)
+            )
+
+    label = asyncio.run(purchase_label())
+
+    external_shipment_id = posts[0]["shipment"]["external_shipment_id"]
+    assert label.label_id == purchased["label_id"]
+    assert len(posts) == 1
+    assert (
+        lookups
+        == [
+            "https://api.shipengine.com/v1/labels/external_shipment_id/"
+            f"{external_shipment_id}"
+        ]
+        * 2
+    )
+
+
+def test_async_purchase_label_from_template_keeps_external_id(
+    offline_shipment_request, recorded_response
+) -> None:
+    config = UnofficialShipEngineConfig(
+        "api_key", safe_post_retries=True, backoff_factor=0
+    )
+    purchased = recorded_response(
+        "labels/vcr_cassettes/test_purchase_label_success.yaml", 1
+    )
+    posts = []
+
+    def handler(request):
+        if request.method == "GET":
+            return httpx.Response(404, json={"request_id": "abc", "errors": []})
+        posts.append(json.loads(request.content))
+        if len(posts) == 1:
+            return httpx.Response(503, content=b"Service Unavailable")
+        return httpx.Response(200, json=purchased)
+
+    async def purchase_label() -> Label:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+            service = AsyncLabelService(session, config)
+            template = service.template(shipment=offline_shipment_request)
+            return await service.purchase_label_from_template(
+                template,
+                shipment=evolve(
+                    offline_shipment_request, external_shipment_id="order-1"
+                ),
+            )
+
+    label = asyncio.run(purchase_label())
+
+    assert label.label_id == purchased["label_id"]
+    assert [post["shipment"]["external_shipment_id"] for post in posts] == [
+        "order-1",
+        "order-1",
+    ]
+
+
+def test_async_get_by_id_success(async_client) -> None:
+    async def get_by_id() -> Label:
+        async with async_client:
+            return await async_client.labels.get_by_id("se-453841868")
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_by_id_success.yaml",
+        filter_headers=["API-Key"],
+    ):
+        label = asyncio.run(get_by_id())
+
+    assert isinstance(label, Label)
+    assert label.label_id == "se-453841868"
+
+
+def test_async_get_by_id_fail(async_client) -> None:
+    async def get_by_id() -> Label:
+        async with async_client:
+            return await async_client.labels.get_by_id("bad-label-id")
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_by_id_fail.yaml",
+        filter_headers=["API-Key"],
+    ):
+        with pytest.raises(ShipEngineAPIError):
+            asyncio.run(get_by_id())
+
+
+def test_async_get_by_id_coalesces_concurrent_calls(single_flight_async_client) -> None:
+    async def get_twice() -> list[Label]:
+        async with single_flight_async_client:
+            return await asyncio.gather(
+                single_flight_async_client.labels.get_by_id("se-453841868"),
+                single_flight_async_client.labels.get_by_id("se-453841868"),
+            )
+
+    # The cassette answers once, so a second request would fail.
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_by_id_success.yaml",
+        filter_headers=["API-Key"],
+    ):
+        first, second = asyncio.run(get_twice())
+
+    assert isinstance(first, Label)
+    assert second is first
+
+
+def test_async_get_label_tracking_information_failure(async_client) -> None:
+    async def get_label_tracking_info() -> TrackingInformation:
+        async with async_client:
+            return await async_client.labels.get_label_tracking_info("bad-label-id")
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_label_tracking_information_failure.yaml",
+        filter_headers=["API-Key"],
+    ):
+        with pytest.raises(ShipEngineAPIError):
+            asyncio.run(get_label_tracking_info())
@@ -0,0 +1,14 @@
+from unofficial_shipengine.core.labels.models import Label
+
+
+def test_list_labels(list_api, recorded_response, api_client):
+    label = recorded_response(
+        "labels/vcr_cassettes/test_purchase_label_success.yaml", 1
+    )
+    api = list_api("labels", label, 3)
+    client = api_client(api, thread_safe=True)
+
+    labels = list(client.labels.list_labels(created_at_end="2024-05-01T00:00:00Z"))
+
+    assert all(isinstance(label, Label) for label in labels) and len(labels) == 3
+    assert api.requests[0][1]["created_at_end"] == "2024-05-01T00:00:00Z"
@@ -0,0 +1,137 @@
+import asyncio
+import json
+import threading
+
+from attrs import evolve
+
+from unofficial_shipengine.core.labels.models import LabelRequest
+from unofficial_shipengine.utils.checkpoint import FileCheckpoint, InMemoryCheckpoint
+
+
+class FakeLabelsAPI:
+    def __init__(self, fail=()):
+        self.fail = fail
+        self.bought = {}
+        self.purchases = []
+        self.lookups = []
+        self._lock = threading.Lock()
+
+    def post(self, url, body):
+        key = json.loads(body)["shipment"]["external_shipment_id"]
+        with self._lock:
+            self.purchases.append(key)
+        if key in self.fail:
+            return 400, {"request_id": "abc", "errors": [{"message": "No rates"}]}
+
+        label = {"label_id": f"se-{key}", "shipment_id": f"se-shipment-{key}"}
+        self.bought[key] = label
+        return 200, label
+
+    def get(self, url, params):
+        with self._lock:
+            self.lookups.append(url)
+        key = url.rsplit("/", 1)[1]
+        if "/external_shipment_id/" not in url:
+            key = key.removeprefix("se-")
+        if key not in self.bought:
+            return 404, {"request_id": "abc", "errors": []}
+        return 200, self.bought[key]
+
+
+def make_label_requests(shipment_request, count):
+    return [
+        LabelRequest(
+            shipment=evolve(shipment_request, external_shipment_id=f"order-{i}")
+        )
+        for i in range(count)
+    ]
+
+
+def test_purchase_labels(offline_shipment_request, api_client):
+    api = FakeLabelsAPI(fail=("order-2",))
+    client = api_client(api, thread_safe=True)
+    label_requests = make_label_requests(offline_shipment_request, 5)
+
+    results = sorted(
+        client.labels.purchase_labels(iter(label_requests), max_workers=3),
+        key=lambda result: result.index,
+    )
+
+    assert [result.request for result in results] == label_requests
+    assert [result.ok for result in results] == [True, True, False, True, True]
+    assert results[0].value.label_id == "se-order-0"
+    assert sorted(api.purchases) == [f"order-{i}" for i in range(5)]
+
+
+def test_purchase_labels_resumes_from_checkpoint(offline_shipment_request, api_client):
+    api = FakeLabelsAPI()
+    client = api_client(api, thread_safe=True)
+    label_requests = make_label_requests(offline_shipment_request, 4)
+    checkpoint = InMemoryCheckpoint()
+
+    # An earlier run bought order-0, and sent order-1 without recording the answer.
+    checkpoint.record("order-0", None)
+    checkpoint.record("order-0", "se-order-0")
+    checkpoint.record("order-1", None)
+    api.bought["order-0"] = {"label_id": "se-order-0"}
+    api.bought["order-1"] = {"label_id": "se-order-1"}
+
+    results = sorted(
+        client.labels.purchase_labels(label_requests, checkpoint=checkpoint),
+        key=lambda result: result.index,
+    )
+
+    assert [result.value.label_id for result in results] == [
+        f"se-order-{i}" for i in range(4)
+    ]
+    assert sorted(api.purchases) == ["order-2", "order-3"]
+    assert checkpoint.load() == {f"order-{i}": f"se-order-{i}" for i in range(4)}
+
+
+def test_checkpointed_purchases_need_external_ids(offline_shipment_request, api_client):
+    api = FakeLabelsAPI()
+    client = api_client(api, thread_safe=True)
+    label_request = LabelRequest(shipment=offline_shipment_request)
+
+    [result] = client.labels.purchase_labels(
+        [label_request], checkpoint=InMemoryCheckpoint()
+    )
+
+    assert isinstance(result.error, ValueError)
+    assert api.purchases == []
+
+
+def test_async_purchase_labels_keeps_checkpoint_io_off_the_loop(
+    tmp_path, offline_shipment_request, async_api_client
+):
+    api = FakeLabelsAPI()
+    threads = []
+
+    class RecordingCheckpoint(FileCheckpoint):
+        def load(self):
+            threads.append(threading.current_thread())
+            return super().load()
+
+        def record(self, key, result_id):
+            threads.append(threading.current_thread())
+            super().record(key, result_id)
+
+    checkpoint = RecordingCheckpoint(tmp_path / "labels.checkpoint")
+    label_requests = make_label_requests(offline_shipment_request, 3)
+
+    async def run():
+        async with async_api_client(api) as client:
+            return [
+                result
+                async for result in client.labels.purchase_labels(
+                    label_requests, max_workers=2, checkpoint=checkpoint
+                )
+            ]
+
+    results = asyncio.run(run())
+
+    # One load, then a start and a finish for each label, none of them on the loop's thread.
+    assert len(threads) == 7
+    assert threading.main_thread() not in threads
+    assert all(result.ok for result in results)
+    assert checkpoint.load() == {f"order-{i}": f"se-order-{i}" for i in range(3)}
@@ -0,0 +1,162 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from attrs import evolve
+
+from unofficial_shipengine.exceptions import BulkItemError
+from unofficial_shipengine.utils.serialize import encode_value
+
+
+class FakeShipmentsAPI:
+    """Creates shipments named after their first tag, or their position when untagged."""
+
+    def __init__(self, fail=(), missing=(), invalid=()):
+        self.fail = fail
+        self.missing = missing
+        self.invalid = invalid
+        self.bodies = []
+        self._lock = threading.Lock()
+
+    def post(self, url, body):
+        body = json.loads(body)
+        with self._lock:
+            self.bodies.append(body)
+        names = [
+            shipment["tags"][0] if shipment.get("tags") else str(i)
+            for i, shipment in enumerate(body["shipments"])
+        ]
+        if any(name in self.fail for name in names):
+            raise requests.ConnectionError("connection reset")
+
+        shipments = [
+            {
+                "shipment_id": f"se-{name}",
+                "external_shipment_id": name,
+                "errors": ["Invalid postal code"] if name in self.invalid else [],
+            }
+            for name in names
+            if name not in self.missing
+        ]
+        return 200, {"shipments": shipments}
+
+
+def make_requests(shipment_request, count):
+    return [evolve(shipment_request, tags=[str(i)]) for i in range(count)]
+
+
+def test_create_shipments_from_template(offline_shipment_request, api_client):
+    api = FakeShipmentsAPI()
+    client = api_client(api, sparse_payloads=True)
+    address = offline_shipment_request.ship_to
+    template = client.shipments.template(
+        carrier_id="se-123", service_code="ups_ground", ship_from=address
+    )
+    customers = [evolve(address, name="Customer"), evolve(address, name="Other")]
+
+    shipments = client.shipments.create_shipments_from_template(
+        template, [{"ship_to": customer} for customer in customers]
+    )
+
+    assert [s.shipment_id for s in shipments] == ["se-0", "se-1"]
+    [body] = api.bodies
+    assert [s["ship_to"]["name"] for s in body["shipments"]] == ["Customer", "Other"]
+    assert body["shipments"][1] == encode_value(
+        template.build(ship_to=customers[1]),
+        sparse=True,
+    )
+
+
+def test_create_shipment_micro_batches(offline_shipment_request, api_client):
+    api = FakeShipmentsAPI()
+    client = api_client(
+        api, thread_safe=True, micro_batch_size=4, micro_batch_delay=1.0
+    )
+
+    with ThreadPoolExecutor(4) as executor:
+        shipments = list(
+            executor.map(
+                client.shipments.create_shipment,
+                make_requests(offline_shipment_request, 4),
+            )
+        )
+
+    assert [s.shipment_id for s in shipments] == ["se-0", "se-1", "se-2", "se-3"]
+    assert len(api.bodies) == 1
+
+
+def test_create_shipment_does_not_resend_a_created_batch(
+    offline_shipment_request, api_client
+):
+    api = FakeShipmentsAPI(missing=("0", "1", "2"))
+    client = api_client(
+        api, thread_safe=True, micro_batch_size=3, micro_batch_delay=1.0
+    )
+
+    with ThreadPoolExecutor(3) as executor:
+        futures = [
+            executor.submit(client.shipments.create_shipment, r)
+            for r in make_requests(offline_shipment_request, 3)
+        ]
+
+    assert all(isinstance(f.exception(), ValueError) for f in futures)
+    assert len(api.bodies) == 1
+
+
+def test_create_shipments_in_chunks(offline_shipment_request, api_client):
+    api = FakeShipmentsAPI(fail=("5",), invalid=("3",))
+    client = api_client(api, thread_safe=True)
+    shipment_requests = make_requests(offline_shipment_request, 7)
+
+    results = sorted(
+        client.shipments.create_shipments(iter(shipment_requests), chunk_size=2),
+        key=lambda result: result.index,
+    )
+
+    assert sorted(len(body["shipments"]) for body in api.bodies) == [1, 2, 2, 2]
+    assert [result.request for result in results] == shipment_requests
+    assert [result.ok for result in results] == [True] * 3 + [False] * 3 + [True]
+    assert results[0].value.shipment_id == "se-0"
+    assert isinstance(results[3].error, BulkItemError)
+    assert results[3].value.shipment_id == "se-3"
+    assert isinstance(results[4].error, requests.ConnectionError)
+    assert results[4].error is results[5].error
+    assert results[4].value is None
+
+
+def test_create_shipments_needs_thread_safe_client_for_workers(
+    offline_shipment_request, api_client
+):
+    client = api_client(FakeShipmentsAPI())
+
+    with pytest.raises(ValueError):
+        client.shipments.create_shipments(
+            make_requests(offline_shipment_request, 2), max_workers=2
+        )
+
+    results = list(
+        client.shipments.create_shipments(
+            make_requests(offline_shipment_request, 3), chunk_size=2
+        )
+    )
+
+    assert [result.index for result in results] == [0, 1, 2]
+
+
+def test_create_shipments_fails_chunks_missing_results(
+    offline_shipment_request, api_client
+):
+    client = api_client(FakeShipmentsAPI(missing=("1",), invalid=("3",)))
+
+    results = list(
+        client.shipments.create_shipments(
+            make_requests(offline_shipment_request, 4), chunk_size=2
+        )
+    )
+
+    assert [result.ok for result in results] == [False, False, True, False]
+    assert isinstance(results[0].error, ValueError)
+    assert results[0].error is results[1].error
+    assert isinstance(results[3].error, BulkItemError)
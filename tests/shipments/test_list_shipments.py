@@ -0,0 +1,22 @@
+from unofficial_shipengine.core.shipments.models import Shipment
+
+
+def test_list_shipments(list_api, recorded_response, api_client):
+    shipment = recorded_response(
+        "shipments/vcr_cassettes/test_get_by_id_success.yaml", 2
+    )
+    api = list_api("shipments", shipment, 5)
+    client = api_client(api)
+
+    shipments = client.shipments.list_shipments(
+        status=Shipment.Status.PENDING, batch_id="se-1", page_size=2
+    )
+
+    assert next(shipments).shipment_id == shipment["shipment_id"]
+    assert len(api.requests) == 1
+    assert len(list(shipments)) == 4
+    assert api.requests[0] == (
+        "https://api.shipengine.com/v1/shipments",
+        {"shipment_status": "pending", "batch_id": "se-1", "page_size": 2, "page": 1},
+    )
+    assert [params["page"] for _, params in api.requests] == [1, 2, 3]
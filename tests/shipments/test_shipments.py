@@ -1,7 +1,12 @@
+import asyncio
+import json
 from datetime import datetime
 from pathlib import Path
 
+import httpx
 import pytest
+import vcr
+import requests
 from dotenv import load_dotenv
 
 from unofficial_shipengine.core.common.models import Address, Package, Weight
@@ -9,7 +14,11 @@ from unofficial_shipengine.core.shipments.models import (
     Shipment,
     AdvancedOptions,
 )
+from unofficial_shipengine.core.shipments.services import AsyncShipmentService
 from unofficial_shipengine.exceptions import ShipEngineAPIError
+from unofficial_shipengine.unofficial_shipengine_config import (
+    UnofficialShipEngineConfig,
+)
 
 load_dotenv()
 
@@ -108,10 +117,207 @@ def test_cancel_shipment_success(client, shipment_request):
     client.shipments.cancel_shipment(shipment)
     shipment = client.shipments.get_by_id(shipment.shipment_id)
 
-    assert shipment.shipment_status == Shipment.Status.CANCELLED.value
+    assert shipment.shipment_status == Shipment.Status.CANCELLED
 
 
 @pytest.mark.vcr
 def test_cancel_shipment_failure(client):
     with pytest.raises(ShipEngineAPIError):
         client.shipments.cancel_shipment("bad-shipment-id")
+
+
+@pytest.mark.vcr
+def test_create_shipment_retries_after_connection_error(
+    safe_client, shipment_request, monkeypatch, make_response
+):
+    post = safe_client._session.post
+    calls = []
+    lookups = []
+
+    def flaky_post(url, **kwargs):
+        calls.append(json.loads(kwargs["data"]))
+        if len(calls) == 1:
+            raise requests.ConnectionError("connection reset")
+        return post(url, **kwargs)
+
+    def get(url, **kwargs):
+        lookups.append(url)
+        body = {"request_id": "abc", "errors": [{"message": "Not found"}]}
+        return make_response(404, json.dumps(body).encode())
+
+    monkeypatch.setattr(safe_client._session, "post", flaky_post)
+    monkeypatch.setattr(safe_client._session, "get", get)
+
+    shipment = safe_client.shipments.create_shipment(shipment_request)
+
+    external_shipment_id = calls[0]["shipments"][0]["external_shipment_id"]
+    assert isinstance(shipment, Shipment)
+    assert len(calls) == 2
+    assert calls[1] == calls[0]
+    assert lookups == [
+        "https://api.shipengine.com/v1/shipments/external_shipment_id/"
+        f"{external_shipment_id}"
+    ]
+
+
+@pytest.mark.vcr
+def test_create_shipment_recovers_created_shipment(
+    safe_client, shipment_request, monkeypatch, make_response
+):
+    post = safe_client._session.post
+    created = []
+    lookups = []
+
+    def dropped_post(url, **kwargs):
+        body = json.loads(kwargs["data"])
+        created.append((body, post(url, **kwargs).json()["shipments"][0]))
+        raise requests.ConnectionError("connection reset")
+
+    def get(url, **kwargs):
+        lookups.append(url)
+        return make_response(200, json.dumps(created[0][1]).encode())
+
+    monkeypatch.setattr(safe_client._session, "post", dropped_post)
+    monkeypatch.setattr(safe_client._session, "get", get)
+
+    shipment = safe_client.shipments.create_shipment(shipment_request)
+
+    [(body, recorded)] = created
+    external_shipment_id = body["shipments"][0]["external_shipment_id"]
+    assert shipment.shipment_id == recorded["shipment_id"]
+    assert lookups == [
+        "https://api.shipengine.com/v1/shipments/external_shipment_id/"
+        f"{external_shipment_id}"
+    ]
+
+
+def test_create_shipment_lookup_server_error_is_raised(
+    safe_client, offline_shipment_request, monkeypatch, make_response
+):
+    lookups = []
+
+    def dropped_post(url, **kwargs):
+        raise requests.ConnectionError("connection reset")
+
+    def get(url, **kwargs):
+        lookups.append(url)
+        return make_response(503, b"Service Unavailable")
+
+    monkeypatch.setattr(safe_client._session, "post", dropped_post)
+    monkeypatch.setattr(safe_client._session, "get", get)
+
+    with pytest.raises(requests.HTTPError):
+        safe_client.shipments.create_shipment(offline_shipment_request)
+
+    assert len(lookups) == safe_client.config.retries
+
+
+def test_async_create_shipment_retries_after_read_error(
+    offline_shipment_request, recorded_response
+) -> None:
+    config = UnofficialShipEngineConfig(
+        "api_key", safe_post_retries=True, backoff_factor=0
+    )
+    created = recorded_response(
+        "shipments/vcr_cassettes/test_get_by_id_success.yaml", 2
+    )
+    posts = []
+    lookups = []
+
+    def handler(request):
+        if request.method == "GET":
+            lookups.append(str(request.url))
+            return httpx.Response(404, json={"request_id": "abc", "errors": []})
+        posts.append(json.loads(request.content))
+        if len(posts) == 1:
+            raise httpx.ReadError("connection reset")
+        return httpx.Response(200, json={"shipments": [created]})
+
+    async def create_shipment() -> Shipment:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+            service = AsyncShipmentService(session, config)
+            return await service.create_shipment(offline_shipment_request)
+
+    shipment = asyncio.run(create_shipment())
+
+    external_shipment_id = posts[0]["shipments"][0]["external_shipment_id"]
+    assert shipment.shipment_id == created["shipment_id"]
+    assert posts[1] == posts[0]
+    assert lookups == [
+        "https://api.shipengine.com/v1/shipments/external_shipment_id/"
+        f"{external_shipment_id}"
+    ]
+
+
+def test_async_get_by_id_success(async_client) -> None:
+    async def get_by_id() -> Shipment:
+        async with async_client:
+            return await async_client.shipments.get_by_id("se-1384670855")
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_by_id_success.yaml",
+        filter_headers=["API-Key"],
+    ):
+        shipment = asyncio.run(get_by_id())
+
+    assert isinstance(shipment, Shipment)
+    assert shipment.shipment_id == "se-1384670855"
+
+
+def test_async_get_by_id_failure(async_client) -> None:
+    async def get_by_id() -> Shipment:
+        async with async_client:
+            return await async_client.shipments.get_by_id("bad-shipment-id")
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_by_id_failure.yaml",
+        filter_headers=["API-Key"],
+    ):
+        with pytest.raises(ShipEngineAPIError):
+            asyncio.run(get_by_id())
+
+
+def test_async_get_by_id_coalesces_concurrent_calls(single_flight_async_client) -> None:
+    async def get_twice() -> list[Shipment]:
+        async with single_flight_async_client:
+            return await asyncio.gather(
+                single_flight_async_client.shipments.get_by_id("se-1384670855"),
+                single_flight_async_client.shipments.get_by_id("se-1384670855"),
+            )
+
+    # The cassette answers once, so a second request would fail.
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_by_id_success.yaml",
+        filter_headers=["API-Key"],
+    ):
+        first, second = asyncio.run(get_twice())
+
+    assert isinstance(first, Shipment)
+    assert second is first
+
+
+def test_async_get_by_external_id_success(async_client) -> None:
+    async def get_by_external_id() -> Shipment:
+        async with async_client:
+            return await async_client.shipments.get_by_external_id("20240522120215")
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_by_external_id_success.yaml",
+        filter_headers=["API-Key"],
+    ):
+        shipment = asyncio.run(get_by_external_id())
+
+    assert isinstance(shipment, Shipment)
+
+
+def test_async_cancel_shipment_failure(async_client) -> None:
+    async def cancel_shipment() -> None:
+        async with async_client:
+            await async_client.shipments.cancel_shipment("bad-shipment-id")
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_cancel_shipment_failure.yaml",
+        filter_headers=["API-Key"],
+    ):
+        with pytest.raises(ShipEngineAPIError):
+            asyncio.run(cancel_shipment())
@@ -1,6 +1,8 @@
+import asyncio
 from pathlib import Path
 
 import pytest
+import vcr
 from dotenv import load_dotenv
 
 from unofficial_shipengine.core.tracking.models import TrackingInformation
@@ -48,3 +50,72 @@ def test_stop_tracking_package_success(client, label_request):
 def test_tracking_package_failure(client, label_request):
     with pytest.raises(ShipEngineAPIError):
         client.tracking.start_tracking_package("bad-carrier-code", "")
+
+
+def test_async_get_tracking_information_success(async_client) -> None:
+    async def get_tracking_information() -> TrackingInformation:
+        async with async_client:
+            return await async_client.tracking.get_tracking_information(
+                "stamps_com", "9400111899563821175404"
+            )
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_tracking_information_success.yaml",
+        filter_headers=["API-Key"],
+    ):
+        tracking_info = asyncio.run(get_tracking_information())
+
+    assert isinstance(tracking_info, TrackingInformation)
+
+
+def test_async_get_tracking_information_failure(async_client) -> None:
+    async def get_tracking_information() -> TrackingInformation:
+        async with async_client:
+            return await async_client.tracking.get_tracking_information(
+                "bad-carrier-code", ""
+            )
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_tracking_information_failure.yaml",
+        filter_headers=["API-Key"],
+    ):
+        with pytest.raises(ShipEngineAPIError):
+            asyncio.run(get_tracking_information())
+
+
+def test_async_get_tracking_information_coalesces_concurrent_calls(
+    single_flight_async_client,
+) -> None:
+    async def get_twice() -> list[TrackingInformation]:
+        async with single_flight_async_client:
+            return await asyncio.gather(
+                single_flight_async_client.tracking.get_tracking_information(
+                    "stamps_com", "9400111899563821175404"
+                ),
+                single_flight_async_client.tracking.get_tracking_information(
+                    "stamps_com", "9400111899563821175404"
+                ),
+            )
+
+    # The cassette answers once, so a second request would fail.
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_tracking_information_success.yaml",
+        filter_headers=["API-Key"],
+    ):
+        first, second = asyncio.run(get_twice())
+
+    assert isinstance(first, TrackingInformation)
+    assert second is first
+
+
+def test_async_tracking_package_failure(async_client) -> None:
+    async def start_tracking_package() -> None:
+        async with async_client:
+            await async_client.tracking.start_tracking_package("bad-carrier-code", "")
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_tracking_package_failure.yaml",
+        filter_headers=["API-Key"],
+    ):
+        with pytest.raises(ShipEngineAPIError):
+            asyncio.run(start_tracking_package())
@@ -0,0 +1,71 @@
+from unofficial_shipengine.unofficial_shipengine import UnofficialShipEngine
+from unofficial_shipengine.unofficial_shipengine_config import (
+    UnofficialShipEngineConfig,
+)
+from unofficial_shipengine.utils.adapters import (
+    PoolStats,
+    StatsHTTPSConnectionPool,
+    ShipEngineHTTPAdapter,
+)
+
+
+class OpenConnection:
+    is_closed = False
+    is_connected = True
+
+    def close(self):
+        self.is_closed = True
+        self.is_connected = False
+
+
+def make_pool(maxsize=1, idle_timeout=None):
+    pool = StatsHTTPSConnectionPool("api.shipengine.com", maxsize=maxsize)
+    pool.pool_stats = PoolStats()
+    pool.idle_timeout = idle_timeout
+    # Take the empty slot the pool starts with so connections can be returned to it.
+    pool._get_conn()
+    return pool
+
+
+def test_session_uses_configured_pool():
+    config = UnofficialShipEngineConfig(
+        "api-key", pool_connections=4, pool_maxsize=64, pool_block=True
+    )
+    client = UnofficialShipEngine(config)
+    adapter = client._session.get_adapter("https://api.shipengine.com")
+
+    assert isinstance(adapter, ShipEngineHTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 64
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+
+    pool = adapter.poolmanager.connection_from_url("https://api.shipengine.com")
+    assert isinstance(pool, StatsHTTPSConnectionPool)
+    assert pool.pool_stats is client.pool_stats
+
+
+def test_reused_connection_is_counted():
+    pool = make_pool()
+    conn = OpenConnection()
+    pool._put_conn(conn)
+
+    assert pool._get_conn() is conn
+    assert pool.pool_stats.reused == 1
+
+
+def test_full_pool_discards_connection():
+    pool = make_pool(maxsize=1)
+    pool._put_conn(OpenConnection())
+    pool._put_conn(OpenConnection())
+
+    assert pool.pool_stats.discarded == 1
+
+
+def test_idle_connection_is_recycled():
+    pool = make_pool(idle_timeout=0)
+    conn = OpenConnection()
+    pool._put_conn(conn)
+
+    assert pool._get_conn() is conn
+    assert conn.is_closed
+    assert pool.pool_stats.recycled == 1
+    assert pool.pool_stats.reused == 0
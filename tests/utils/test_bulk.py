@@ -0,0 +1,89 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from unofficial_shipengine.utils.bulk import async_run_bounded, chunked, run_bounded
+from unofficial_shipengine.utils.timeouts import deadline, get_remaining
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 2)) == []
+
+    with pytest.raises(ValueError):
+        list(chunked(range(5), 0))
+
+
+def test_run_bounded_limits_calls_in_flight():
+    lock = threading.Lock()
+    in_flight = []
+    read = []
+
+    def items():
+        for i in range(20):
+            read.append(i)
+            yield i
+
+    def call(item):
+        with lock:
+            in_flight.append(item)
+            running = len(in_flight)
+        time.sleep(0.005)
+        with lock:
+            in_flight.remove(item)
+        return item * 2, running
+
+    results = []
+    for item, future in run_bounded(call, items(), 3):
+        # Items are only read once a worker is free for them.
+        assert len(read) <= len(results) + 1 + 3
+        results.append((item, future.result()))
+
+    assert sorted(item for item, _ in results) == list(range(20))
+    assert all(value == item * 2 for item, (value, _) in results)
+    assert max(running for _, (_, running) in results) <= 3
+
+
+def test_run_bounded_reports_errors():
+    def call(item):
+        if item == 1:
+            raise ValueError(item)
+        return item
+
+    futures = dict(run_bounded(call, range(3), 2))
+
+    assert isinstance(futures[1].exception(), ValueError)
+    assert futures[2].result() == 2
+
+
+def test_run_bounded_carries_deadline():
+    with deadline(10.0):
+        [(_, future)] = run_bounded(lambda _: get_remaining(), [0], 1)
+
+    assert 0 < future.result() <= 10.0
+
+
+def test_async_run_bounded():
+    running = 0
+    peak = 0
+
+    async def call(item):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return item + 1
+
+    async def run():
+        return [
+            (item, task.result())
+            async for item, task in async_run_bounded(call, range(10), 4)
+        ]
+
+    results = asyncio.run(run())
+
+    assert sorted(results) == [(i, i + 1) for i in range(10)]
+    assert peak == 4
@@ -0,0 +1,51 @@
+import pytest
+
+from unofficial_shipengine.utils.cache import TTLCache
+
+
+def test_ttl_cache_expires_values(clock):
+    cache = TTLCache(10.0, clock)
+
+    cache.put("a", 1)
+    clock.now = 9.9
+    assert cache.get("a") == 1
+
+    clock.now = 10.0
+    assert cache.get("a") is None
+
+    cache.put("b", 2)
+    cache.invalidate("b")
+    assert cache.get("b") is None
+
+
+def test_ttl_cache_without_ttl_keeps_values(clock):
+    cache = TTLCache(None, clock)
+
+    cache.put("a", 1)
+    clock.now = 1e9
+    assert cache.get("a") == 1
+
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_ignores_values_fetched_before_invalidation():
+    cache = TTLCache(None)
+
+    generation = cache.generation("a")
+    cache.invalidate("a")
+    cache.put("a", 1, generation)
+    assert cache.get("a") is None
+
+    generation = cache.generation("a")
+    cache.clear()
+    cache.put("a", 2, generation)
+    assert cache.get("a") is None
+
+    cache.put("a", 3, cache.generation("a"))
+    assert cache.get("a") == 3
+
+
+def test_ttl_cache_rejects_negative_ttl():
+    with pytest.raises(ValueError):
+        TTLCache(-1.0)
@@ -0,0 +1,36 @@
+import pytest
+
+from unofficial_shipengine.utils.checkpoint import (
+    CheckpointRun,
+    FileCheckpoint,
+    InMemoryCheckpoint,
+)
+
+
+def test_file_checkpoint(tmp_path):
+    path = tmp_path / "labels.checkpoint"
+    checkpoint = FileCheckpoint(path)
+
+    assert checkpoint.load() == {}
+
+    checkpoint.record("order-1", None)
+    checkpoint.record("order-2", None)
+    checkpoint.record("order-1", "se-label-1")
+    with open(path, "a") as f:
+        f.write('{"key": "order-3", "i')
+
+    assert FileCheckpoint(path).load() == {"order-1": "se-label-1", "order-2": None}
+
+
+def test_checkpoint_run_claims_each_key_once():
+    checkpoint = InMemoryCheckpoint()
+    checkpoint.record("order-1", "se-label-1")
+    run = CheckpointRun(checkpoint)
+
+    assert run.claim("order-1") == (True, "se-label-1")
+    assert run.claim("order-2") == (False, None)
+
+    with pytest.raises(ValueError):
+        run.claim("order-2")
+    with pytest.raises(ValueError):
+        run.claim(None)
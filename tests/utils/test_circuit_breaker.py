@@ -0,0 +1,172 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from unofficial_shipengine.exceptions import CircuitOpenError
+from unofficial_shipengine.utils.adapters import ShipEngineHTTPAdapter
+from unofficial_shipengine.utils.async_transport import AsyncRetryTransport
+from unofficial_shipengine.utils.circuit_breaker import (
+    CircuitBreakerPolicy,
+    CircuitBreakers,
+    CircuitState,
+)
+
+POLICY = CircuitBreakerPolicy(
+    failure_rate_threshold=0.5,
+    slow_call_duration=1.0,
+    window_size=4,
+    minimum_calls=4,
+    open_duration=0.05,
+)
+
+
+def trip(breaker):
+    for failed in (False, True, False, True):
+        breaker.before_call()
+        breaker.record(0.01, failed=failed)
+
+
+def test_trips_on_failure_rate():
+    events = []
+    breakers = CircuitBreakers(POLICY)
+    breakers.add_listener(events.append)
+
+    trip(breakers["labels"])
+
+    assert breakers["labels"].state is CircuitState.OPEN
+    assert breakers["shipments"].state is CircuitState.CLOSED
+    assert events[0].family == "labels"
+    assert events[0].state is CircuitState.OPEN
+    assert events[0].failure_rate == 0.5
+
+    with pytest.raises(CircuitOpenError):
+        breakers["labels"].before_call()
+
+
+def test_trips_on_latency():
+    breakers = CircuitBreakers(POLICY)
+    breaker = breakers["tracking"]
+
+    for duration in (0.1, 2.0, 0.1, 2.0):
+        breaker.before_call()
+        breaker.record(duration, failed=False)
+
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_half_open_probe_closes_circuit():
+    events = []
+    breakers = CircuitBreakers(POLICY)
+    breakers.add_listener(events.append)
+    breaker = breakers["batches"]
+    trip(breaker)
+
+    time.sleep(0.06)
+    breaker.before_call()
+
+    # Only one probe is let through at a time.
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record(0.01, failed=False)
+
+    assert breaker.state is CircuitState.CLOSED
+    assert [event.state for event in events] == [
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.CLOSED,
+    ]
+
+
+def test_failed_probe_reopens_circuit():
+    breakers = CircuitBreakers(POLICY)
+    breaker = breakers["shipments"]
+    trip(breaker)
+
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.record(0.01, failed=True)
+
+    assert breaker.state is CircuitState.OPEN
+
+
+@pytest.mark.parametrize(
+    "path, family",
+    [
+        ("/v1/labels/se-123", "labels"),
+        ("/v1/labels/se-123/track", "tracking"),
+        ("/v1/tracking", "tracking"),
+        ("/v1/shipments", "shipments"),
+        ("/v1/batches/se-123/process/labels", "batches"),
+        ("/v1/carriers", None),
+    ],
+)
+def test_for_url(path, family):
+    breakers = CircuitBreakers(POLICY)
+    breaker = breakers.for_url(f"https://api.shipengine.com{path}")
+
+    assert (breaker.family if breaker else None) == family
+
+
+def test_adapter_fails_fast_while_open(monkeypatch, make_response):
+    sent = []
+
+    def send(self, request, **kwargs):
+        sent.append(request)
+        return make_response(503)
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+
+    breakers = CircuitBreakers(POLICY)
+    adapter = ShipEngineHTTPAdapter(circuit_breakers=breakers)
+    request = requests.Request("GET", "https://api.shipengine.com/v1/shipments/se-1")
+
+    for _ in range(4):
+        assert adapter.send(request.prepare()).status_code == 503
+
+    with pytest.raises(CircuitOpenError):
+        adapter.send(request.prepare())
+
+    assert len(sent) == 4
+
+
+def test_cancelled_probe_hands_back_its_slot():
+    breakers = CircuitBreakers(POLICY)
+    breaker = breakers["shipments"]
+    trip(breaker)
+    time.sleep(0.06)
+
+    async def handler(request):
+        if request.url.path.endswith("se-1"):
+            await asyncio.sleep(10)
+        return httpx.Response(200, json={})
+
+    async def run():
+        transport = AsyncRetryTransport(
+            httpx.MockTransport(handler),
+            retries=0,
+            backoff_factor=0,
+            circuit_breakers=breakers,
+        )
+        async with httpx.AsyncClient(transport=transport) as session:
+            probe = asyncio.create_task(
+                session.get("https://api.shipengine.com/v1/shipments/se-1")
+            )
+            await asyncio.sleep(0.01)
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+
+            assert breaker.state is CircuitState.HALF_OPEN
+
+            # The next call gets the probe slot instead of CircuitOpenError.
+            response = await session.get("https://api.shipengine.com/v1/shipments/se-2")
+            assert response.status_code == 200
+
+    asyncio.run(run())
+
+    assert breaker.state is CircuitState.CLOSED
@@ -0,0 +1,146 @@
+import copy
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+import vcr
+import yaml
+from attrs import define, evolve
+from attrs.exceptions import FrozenInstanceError
+
+from unofficial_shipengine.core.carriers.models import Carrier
+from unofficial_shipengine.core.common.models import Weight
+from unofficial_shipengine.core.labels.enums import LabelLayout
+from unofficial_shipengine.core.labels.models import Label, LabelDownload, PackageLabel
+from unofficial_shipengine.core.shipments.models import Shipment, ShipmentRequest
+from unofficial_shipengine.unofficial_shipengine import UnofficialShipEngine
+from unofficial_shipengine.unofficial_shipengine_config import (
+    UnofficialShipEngineConfig,
+)
+from unofficial_shipengine.utils.deserialize import decode
+from unofficial_shipengine.utils.serialize import to_dict
+
+from .test_serialize import make_shipment_request
+
+TESTS_DIR = Path(__file__).resolve().parents[1]
+
+
+def load_response(cassette, index):
+    path = TESTS_DIR / cassette
+    interactions = yaml.safe_load(path.read_text())["interactions"]
+    return json.loads(interactions[index]["response"]["body"]["string"])
+
+
+def test_round_trips_encoded_models():
+    shipment_request = make_shipment_request()
+
+    assert decode(ShipmentRequest, to_dict(shipment_request)) == shipment_request
+
+
+def test_decodes_label_response_without_mutating_it():
+    data = load_response("labels/vcr_cassettes/test_purchase_label_success.yaml", 1)
+    original = copy.deepcopy(data)
+
+    label = Label.from_dict(data)
+
+    assert data == original
+    assert label.status is Label.Status.COMPLETED
+    assert label.label_layout is LabelLayout.FOUR_BY_SIX
+    assert isinstance(label.label_download, LabelDownload)
+    assert label.form_download is None
+    assert label.packages[0].weight == Weight(1.0, Weight.Unit.OUNCE)
+
+
+def test_decodes_shipment_response():
+    data = load_response("shipments/vcr_cassettes/test_get_by_id_success.yaml", 2)
+
+    shipment = Shipment.from_dict(data)
+
+    assert shipment.shipment_id == data["shipment_id"]
+    assert shipment.shipment_status is Shipment.Status(data["shipment_status"])
+    assert shipment.ship_to.postal_code == data["ship_to"]["postal_code"]
+
+
+@define
+class Parcel:
+    weight: Weight
+    tracking_number: str
+    reference: str = "none"
+
+
+def test_tolerates_unknown_and_missing_fields():
+    parcel = decode(
+        Parcel,
+        {"weight": {"value": 2, "unit": "stone", "scale": "x"}, "carrier": "ups"},
+    )
+
+    assert parcel.weight.value == 2
+    assert parcel.weight.unit == "stone"
+    assert parcel.tracking_number is None
+    assert parcel.reference == "none"
+
+
+def test_lazy_view_decodes_fields_on_first_read():
+    data = load_response("labels/vcr_cassettes/test_purchase_label_success.yaml", 1)
+
+    label = decode(Label, data, lazy=True)
+
+    assert isinstance(label, Label)
+    with pytest.raises(AttributeError):
+        Label.label_download.__get__(label)
+
+    assert label.tracking_number == data["tracking_number"]
+    assert label.label_download.pdf == data["label_download"]["pdf"]
+    assert label.label_download is label.label_download
+    assert label.status is Label.Status.COMPLETED
+    assert isinstance(label.packages[0], PackageLabel)
+    assert label.packages[0].weight == Weight(1.0, Weight.Unit.OUNCE)
+
+
+def test_lazy_view_matches_eager_model():
+    data = load_response("shipments/vcr_cassettes/test_get_by_id_success.yaml", 2)
+
+    view = decode(Shipment, data, lazy=True)
+    shipment = decode(Shipment, data)
+
+    assert view == shipment
+    assert shipment == view
+    assert not view != shipment
+    assert repr(view) == repr(shipment)
+    assert to_dict(view) == to_dict(shipment)
+    assert view != decode(Shipment, {**data, "shipment_id": "se-other"}, lazy=True)
+
+
+def test_lazy_view_is_read_only():
+    data = load_response("shipments/vcr_cassettes/test_get_by_id_success.yaml", 2)
+    view = decode(Shipment, data, lazy=True)
+
+    with pytest.raises(FrozenInstanceError):
+        view.shipment_id = "se-other"
+
+    updated = evolve(view, shipment_id="se-other")
+    assert type(updated) is Shipment
+    assert updated.shipment_id == "se-other"
+    assert updated.ship_to == view.ship_to
+
+    assert type(pickle.loads(pickle.dumps(view))) is Shipment
+    assert copy.copy(view) == view
+
+
+def test_lazy_client():
+    config = UnofficialShipEngineConfig("api-key", lazy_models=True)
+    client = UnofficialShipEngine(config)
+    cassette = TESTS_DIR / "carriers/vcr_cassettes/test_get_carriers.yaml"
+
+    with vcr.use_cassette(cassette):
+        carriers = client.carriers.get_carriers()
+
+    eager = [
+        Carrier.from_dict(c)
+        for c in load_response("carriers/vcr_cassettes/test_get_carriers.yaml", 0)[
+            "carriers"
+        ]
+    ]
+    assert carriers == eager
+    assert all(type(carrier) is not Carrier for carrier in carriers)
@@ -0,0 +1,96 @@
+import gc
+import json
+
+from attrs import define
+
+from unofficial_shipengine.core.common.models import Address, Weight
+from unofficial_shipengine.core.shipments.models import Shipment
+from unofficial_shipengine.utils.deserialize import decode, get_decoder
+from unofficial_shipengine.utils.interning import FlyweightTable
+
+from .test_deserialize import load_response
+
+SHIPMENT = load_response("shipments/vcr_cassettes/test_get_by_id_success.yaml", 2)
+
+
+def parse_shipment(**changes):
+    # Every response is parsed on its own, so nothing is shared by the parser.
+    return json.loads(json.dumps({**SHIPMENT, **changes}))
+
+
+def test_identical_models_are_shared():
+    first = decode(Shipment, parse_shipment(), intern=True)
+    second = decode(Shipment, parse_shipment(shipment_id="se-other"), intern=True)
+
+    assert first.ship_from is second.ship_from
+    assert first.return_to is second.return_to
+    assert first.total_weight is second.total_weight
+    assert first.packages[0].weight is second.packages[0].weight
+    assert first.ship_from == decode(Address, SHIPMENT["ship_from"])
+
+
+def test_catalog_strings_are_interned():
+    first = decode(Shipment, parse_shipment(), intern=True)
+    second = decode(Shipment, parse_shipment(), intern=True)
+
+    assert first.carrier_id is second.carrier_id
+    assert first.service_code is second.service_code
+    assert first.packages[0].package_code is second.packages[0].package_code
+
+
+def test_interning_is_opt_in():
+    first = decode(Shipment, parse_shipment())
+    second = decode(Shipment, parse_shipment())
+
+    assert first.ship_from == second.ship_from
+    assert first.ship_from is not second.ship_from
+
+
+def test_lazy_views_share_models():
+    first = decode(Shipment, parse_shipment(), lazy=True, intern=True)
+    second = decode(Shipment, parse_shipment(), lazy=True, intern=True)
+
+    assert first.ship_to is second.ship_to
+    assert type(first.ship_to) is Address
+
+
+def test_different_values_are_not_shared():
+    decode_weight = get_decoder(Weight, intern=True)
+    address = dict(SHIPMENT["ship_to"])
+    del address["country_code"]
+
+    assert decode_weight({"value": 1, "unit": "ounce"}) is not decode_weight(
+        {"value": 1.0, "unit": "ounce"}
+    )
+    assert decode(Address, address, intern=True) is not decode(
+        Address, {**address, "country_code": None}, intern=True
+    )
+
+
+@define
+class Point:
+    coordinates: list[float]
+
+
+def test_unhashable_values_are_not_shared():
+    table = FlyweightTable(Point, get_decoder(Point))
+
+    first = table.decode({"coordinates": [1.0, 2.0]})
+    second = table.decode({"coordinates": [1.0, 2.0]})
+
+    assert first == second
+    assert first is not second
+    assert len(table) == 0
+
+
+def test_unused_models_are_dropped():
+    table = FlyweightTable(Weight, get_decoder(Weight))
+
+    weight = table.decode({"value": 3, "unit": "pound"})
+    assert table.decode({"value": 3, "unit": "pound"}) is weight
+    assert len(table) == 1
+
+    del weight
+    gc.collect()
+
+    assert len(table) == 0
@@ -0,0 +1,143 @@
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+import vcr
+
+from unofficial_shipengine.core.carriers.models import Carrier
+from unofficial_shipengine.core.common.services import parse_response
+from unofficial_shipengine.exceptions import ShipEngineAPIError
+from unofficial_shipengine.unofficial_shipengine import UnofficialShipEngine
+from unofficial_shipengine.unofficial_shipengine_config import (
+    UnofficialShipEngineConfig,
+)
+from unofficial_shipengine.utils.json_backend import (
+    OrjsonBackend,
+    StdlibJSONBackend,
+    get_json_backend,
+)
+
+from .test_serialize import make_shipment_request
+
+requires_orjson = pytest.mark.skipif(
+    importlib.util.find_spec("orjson") is None, reason="orjson is not installed"
+)
+
+CASSETTES = Path(__file__).resolve().parent.parent / "carriers" / "vcr_cassettes"
+
+
+class RecordingBackend(StdlibJSONBackend):
+    def __init__(self):
+        self.loaded = []
+        self.dumped = []
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super().loads(data)
+
+    def dumps(self, value):
+        self.dumped.append(value)
+        return super().dumps(value)
+
+
+@pytest.mark.parametrize(
+    "backend_class",
+    [StdlibJSONBackend, pytest.param(OrjsonBackend, marks=requires_orjson)],
+)
+def test_round_trip(backend_class):
+    backend = backend_class()
+    value = {"shipments": [{"name": "Zoë", "weight": 1.5, "tags": ("a", "b")}]}
+
+    data = backend.dumps(value)
+
+    assert isinstance(data, bytes)
+    assert json.loads(data) == {
+        "shipments": [{"name": "Zoë", "weight": 1.5, "tags": ["a", "b"]}]
+    }
+    assert backend.loads(data) == json.loads(data)
+    assert backend.loads(data.decode()) == json.loads(data)
+
+
+@requires_orjson
+def test_backends_encode_alike():
+    value = {"a": [1, 2.5, None, True], "b": {"c": "é"}}
+
+    assert json.loads(StdlibJSONBackend().dumps(value)) == json.loads(
+        OrjsonBackend().dumps(value)
+    )
+
+
+@requires_orjson
+def test_default_backend_prefers_orjson():
+    assert isinstance(get_json_backend(), OrjsonBackend)
+    assert get_json_backend() is get_json_backend()
+
+
+def test_missing_orjson(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+
+    with pytest.raises(ImportError, match="unofficial_shipengine\\[orjson\\]"):
+        OrjsonBackend()
+
+
+def test_configured_backend_is_used():
+    backend = RecordingBackend()
+    client = UnofficialShipEngine(
+        UnofficialShipEngineConfig("api-key", json_backend=backend)
+    )
+
+    with vcr.use_cassette(CASSETTES / "test_get_carriers.yaml"):
+        carriers = client.carriers.get_carriers()
+
+    assert all(isinstance(carrier, Carrier) for carrier in carriers)
+    assert len(backend.loaded) == 1
+    assert isinstance(backend.loaded[0], bytes)
+
+
+def test_request_bodies_are_bytes():
+    backend = RecordingBackend()
+    client = UnofficialShipEngine(
+        UnofficialShipEngineConfig("api-key", json_backend=backend)
+    )
+    request = make_shipment_request()
+
+    body = client.shipments._dumps({"shipments": [request]})
+
+    assert isinstance(body, bytes)
+    assert backend.dumped[0]["shipments"][0]["ship_to"]["name"] == request.ship_to.name
+
+
+def test_parse_response_parses_once(make_response):
+    backend = RecordingBackend()
+
+    data = parse_response(backend, make_response(200, b'{"batch_id":"se-1"}'))
+
+    assert data == {"batch_id": "se-1"}
+    assert backend.loaded == [b'{"batch_id":"se-1"}']
+
+
+def test_parse_response_raises_reported_error(make_response):
+    backend = RecordingBackend()
+    body = b'{"request_id":"abc","errors":[{"message":"Invalid batch"}]}'
+
+    with pytest.raises(ShipEngineAPIError) as e:
+        parse_response(backend, make_response(400, body))
+
+    assert e.value.request_id == "abc"
+    assert e.value.errors == [{"message": "Invalid batch"}]
+    assert len(backend.loaded) == 1
+
+
+def test_parse_response_without_body(make_response):
+    backend = RecordingBackend()
+
+    assert parse_response(backend, make_response(204, b"")) is None
+    assert backend.loaded == []
+
+
+def test_parse_response_error_without_json_body(make_response):
+    with pytest.raises(requests.HTTPError):
+        parse_response(StdlibJSONBackend(), make_response(502, b"<html>Bad Gateway"))
@@ -0,0 +1,190 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from unofficial_shipengine.core.shipments.services import _rejected
+from unofficial_shipengine.exceptions import DeadlineExceededError, ShipEngineAPIError
+from unofficial_shipengine.utils.micro_batch import AsyncMicroBatcher, MicroBatcher
+from unofficial_shipengine.utils.timeouts import deadline
+
+
+class Sender:
+    def __init__(self, invalid=()):
+        self.batches = []
+        self.invalid = invalid
+        self._lock = threading.Lock()
+
+    def __call__(self, items):
+        with self._lock:
+            self.batches.append(list(items))
+        if any(item in self.invalid for item in items):
+            raise ShipEngineAPIError("abc", [f"Invalid items {self.invalid}"], 400)
+        return [item * 10 for item in items]
+
+
+def test_calls_are_sent_together():
+    sender = Sender()
+    batcher = MicroBatcher(sender, max_size=8, max_delay=1.0)
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(batcher.submit, range(8)))
+
+    assert results == [i * 10 for i in range(8)]
+    assert len(sender.batches) == 1
+
+
+def test_batch_is_sent_after_delay():
+    sender = Sender()
+    batcher = MicroBatcher(sender, max_size=100, max_delay=0.01)
+
+    assert batcher.submit(1) == 10
+    assert batcher.submit(2) == 20
+    assert sender.batches == [[1], [2]]
+
+
+def test_full_batches_start_new_ones():
+    sender = Sender()
+    batcher = MicroBatcher(sender, max_size=3, max_delay=0.05)
+
+    with ThreadPoolExecutor(9) as executor:
+        results = list(executor.map(batcher.submit, range(9)))
+
+    assert results == [i * 10 for i in range(9)]
+    assert all(len(batch) <= 3 for batch in sender.batches)
+    assert sorted(item for batch in sender.batches for item in batch) == list(range(9))
+
+
+def test_rejected_batch_is_split():
+    sender = Sender(invalid=(2,))
+    batcher = MicroBatcher(sender, 3, 1.0, split_on=_rejected)
+
+    with ThreadPoolExecutor(3) as executor:
+        futures = [executor.submit(batcher.submit, i) for i in range(3)]
+
+    assert futures[0].result() == 0
+    assert futures[1].result() == 10
+    with pytest.raises(ShipEngineAPIError):
+        futures[2].result()
+    assert sender.batches[1:] == [[0], [1], [2]]
+
+
+def test_other_errors_reach_every_caller():
+    sender = Sender(invalid=(2,))
+    batcher = MicroBatcher(sender, 3, 1.0)
+
+    with ThreadPoolExecutor(3) as executor:
+        futures = [executor.submit(batcher.submit, i) for i in range(3)]
+
+    for future in futures:
+        assert isinstance(future.exception(), ShipEngineAPIError)
+    assert len(sender.batches) == 1
+
+
+def test_server_errors_are_not_split():
+    batches = []
+
+    def send(items):
+        batches.append(list(items))
+        raise ShipEngineAPIError("abc", ["Internal error"], 500)
+
+    batcher = MicroBatcher(send, 3, 1.0, split_on=_rejected)
+
+    with ThreadPoolExecutor(3) as executor:
+        futures = [executor.submit(batcher.submit, i) for i in range(3)]
+
+    for future in futures:
+        assert isinstance(future.exception(), ShipEngineAPIError)
+    assert batches == [[0, 1, 2]]
+
+
+@pytest.mark.parametrize(
+    "answer", [lambda items: items[:-1], lambda items: json.loads("<html>")]
+)
+def test_unusable_answers_are_not_resent(answer):
+    batches = []
+
+    def send(items):
+        batches.append(list(items))
+        return answer(items)
+
+    batcher = MicroBatcher(send, 3, 1.0, split_on=_rejected)
+
+    with ThreadPoolExecutor(3) as executor:
+        futures = [executor.submit(batcher.submit, i) for i in range(3)]
+
+    errors = [future.exception() for future in futures]
+    assert all(isinstance(e, ValueError) for e in errors)
+    assert errors[0] is errors[1] is errors[2]
+    assert batches == [[0, 1, 2]]
+
+
+def test_followers_respect_their_deadline():
+    release = threading.Event()
+
+    def send(items):
+        release.wait(5.0)
+        return items
+
+    batcher = MicroBatcher(send, 2, 1.0)
+
+    with ThreadPoolExecutor(1) as executor:
+        leader = executor.submit(batcher.submit, 0)
+        with deadline(0.05), pytest.raises(DeadlineExceededError):
+            batcher.submit(1)
+        release.set()
+        assert leader.result() == 0
+
+
+def test_async_calls_are_sent_together():
+    batches = []
+
+    async def send(items):
+        batches.append(list(items))
+        await asyncio.sleep(0)
+        return [item * 10 for item in items]
+
+    async def run():
+        batcher = AsyncMicroBatcher(send, max_size=4, max_delay=0.01)
+        return await asyncio.gather(*(batcher.submit(i) for i in range(6)))
+
+    assert asyncio.run(run()) == [i * 10 for i in range(6)]
+    assert batches == [[0, 1, 2, 3], [4, 5]]
+
+
+def test_async_callers_get_a_cancelled_batch_error():
+    release = asyncio.Event()
+
+    async def send(items):
+        await release.wait()
+        return items
+
+    async def run():
+        batcher = AsyncMicroBatcher(send, max_size=2, max_delay=1.0)
+        first = asyncio.ensure_future(batcher.submit(0))
+        await asyncio.sleep(0)
+        task = batcher._batch.task
+        second = asyncio.ensure_future(batcher.submit(1))
+        await asyncio.sleep(0)
+        task.cancel()
+        return await asyncio.gather(first, second, return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+
+def test_async_followers_respect_their_deadline():
+    async def send(items):
+        await asyncio.sleep(5.0)
+        return items
+
+    async def run():
+        batcher = AsyncMicroBatcher(send, max_size=1, max_delay=1.0)
+        with deadline(0.05):
+            await batcher.submit(0)
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(run())
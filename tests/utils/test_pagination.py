@@ -0,0 +1,95 @@
+import asyncio
+import threading
+from datetime import datetime, timezone
+
+from unofficial_shipengine.core.shipments.models import Shipment
+from unofficial_shipengine.utils.pagination import (
+    async_paginate,
+    has_next_page,
+    paginate,
+    query_params,
+)
+
+
+def test_has_next_page():
+    assert has_next_page({"pages": 3}, 2)
+    assert not has_next_page({"pages": 3}, 3)
+    assert has_next_page({"links": {"next": {"href": "https://..."}}}, 1)
+    assert not has_next_page({"links": {"next": None}}, 1)
+    assert not has_next_page({}, 1)
+
+
+class Pages:
+    def __init__(self, count):
+        self.count = count
+        self.fetched = []
+        self.events = [threading.Event() for _ in range(count + 1)]
+
+    def __call__(self, page):
+        self.fetched.append(page)
+        self.events[page].set()
+        return [page * 10, page * 10 + 1], page < self.count
+
+
+def test_paginate_prefetches_next_page():
+    pages = Pages(3)
+    items = paginate(pages, prefetch=True)
+
+    assert next(items) == 10
+    # Page 2 is fetched while the caller is still on page 1.
+    assert pages.events[2].wait(1)
+
+    assert list(items) == [11, 20, 21, 30, 31]
+    assert pages.fetched == [1, 2, 3]
+
+
+def test_paginate_without_prefetch():
+    pages = Pages(3)
+    items = paginate(pages, prefetch=False)
+
+    assert next(items) == 10
+    assert pages.fetched == [1]
+    assert list(items) == [11, 20, 21, 30, 31]
+
+
+def test_paginate_stops_with_caller():
+    pages = Pages(100)
+    items = paginate(pages, prefetch=True)
+
+    assert [next(items) for _ in range(3)] == [10, 11, 20]
+    items.close()
+
+    assert len(pages.fetched) <= 3
+
+
+def test_async_paginate_stops_with_caller():
+    fetched = []
+
+    async def fetch_page(page):
+        fetched.append(page)
+        return [page], True
+
+    async def run():
+        items = async_paginate(fetch_page)
+        seen = [await items.__anext__() for _ in range(3)]
+        await items.aclose()
+        return seen
+
+    assert asyncio.run(run()) == [1, 2, 3]
+    # At most the prefetch of page 4 was started, and it was cancelled.
+    assert fetched in ([1, 2, 3], [1, 2, 3, 4])
+
+
+def test_query_params():
+    created = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+    assert query_params(
+        shipment_status=Shipment.Status.PENDING,
+        batch_id=None,
+        created_at_start=created,
+        page_size=50,
+    ) == {
+        "shipment_status": "pending",
+        "created_at_start": "2024-05-01T00:00:00+00:00",
+        "page_size": 50,
+    }
@@ -0,0 +1,34 @@
+import pytest
+
+from unofficial_shipengine.utils.polling import AdaptivePoller
+
+
+def test_poller_follows_progress(clock):
+    poller = AdaptivePoller(1.0, 60.0, clock)
+
+    assert poller.next_delay(0, 1000) == 1.0
+
+    # 100 done in 10 s: 900 left take 90 s, so poll again in 45 s.
+    clock.now = 10.0
+    assert poller.next_delay(100, 1000) == 45.0
+
+    # Close to the end, polls get closer together.
+    clock.now = 55.0
+    assert poller.next_delay(990, 1000) == pytest.approx(1.0)
+
+
+def test_poller_backs_off_without_progress(clock):
+    poller = AdaptivePoller(1.0, 5.0, clock)
+
+    delays = []
+    for _ in range(5):
+        delays.append(poller.next_delay(0, 10))
+        clock.now += delays[-1]
+
+    assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+    assert poller.next_delay(10, 10) == 1.0
+
+
+def test_poller_rejects_invalid_intervals():
+    with pytest.raises(ValueError):
+        AdaptivePoller(5.0, 1.0)
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+from unofficial_shipengine.exceptions import DeadlineExceededError
+from unofficial_shipengine.utils.adapters import DeadlineRetry, ShipEngineHTTPAdapter
+from unofficial_shipengine.utils.rate_limit import (
+    FileLockBackend,
+    RateLimiter,
+    parse_retry_after,
+)
+from unofficial_shipengine.utils.timeouts import deadline
+
+
+def test_burst_then_throttle():
+    limiter = RateLimiter(rate=20, burst=2)
+
+    start = time.monotonic()
+    for _ in range(4):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    # Two tokens are available right away, the next two refill at 20 per second.
+    assert 0.08 <= elapsed < 0.5
+
+
+def test_pause_blocks_acquire():
+    limiter = RateLimiter(rate=1000)
+    limiter.pause(0.1)
+
+    start = time.monotonic()
+    limiter.acquire()
+
+    assert time.monotonic() - start >= 0.09
+
+
+def test_paused_limiter_respects_deadline(monkeypatch, make_response):
+    monkeypatch.setattr(HTTPAdapter, "send", lambda self, r, **kw: make_response(200))
+
+    limiter = RateLimiter(rate=1000)
+    limiter.pause(3)
+    session = requests.Session()
+    session.mount("https://", ShipEngineHTTPAdapter(rate_limiter=limiter))
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceededError), deadline(0.5):
+        session.get("https://api.shipengine.com/v1/carriers")
+
+    assert time.monotonic() - start < 0.5
+
+
+def test_async_paused_limiter_respects_deadline():
+    limiter = RateLimiter(rate=1000)
+    limiter.pause(3)
+
+    async def acquire():
+        with deadline(0.5):
+            await limiter.acquire_async()
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(acquire())
+
+    assert time.monotonic() - start < 0.5
+
+
+def test_file_backend_is_shared(tmp_path):
+    path = tmp_path / "shipengine.ratelimit"
+    first = RateLimiter(rate=0.01, burst=1, backend=FileLockBackend(path))
+    second = RateLimiter(rate=0.01, burst=1, backend=FileLockBackend(path))
+
+    first.acquire()
+
+    assert second.backend.transact(second._take) > 0
+
+
+def test_async_acquire_runs_blocking_backends_off_the_loop(tmp_path):
+    threads = []
+
+    class Backend(FileLockBackend):
+        def transact(self, update):
+            threads.append(threading.current_thread())
+            return super().transact(update)
+
+    limiter = RateLimiter(rate=1000, backend=Backend(tmp_path / "ratelimit"))
+
+    async def run():
+        await limiter.acquire_async()
+        await limiter.pause_async(0.0)
+
+    asyncio.run(run())
+
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not-a-date") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_adapter_retries_429_after_retry_after(monkeypatch, make_response):
+    responses = [
+        make_response(429, headers={"Retry-After": "0.05"}),
+        make_response(200),
+    ]
+    sent = []
+
+    def send(self, request, **kwargs):
+        sent.append(request)
+        return responses.pop(0)
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+
+    limiter = RateLimiter(rate=1000)
+    adapter = ShipEngineHTTPAdapter(
+        rate_limiter=limiter, max_retries=Retry(total=3, backoff_factor=0)
+    )
+    request = requests.Request("POST", "https://api.shipengine.com/v1/labels")
+
+    start = time.monotonic()
+    response = adapter.send(request.prepare())
+
+    assert response.status_code == 200
+    assert len(sent) == 2
+    assert time.monotonic() - start >= 0.04
+
+
+def test_adapter_gives_up_after_retries(monkeypatch, make_response):
+    monkeypatch.setattr(HTTPAdapter, "send", lambda self, r, **kw: make_response(429))
+
+    adapter = ShipEngineHTTPAdapter(max_retries=Retry(total=1, backoff_factor=0))
+    request = requests.Request("GET", "https://api.shipengine.com/v1/carriers")
+
+    assert adapter.send(request.prepare()).status_code == 429
+
+
+def test_deadline_retry_leaves_429_to_the_adapter():
+    retry = DeadlineRetry(total=3, status_forcelist=[500, 502, 503, 504])
+
+    assert not retry.is_retry("GET", 429, has_retry_after=True)
+    assert retry.is_retry("GET", 503, has_retry_after=True)
@@ -0,0 +1,177 @@
+import json
+from enum import Enum
+from typing import Optional
+
+from attrs import asdict, define, field
+
+from unofficial_shipengine.core.batches.models import BatchRequest, ProcessLabels
+from unofficial_shipengine.core.common.models import (
+    Address,
+    Dimension,
+    Package,
+    Product,
+    Value,
+    Weight,
+)
+from unofficial_shipengine.core.labels.models import LabelRequest
+from unofficial_shipengine.core.shipments.models import (
+    AdvancedOptions,
+    ShipmentRequest,
+    TaxIdentifier,
+)
+from unofficial_shipengine.utils.deserialize import decode
+from unofficial_shipengine.utils.serialize import serializer, to_dict, to_json
+
+ADDRESS = Address(
+    name="Electronic Output Solutions",
+    phone="555-555-5555",
+    address_line1="2510 Commerce Way",
+    city_locality="Vista",
+    state_province="CA",
+    postal_code="92081",
+    country_code="US",
+)
+
+
+def make_shipment_request():
+    weight = Weight(1, Weight.Unit.OUNCE)
+
+    return ShipmentRequest(
+        carrier_id="se-123",
+        service_code="usps_ground_advantage",
+        ship_to=ADDRESS,
+        ship_from=ADDRESS,
+        tags=["rush", "fragile"],
+        advanced_options=AdvancedOptions(
+            dry_ice_weight=weight,
+            collect_on_delivery=AdvancedOptions.CollectOnDelivery(
+                AdvancedOptions.CollectOnDelivery.PaymentType.CASH, Value(amount=5)
+            ),
+        ),
+        tax_identifiers=[
+            TaxIdentifier(
+                TaxIdentifier.TaxableEntityType.SHIPPER,
+                TaxIdentifier.IdentifierType.VAT,
+                "GB",
+                "123",
+            )
+        ],
+        packages=[
+            Package(
+                weight,
+                dimensions=Dimension(1, 2, 3),
+                label_messages=Package.LabelMessages(reference1="order 1"),
+                products=[Product(2, Value(amount=3), weight, description="Widget")],
+            )
+        ],
+    )
+
+
+@define
+class Node:
+    class Color(Enum):
+        RED = "red"
+
+    name: str
+    children: list["Node"] = field(factory=list)
+    colors: tuple[Color, ...] = field(default=(Color.RED,))
+    attributes: dict[Color, Optional[Color]] = field(factory=dict)
+    keys: dict[tuple[Color, ...], int] = field(factory=dict)
+
+
+def test_matches_asdict():
+    models = [
+        make_shipment_request(),
+        LabelRequest(shipment=make_shipment_request()),
+        BatchRequest(["se-1", "se-2"], process_labels=ProcessLabels()),
+        Node(
+            "root",
+            children=[Node("leaf", colors={Node.Color.RED})],
+            attributes={Node.Color.RED: None},
+            keys={(Node.Color.RED,): 1},
+        ),
+    ]
+
+    for model in models:
+        assert to_dict(model) == asdict(model, value_serializer=serializer)
+
+
+def test_to_json_encodes_lists_of_models():
+    shipment_request = make_shipment_request()
+
+    assert to_json({"shipments": [shipment_request]}) == to_json(
+        {"shipments": [asdict(shipment_request, value_serializer=serializer)]}
+    )
+
+
+def test_sparse_leaves_out_unset_fields():
+    shipment_request = make_shipment_request()
+
+    data = to_dict(shipment_request, sparse=True)
+
+    assert "ship_date" not in data
+    assert "is_return" not in data
+    assert "items" not in data
+    assert data["tags"] == ["rush", "fragile"]
+    assert data["ship_to"] == {
+        "name": "Electronic Output Solutions",
+        "phone": "555-555-5555",
+        "address_line1": "2510 Commerce Way",
+        "city_locality": "Vista",
+        "state_province": "CA",
+        "postal_code": "92081",
+        "country_code": "US",
+        "address_residential_indicator": "unknown",
+    }
+    assert data["advanced_options"] == {
+        "dry_ice_weight": {"value": 1, "unit": "ounce"},
+        "collect_on_delivery": {
+            "payment_type": "cash",
+            "payment_amount": {"currency": "usd", "amount": 5},
+        },
+    }
+
+
+def test_sparse_keeps_other_defaults():
+    data = to_dict(BatchRequest(["se-1"], process_labels=ProcessLabels()), sparse=True)
+
+    assert data["process_labels"]["create_batch_and_process_labels"] is True
+    assert data["process_labels"]["label_format"] == "pdf"
+    assert to_dict(Value(amount=0), sparse=True) == {"currency": "usd", "amount": 0}
+    assert to_dict(make_shipment_request(), sparse=True)["confirmation"] == "none"
+
+
+def test_sparse_keeps_set_flags():
+    options = AdvancedOptions(
+        saturday_delivery=True, use_ups_ground_freight_pricing=False, freight_class="50"
+    )
+
+    data = to_dict(options, sparse=True)
+
+    assert data == {
+        "saturday_delivery": True,
+        "use_ups_ground_freight_pricing": False,
+        "freight_class": "50",
+    }
+
+
+def test_sparse_round_trips():
+    shipment_request = make_shipment_request()
+    label_request = LabelRequest(shipment=shipment_request)
+
+    assert (
+        decode(ShipmentRequest, to_dict(shipment_request, sparse=True))
+        == shipment_request
+    )
+    assert decode(LabelRequest, to_dict(label_request, sparse=True)) == label_request
+
+
+def test_sparse_json_is_smaller():
+    body = {"shipments": [make_shipment_request()]}
+
+    sparse = to_json(body, sparse=True)
+
+    assert json.loads(sparse)["shipments"][0] == to_dict(
+        make_shipment_request(), sparse=True
+    )
+    assert len(sparse) * 2 < len(to_json(body))
@@ -0,0 +1,57 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import vcr
+
+from unofficial_shipengine.core.carriers.models import Carrier
+from unofficial_shipengine.unofficial_shipengine import UnofficialShipEngine
+from unofficial_shipengine.unofficial_shipengine_config import (
+    UnofficialShipEngineConfig,
+)
+from unofficial_shipengine.utils.sessions import ThreadLocalSession
+
+BASE_DIR: Path = Path(__file__).parent.parent
+
+
+def test_each_thread_gets_its_own_session():
+    client = UnofficialShipEngine(
+        UnofficialShipEngineConfig("api-key", thread_safe=True)
+    )
+    session = client._session
+    assert isinstance(session, ThreadLocalSession)
+
+    barrier = threading.Barrier(4)
+
+    def current_session():
+        barrier.wait()
+        return session.current
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        sessions = list(executor.map(lambda _: current_session(), range(4)))
+
+    assert len({id(s) for s in sessions}) == 4
+
+    adapters = {id(s.get_adapter("https://api.shipengine.com")) for s in sessions}
+    assert len(adapters) == 1
+
+
+def test_shared_client_across_threads():
+    client = UnofficialShipEngine(UnofficialShipEngineConfig("", thread_safe=True))
+    results: list[list[Carrier]] = []
+
+    def get_carriers():
+        results.append(client.carriers.get_carriers())
+
+    with vcr.use_cassette(
+        BASE_DIR / "carriers" / "vcr_cassettes" / "test_get_carriers.yaml",
+        filter_headers=["API-Key"],
+        allow_playback_repeats=True,
+    ):
+        for _ in range(4):
+            thread = threading.Thread(target=get_carriers)
+            thread.start()
+            thread.join()
+
+    assert len(results) == 4
+    assert all(isinstance(c, Carrier) for carriers in results for c in carriers)
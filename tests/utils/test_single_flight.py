@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from unofficial_shipengine.exceptions import DeadlineExceededError
+from unofficial_shipengine.utils.single_flight import AsyncSingleFlight, SingleFlight
+from unofficial_shipengine.utils.timeouts import deadline
+
+
+def test_concurrent_calls_share_one_result():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait()
+        return object()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(single_flight.do, "se-1", fetch)]
+        while not single_flight._calls:
+            time.sleep(0.001)
+
+        futures += [executor.submit(single_flight.do, "se-1", fetch) for _ in range(3)]
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert not single_flight._calls
+
+
+def test_errors_are_shared():
+    single_flight = SingleFlight()
+    release = threading.Event()
+
+    def fetch():
+        release.wait()
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(single_flight.do, "se-1", fetch) for _ in range(2)]
+        release.set()
+
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+
+
+def test_sequential_calls_are_not_coalesced():
+    single_flight = SingleFlight()
+
+    assert single_flight.do("se-1", lambda: 1) == 1
+    assert single_flight.do("se-1", lambda: 2) == 2
+
+
+def test_waiting_respects_deadline():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    leader = threading.Thread(target=single_flight.do, args=("se-1", release.wait))
+    leader.start()
+
+    while not single_flight._calls:
+        time.sleep(0.001)
+
+    with deadline(0.05), pytest.raises(DeadlineExceededError):
+        single_flight.do("se-1", lambda: None)
+
+    release.set()
+    leader.join()
+
+
+def test_async_concurrent_calls_share_one_result():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+
+    async def run():
+        return await asyncio.gather(
+            *(single_flight.do("se-1", fetch) for _ in range(5))
+        )
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_async_cancelled_leader_does_not_cancel_followers():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "warehouse"
+
+    async def run():
+        leader = asyncio.ensure_future(single_flight.do("se-1", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(single_flight.do("se-1", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(run()) == "warehouse"
+    assert calls == [1]
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+from attrs import evolve
+
+from unofficial_shipengine.core.common.models import Package, Weight
+from unofficial_shipengine.core.labels.models import LabelRequest
+from unofficial_shipengine.core.shipments.models import ShipmentRequest
+from unofficial_shipengine.utils.json_backend import StdlibJSONBackend
+from unofficial_shipengine.utils.serialize import encode_value
+from unofficial_shipengine.utils.templates import RequestTemplate
+
+from .test_serialize import ADDRESS
+
+CUSTOMER = evolve(ADDRESS, name="Customer", address_line1="1 Main St")
+PACKAGES = [Package(weight=Weight(2, Weight.Unit.POUND))]
+
+
+def make_template(sparse=False):
+    return RequestTemplate(
+        ShipmentRequest,
+        StdlibJSONBackend(),
+        sparse,
+        carrier_id="se-123",
+        service_code="usps_ground_advantage",
+        ship_from=ADDRESS,
+        tags=["rush"],
+    )
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_encode_matches_full_request(sparse):
+    template = make_template(sparse)
+    varying = {"ship_to": CUSTOMER, "packages": PACKAGES}
+
+    body = json.loads(template.encode(**varying))
+
+    assert body == encode_value(template.build(**varying), sparse)
+    assert body["ship_from"]["name"] == ADDRESS.name
+    assert body["ship_to"]["name"] == "Customer"
+
+
+def test_varying_fields_override_shared_ones():
+    template = make_template()
+
+    first = json.loads(template.encode(ship_to=CUSTOMER, carrier_id="se-456"))
+    second = json.loads(template.encode(ship_to=CUSTOMER))
+
+    assert first["carrier_id"] == "se-456"
+    assert second["carrier_id"] == "se-123"
+    assert list(first).count("carrier_id") == 1
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(TypeError):
+        make_template().encode(ship_too=CUSTOMER)
+
+    with pytest.raises(TypeError):
+        RequestTemplate(ShipmentRequest, StdlibJSONBackend(), carrier="se-123")
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_nested_templates(sparse):
+    template = RequestTemplate(
+        LabelRequest,
+        StdlibJSONBackend(),
+        sparse,
+        shipment=make_template(sparse),
+        rma_number="RMA-1",
+    )
+    varying = {"shipment": {"ship_to": CUSTOMER, "packages": PACKAGES}}
+
+    body = json.loads(template.encode(**varying))
+    request = template.build(**varying)
+
+    assert body == encode_value(request, sparse)
+    assert request.shipment.ship_to == CUSTOMER
+    assert body["shipment"]["carrier_id"] == "se-123"
+
+
+def test_nested_template_can_be_replaced():
+    template = RequestTemplate(
+        LabelRequest, StdlibJSONBackend(), shipment=make_template()
+    )
+    shipment = ShipmentRequest(
+        carrier_id="se-789", service_code="ups_ground", ship_to=CUSTOMER
+    )
+
+    body = json.loads(template.encode(shipment=shipment))
+
+    assert body["shipment"] == encode_value(shipment)
@@ -0,0 +1,140 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from unofficial_shipengine.exceptions import DeadlineExceededError
+from unofficial_shipengine.utils.adapters import (
+    DeadlineRetry,
+    DeadlineTimeout,
+    ShipEngineHTTPAdapter,
+)
+from unofficial_shipengine.utils.async_transport import AsyncRetryTransport
+from unofficial_shipengine.utils.timeouts import (
+    EndpointTimeouts,
+    check_deadline,
+    deadline,
+    get_remaining,
+)
+
+TIMEOUTS = EndpointTimeouts(
+    connect=5, default=30, label_purchase=90, tracking=10, batch_processing=120
+)
+
+
+@pytest.mark.parametrize(
+    "method, path, read",
+    [
+        ("POST", "/v1/labels", 90),
+        ("POST", "/v1/labels/shipment/se-123", 90),
+        ("POST", "/v1/labels/se-123/return", 90),
+        ("GET", "/v1/labels/se-123", 30),
+        ("GET", "/v1/tracking?carrier_code=ups&tracking_number=1Z", 10),
+        ("GET", "/v1/labels/se-123/track", 10),
+        ("POST", "/v1/batches/se-123/process/labels", 120),
+        ("POST", "/v1/batches", 30),
+    ],
+)
+def test_endpoint_timeouts(method, path, read):
+    url = f"https://api.shipengine.com{path}"
+
+    assert TIMEOUTS.for_request(method, url) == (5, read)
+
+
+def test_nested_deadline_never_extends():
+    assert get_remaining() is None
+
+    with deadline(1):
+        with deadline(10):
+            assert get_remaining() <= 1
+
+    assert get_remaining() is None
+
+
+def test_check_deadline():
+    with deadline(0.5):
+        check_deadline(0.1)
+
+        with pytest.raises(DeadlineExceededError):
+            check_deadline(1)
+
+
+def test_deadline_caps_timeout():
+    timeout = DeadlineTimeout(connect=5, read=30).clone()
+
+    with deadline(1):
+        assert timeout.connect_timeout <= 1
+        assert timeout.read_timeout <= 1
+
+    assert timeout.read_timeout == 30
+
+
+def test_retry_gives_up_before_deadline():
+    retry = DeadlineRetry(total=5, backoff_factor=10)
+    retry = retry.increment("GET", "/", error=requests.ConnectionError())
+
+    with deadline(5):
+        with pytest.raises(DeadlineExceededError):
+            retry.increment("GET", "/", error=requests.ConnectionError())
+
+
+def test_adapter_uses_endpoint_timeout(monkeypatch, make_response):
+    sent = []
+
+    def send(self, request, **kwargs):
+        sent.append(kwargs["timeout"])
+        return make_response(200)
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+
+    adapter = ShipEngineHTTPAdapter(timeouts=TIMEOUTS)
+    request = requests.Request("GET", "https://api.shipengine.com/v1/tracking")
+    adapter.send(request.prepare(), timeout=None)
+
+    assert sent[0].connect_timeout == 5
+    assert sent[0].read_timeout == 10
+
+
+def test_adapter_does_not_wait_past_deadline(monkeypatch, make_response):
+    monkeypatch.setattr(
+        HTTPAdapter,
+        "send",
+        lambda self, r, **kw: make_response(429, headers={"Retry-After": "30"}),
+    )
+
+    adapter = ShipEngineHTTPAdapter(max_retries=DeadlineRetry(total=3))
+    request = requests.Request("POST", "https://api.shipengine.com/v1/labels")
+
+    start = time.monotonic()
+    with deadline(1), pytest.raises(DeadlineExceededError):
+        adapter.send(request.prepare())
+
+    assert time.monotonic() - start < 1
+
+
+def test_async_transport_applies_deadline():
+    sent = []
+
+    def handler(request):
+        sent.append(request.extensions["timeout"])
+        return httpx.Response(503)
+
+    transport = AsyncRetryTransport(
+        httpx.MockTransport(handler), retries=5, backoff_factor=10, timeouts=TIMEOUTS
+    )
+
+    async def send():
+        async with httpx.AsyncClient(transport=transport, timeout=None) as client:
+            with deadline(2):
+                await client.get("https://api.shipengine.com/v1/tracking")
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(send())
+
+    # The first retry is immediate, the second would sleep past the deadline.
+    assert len(sent) == 2
+    assert sent[0]["connect"] <= 2
+    assert sent[0]["read"] <= 2
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from unofficial_shipengine.exceptions import ShipEngineAPIError
+
+NOT_FOUND = {"request_id": "abc", "errors": [{"message": "Not found"}]}
+
+
+class FakeWarehousesAPI:
+    def __init__(self, warehouse):
+        self.record = warehouse
+        self.warehouses = {}
+        self.gets = []
+
+    def add(self, warehouse_id):
+        self.warehouses[warehouse_id] = {**self.record, "warehouse_id": warehouse_id}
+
+    def post(self, url, body):
+        warehouse_id = f"se-{len(self.warehouses)}"
+        self.add(warehouse_id)
+        return 200, self.warehouses[warehouse_id]
+
+    def get(self, url, params):
+        warehouse_id = url.rsplit("/", 1)[1]
+        self.gets.append(warehouse_id)
+        if warehouse_id not in self.warehouses:
+            return 404, NOT_FOUND
+        return 200, self.warehouses[warehouse_id]
+
+    def delete(self, url, params):
+        self.warehouses.pop(url.rsplit("/", 1)[1], None)
+        return 204, None
+
+
+@pytest.fixture
+def warehouses_api(recorded_response):
+    return FakeWarehousesAPI(
+        recorded_response("warehouses/vcr_cassettes/test_get_by_id_success.yaml", 1)
+    )
+
+
+def test_warehouse_cache_writes_through(warehouse_request, warehouses_api, api_client):
+    api = warehouses_api
+    client = api_client(api, warehouse_cache=True)
+
+    warehouse = client.warehouses.create_warehouse(warehouse_request)
+    assert client.warehouses.get_by_id(warehouse.warehouse_id) is warehouse
+    assert api.gets == []
+
+    assert (
+        client.warehouses.get_by_id(warehouse.warehouse_id, refresh=True) == warehouse
+    )
+    assert api.gets == ["se-0"]
+
+    client.warehouses.delete_warehouse(warehouse)
+    with pytest.raises(ShipEngineAPIError):
+        client.warehouses.get_by_id(warehouse.warehouse_id)
+
+
+def test_warehouse_deleted_during_get_is_not_cached(warehouses_api, api_client):
+    api = warehouses_api
+    api.add("se-7")
+    client = api_client(api, warehouse_cache=True)
+    get = api.get
+
+    def get_then_delete(url, params):
+        # The response was read before another caller deleted the warehouse.
+        response = get(url, params)
+        client.warehouses.delete_warehouse("se-7")
+        return response
+
+    api.get = get_then_delete
+    client.warehouses.get_by_id("se-7")
+    api.get = get
+
+    with pytest.raises(ShipEngineAPIError):
+        client.warehouses.get_by_id("se-7")
+    assert api.gets == ["se-7", "se-7"]
+
+
+def test_warehouse_cache_revalidates_after_ttl(warehouses_api, api_client, clock):
+    api = warehouses_api
+    api.add("se-7")
+    client = api_client(api, warehouse_cache=True, warehouse_cache_ttl=60.0)
+    client.warehouses._cache._clock = clock
+
+    client.warehouses.get_by_id("se-7")
+    client.warehouses.get_by_id("se-7")
+    clock.now = 60.0
+    client.warehouses.get_by_id("se-7")
+
+    assert api.gets == ["se-7", "se-7"]
+
+
+def test_async_warehouse_cache(warehouse_request, warehouses_api, async_api_client):
+    api = warehouses_api
+
+    async def run():
+        async with async_api_client(api, warehouse_cache=True) as client:
+            created = await client.warehouses.create_warehouse(warehouse_request)
+            cached = await client.warehouses.get_by_id(created.warehouse_id)
+            await client.warehouses.delete_warehouse(created.warehouse_id)
+            with pytest.raises(ShipEngineAPIError):
+                await client.warehouses.get_by_id(created.warehouse_id)
+            return created, cached
+
+    created, cached = asyncio.run(run())
+
+    assert cached is created
+    assert api.gets == ["se-0"]
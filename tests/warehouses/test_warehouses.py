@@ -1,6 +1,8 @@
+import asyncio
 from pathlib import Path
 
 import pytest
+import vcr
 
 from unofficial_shipengine.core.warehouses.models import Warehouse
 from unofficial_shipengine.exceptions import ShipEngineAPIError
@@ -54,3 +56,30 @@ def test_get_by_id_success(client, warehouse_request):
 def test_get_by_id_failure(client):
     with pytest.raises(ShipEngineAPIError):
         client.warehouses.get_by_id("bad-warehouse-id")
+
+
+def test_async_create_warehouse_success(async_client, warehouse_request):
+    async def create_warehouse() -> Warehouse:
+        async with async_client:
+            return await async_client.warehouses.create_warehouse(warehouse_request)
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_create_warehouse_success.yaml",
+        filter_headers=["API-Key"],
+    ):
+        warehouse = asyncio.run(create_warehouse())
+
+    assert isinstance(warehouse, Warehouse)
+
+
+def test_async_get_by_id_failure(async_client):
+    async def get_by_id() -> Warehouse:
+        async with async_client:
+            return await async_client.warehouses.get_by_id("bad-warehouse-id")
+
+    with vcr.use_cassette(
+        BASE_DIR / "vcr_cassettes" / "test_get_by_id_failure.yaml",
+        filter_headers=["API-Key"],
+    ):
+        with pytest.raises(ShipEngineAPIError):
+            asyncio.run(get_by_id())